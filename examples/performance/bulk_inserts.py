@@ -132,6 +132,42 @@ def test_core_insert(n):
         )
 
 
+@Profiler.profile
+def test_orm_bulk_load(n):
+    """Rows loaded via the ORM in "bulk", using the dialect's native bulk
+    loading facility where available"""
+    session = Session(bind=engine)
+    session.execute(
+        insert(Customer),
+        [
+            {
+                "name": "customer name %d" % i,
+                "description": "customer description %d" % i,
+            }
+            for i in range(n)
+        ],
+        execution_options={"bulk_load": True},
+    )
+    session.commit()
+
+
+@Profiler.profile
+def test_core_bulk_load(n):
+    """Rows loaded via Core using the dialect's native bulk loading
+    facility where available, e.g. COPY for PostgreSQL."""
+    with engine.begin() as conn:
+        conn.bulk_load(
+            Customer.__table__,
+            [
+                dict(
+                    name="customer name %d" % i,
+                    description="customer description %d" % i,
+                )
+                for i in range(n)
+            ],
+        )
+
+
 @Profiler.profile
 def test_dbapi_raw(n):
     """The DBAPI's API inserting rows in bulk."""
@@ -47,6 +47,8 @@ from .engine import URL as URL
 from .inspection import inspect as inspect
 from .pool import AssertionPool as AssertionPool
 from .pool import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+from .pool import ConcurrentQueuePool as ConcurrentQueuePool
+from .pool import MultiHostPool as MultiHostPool
 from .pool import NullPool as NullPool
 from .pool import Pool as Pool
 from .pool import PoolProxiedConnection as PoolProxiedConnection
@@ -199,7 +201,9 @@ from .sql.expression import select as select
 from .sql.expression import Selectable as Selectable
 from .sql.expression import SelectBase as SelectBase
 from .sql.expression import SQLColumnExpression as SQLColumnExpression
+from .sql.expression import statement_template as statement_template
 from .sql.expression import StatementLambdaElement as StatementLambdaElement
+from .sql.expression import StatementTemplate as StatementTemplate
 from .sql.expression import Subquery as Subquery
 from .sql.expression import table as table
 from .sql.expression import TableClause as TableClause
@@ -203,11 +203,11 @@ class PyODBCConnector(Connector):
 
         # as of #8177 for 2.0 we assume use_setinputsizes=True and only
         # omit the setinputsizes calls for .executemany() with
-        # fast_executemany=True
+        # fast_executemany=True, which includes the bulk_load execution
+        # option
 
-        if (
-            context.execute_style is interfaces.ExecuteStyle.EXECUTEMANY
-            and self.fast_executemany
+        if context.execute_style is interfaces.ExecuteStyle.EXECUTEMANY and (
+            self.fast_executemany or context._is_bulk_load
         ):
             return
 
@@ -325,6 +325,14 @@ Server dialect supports this parameter by passing the
    feature would cause ``fast_executemany`` to not be used in most cases
    even if specified.
 
+Fast executemany mode is also used for INSERT statements executed with the
+:paramref:`_engine.Connection.execution_options.bulk_load` execution option,
+or using :meth:`_engine.Connection.bulk_load`, without the need to set the
+``fast_executemany`` parameter for the engine as a whole.
+
+.. versionadded:: 2.1 fast executemany mode is used for the ``bulk_load``
+   execution option; see :ref:`engine_bulk_load`.
+
 .. seealso::
 
     `fast executemany <https://github.com/mkleehammer/pyodbc/wiki/Features-beyond-the-DB-API#fast_executemany>`_
@@ -559,6 +567,7 @@ class _JSONPathType_pyodbc(_MSJsonPathType):
 
 class MSDialect_pyodbc(PyODBCConnector, MSDialect):
     supports_statement_cache = True
+    supports_bulk_load = True
 
     scope_identity_must_be_embedded = True
 
@@ -675,6 +684,10 @@ class MSDialect_pyodbc(PyODBCConnector, MSDialect):
             cursor.fast_executemany = True
         super().do_executemany(cursor, statement, parameters, context=context)
 
+    def do_bulk_load(self, cursor, statement, parameters, context):
+        cursor.fast_executemany = True
+        cursor.executemany(statement, parameters)
+
     def is_disconnect(self, e, connection, cursor):
         if isinstance(e, self.dbapi.Error):
             code = e.args[0]
@@ -3176,6 +3176,7 @@ class MySQLDialect(_mariadb_shim.MariaDBShim, default.DefaultDialect):
         self._detect_sql_mode(connection)
         self._detect_ansiquotes(connection)  # depends on sql mode
         self._detect_casing(connection)
+        self._detect_max_allowed_packet(connection)
         if self._server_ansiquotes:
             # if ansiquotes == True, build a new IdentifierPreparer
             # with the new setting
@@ -3697,6 +3698,19 @@ class MySQLDialect(_mariadb_shim.MariaDBShim, default.DefaultDialect):
         self._casing = cs
         return cs
 
+    def _detect_max_allowed_packet(self, connection: Connection) -> None:
+        """Limit the size of "insertmanyvalues" batches based on the
+        max_allowed_packet server variable.
+
+        """
+        setting = self._fetch_setting(connection, "max_allowed_packet")
+        if setting is None:
+            self.insertmanyvalues_max_bytes = None
+        else:
+            # leave room for the inexactness of the size estimate, as well
+            # as for the protocol overhead
+            self.insertmanyvalues_max_bytes = int(setting) // 4 * 3
+
     def _detect_collations(self, connection: Connection) -> dict[str, str]:
         """Pull the active COLLATIONS list from the server.
 
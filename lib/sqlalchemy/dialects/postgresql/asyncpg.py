@@ -481,6 +481,8 @@ class PGExecutionContext_asyncpg(PGExecutionContext):
             self.dialect._invalidate_schema_cache()
 
     def pre_exec(self):
+        super().pre_exec()
+
         if self.isddl:
             self.dialect._invalidate_schema_cache()
 
@@ -652,12 +654,37 @@ class AsyncAdapt_asyncpg_cursor(AsyncAdapt_dbapi_cursor):
             except Exception as error:
                 self._handle_exception(error)
 
+    async def _copy_records_to_table(self, table_name, **kw):
+        adapt_connection = self._adapt_connection
+
+        self._description = None
+        async with adapt_connection._execute_mutex:
+            await adapt_connection._check_type_cache_invalidation(
+                self._invalidate_schema_cache_asof
+            )
+
+            if adapt_connection._transaction is None:
+                await adapt_connection._start_transaction()
+
+            try:
+                status = await self._connection.copy_records_to_table(
+                    table_name, **kw
+                )
+            except Exception as error:
+                self._handle_exception(error)
+
+            reg = re.match(r"COPY (\d+)", status or "")
+            self._rowcount = int(reg.group(1)) if reg else -1
+
     def execute(self, operation, parameters=None):
         await_(self._prepare_and_execute(operation, parameters))
 
     def executemany(self, operation, seq_of_parameters):
         return await_(self._executemany(operation, seq_of_parameters))
 
+    def copy_records_to_table(self, table_name, **kw):
+        await_(self._copy_records_to_table(table_name, **kw))
+
     def setinputsizes(self, *inputsizes):
         raise NotImplementedError()
 
@@ -1081,6 +1108,8 @@ class PGDialect_asyncpg(PGDialect):
 
     default_paramstyle = "numeric_dollar"
     supports_sane_multi_rowcount = False
+    supports_copy_from = True
+    supports_bulk_load = True
     execution_ctx_cls = PGExecutionContext_asyncpg
     statement_compiler = PGCompiler_asyncpg
     preparer = PGIdentifierPreparer_asyncpg
@@ -1200,6 +1229,14 @@ class PGDialect_asyncpg(PGDialect):
         util.coerce_kw_type(opts, "prepared_statement_cache_size", int)
         return ([], opts)
 
+    def do_copy_from(self, cursor, statement, copy_from, rows, context):
+        cursor.copy_records_to_table(
+            copy_from.table.name,
+            records=rows,
+            columns=copy_from.column_names,
+            schema_name=context.connection.schema_for_object(copy_from.table),
+        )
+
     def do_ping(self, dbapi_connection):
         dbapi_connection.ping()
         return True
@@ -849,6 +849,58 @@ constraint violation which occurs:
     {printsql}INSERT INTO my_table (id, data) VALUES (%(id)s, %(data)s)
     ON CONFLICT DO NOTHING
 
+.. _postgresql_copy_insert:
+
+Bulk INSERT using COPY
+----------------------
+
+For loading large numbers of rows, the PostgreSQL ``COPY`` command is
+considerably faster than ``INSERT``, including the batched
+``INSERT..VALUES`` statements used by :ref:`engine_insertmanyvalues`.  An
+:func:`_sql.insert` construct may make use of ``COPY .. FROM STDIN``
+when it's executed with a list of parameter dictionaries, by setting the
+``postgresql_copy`` option using :meth:`_sql.Insert.with_dialect_options`::
+
+    stmt = insert(my_table).with_dialect_options(postgresql_copy=True)
+
+    with engine.begin() as conn:
+        conn.execute(
+            stmt,
+            [{"id": i, "data": "row %d" % i} for i in range(1000000)],
+        )
+
+The values of each row, having been processed by the datatypes of each column
+in the same way as for an ``INSERT``, are streamed to the server using the
+``cursor.copy()`` method of psycopg, or the
+``Connection.copy_records_to_table()`` method of asyncpg.  Columns that are
+not present in the parameter dictionaries receive their server side defaults,
+and Python side column defaults are applied as for ``INSERT``.
+
+The same option may be used with an ORM-enabled :func:`_sql.insert` for
+:ref:`ORM bulk INSERT <orm_queryguide_bulk_insert>`, provided RETURNING is
+not used::
+
+    session.execute(
+        insert(User).with_dialect_options(postgresql_copy=True),
+        [{"name": "spongebob"}, {"name": "sandy"}, ...],
+    )
+
+``COPY`` can't return rows, so the option may not be combined with
+:meth:`_sql.Insert.returning`, nor with ``ON CONFLICT``, ``INSERT..SELECT``,
+or values that are SQL expressions; these raise :class:`.CompileError`.
+When the statement is executed with a single parameter dictionary, or with a
+driver that doesn't support ``COPY``, such as psycopg2 or pg8000, a plain
+``INSERT`` is used instead; this is also the case within
+:meth:`_engine.Connection.pipeline`, where ``COPY`` can't be used.
+
+``COPY`` is also used for an INSERT executed with the
+:paramref:`_engine.Connection.execution_options.bulk_load` execution
+option, or using :meth:`_engine.Connection.bulk_load`; in this case,
+statements which can't make use of ``COPY`` are executed as a plain
+``INSERT`` rather than raising.  See :ref:`engine_bulk_load`.
+
+.. versionadded:: 2.1
+
 .. _postgresql_match:
 
 Full Text Search
@@ -1879,6 +1931,7 @@ from typing import Any
 from typing import cast
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Tuple
 from typing import TYPE_CHECKING
@@ -2134,7 +2187,79 @@ ischema_names = {
 }
 
 
+class _PGCopyFrom(NamedTuple):
+    """represents a COPY FROM STDIN statement which loads the rows of an
+    INSERT executed with executemany(), when ``postgresql_copy`` or the
+    ``bulk_load`` execution option is used.
+
+    """
+
+    statement: str
+    table: schema.Table
+    column_names: List[str]
+
+
 class PGCompiler(compiler.SQLCompiler):
+    _postgresql_copy: Optional[_PGCopyFrom] = None
+
+    def visit_insert(self, insert_stmt, **kw):
+        toplevel = not self.stack and kw.get("visiting_cte") is None
+        text = super().visit_insert(insert_stmt, **kw)
+
+        # COPY applies only to executemany(); for a single set of
+        # parameters the plain INSERT is used
+        if (
+            toplevel
+            and self.for_executemany
+            and insert_stmt.dialect_options["postgresql"]["copy"]
+        ):
+            self._postgresql_copy = self._compile_copy_from(insert_stmt)
+        return text
+
+    def _compile_copy_from(self, insert_stmt):
+        if (
+            self.implicit_returning
+            or insert_stmt._returning
+            or insert_stmt._supplemental_returning
+        ):
+            raise exc.CompileError(
+                "postgresql_copy can't be used with an INSERT that "
+                "includes RETURNING"
+            )
+        elif (
+            insert_stmt.select is not None
+            or insert_stmt._multi_values
+            or insert_stmt._post_values_clause is not None
+            or self.ctes
+            or not self._insert_crud_params
+        ):
+            raise exc.CompileError(
+                "postgresql_copy can only be used with a plain INSERT that "
+                "receives its values from bound parameters; INSERT..SELECT, "
+                "multi-row VALUES, ON CONFLICT and CTEs aren't supported"
+            )
+
+        for col, _, _, accumulated_names in self._insert_crud_params:
+            names = list(accumulated_names)
+            if len(names) != 1 or not self.binds[names[0]]._is_crud:
+                raise exc.CompileError(
+                    "postgresql_copy can't be used with column %s, which "
+                    "receives a SQL expression rather than a bound value" % col
+                )
+
+        return self._bulk_load_copy_from
+
+    @util.memoized_property
+    def _bulk_load_copy_from(self):
+        bulk_load = self._bulk_load
+        assert bulk_load is not None
+
+        statement = "COPY %s (%s) FROM STDIN" % (
+            bulk_load.table_text,
+            ", ".join(bulk_load.column_exprs),
+        )
+        return _PGCopyFrom(statement, bulk_load.table, bulk_load.column_names)
+
     def visit_to_tsvector_func(self, element, **kw):
         return self._assert_pg_ts_ext(element, **kw)
 
@@ -2277,6 +2402,24 @@ class PGCompiler(compiler.SQLCompiler):
             self.process(element.order_by, **kw),
         )
 
+    def visit_in_op_binary(self, binary, operator, **kw):
+        if binary.modifiers.get("in_as_array") and isinstance(
+            binary.right, elements.BindParameter
+        ):
+            # render "col = ANY (%(param)s)" against a single array-valued
+            # parameter in place of an expanding IN, so that the statement
+            # is the same regardless of the number of values
+            bind = binary.right._clone(maintain_key=True)
+            bind.expanding = False
+            bind.type = _array.ARRAY(binary.left.type)
+            return "%s = ANY (%s)" % (
+                self.process(binary.left, **kw),
+                self.process(bind, **kw),
+            )
+        return self._generate_generic_binary(
+            binary, compiler.OPERATORS[operator], **kw
+        )
+
     def visit_match_op_binary(self, binary, operator, **kw):
         if "postgresql_regconfig" in binary.modifiers:
             regconfig = self.render_literal_value(
@@ -3504,6 +3647,32 @@ class PGInspector(reflection.Inspector):
 
 
 class PGExecutionContext(default.DefaultExecutionContext):
+    _postgresql_copy: Optional[_PGCopyFrom] = None
+
+    def pre_exec(self):
+        if (
+            self.isinsert
+            and self.executemany
+            and self.dialect.supports_copy_from
+            and self.root_connection._pipeline is None
+        ):
+            compiled = cast(PGCompiler, self.compiled)
+            if compiled._postgresql_copy is not None:
+                self._setup_copy_from(compiled._postgresql_copy)
+            elif self._is_bulk_load:
+                self._setup_copy_from(compiled._bulk_load_copy_from)
+
+    def _setup_copy_from(self, copy_from):
+        # rows are loaded by Dialect.do_bulk_load() using COPY, rather
+        # than by executemany() or insertmanyvalues batches
+        self._postgresql_copy = copy_from
+        self._is_bulk_load = True
+        self.execute_style = interfaces.ExecuteStyle.EXECUTEMANY
+
+        self.statement = self.unicode_statement = self._apply_schema_translate(
+            copy_from.statement
+        )
+
     def fire_sequence(self, seq, type_):
         return self._execute_scalar(
             (
@@ -3624,6 +3793,7 @@ class PGDialect(default._BackendsMultiReflection, default.DefaultDialect):
 
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_in_array_parameter = True
 
     supports_identity_columns = True
 
@@ -3644,6 +3814,12 @@ class PGDialect(default._BackendsMultiReflection, default.DefaultDialect):
     update_returning_multifrom = True
     delete_returning_multifrom = True
 
+    supports_copy_from = False
+    """driver supports loading the rows of an executemany() INSERT with
+    COPY FROM STDIN, when the ``postgresql_copy`` option or the
+    ``bulk_load`` execution option is used; see
+    :meth:`.PGDialect.do_copy_from`."""
+
     connection_characteristics = (
         default.DefaultDialect.connection_characteristics
     )
@@ -3710,6 +3886,7 @@ class PGDialect(default._BackendsMultiReflection, default.DefaultDialect):
                 "with": None,
             },
         ),
+        (sql.Insert, {"copy": False}),
     ]
 
     reflection_options = ("postgresql_ignore_search_path",)
@@ -3875,6 +4052,24 @@ class PGDialect(default._BackendsMultiReflection, default.DefaultDialect):
 
         return hosts, ports  # type: ignore
 
+    def do_bulk_load(self, cursor, statement, parameters, context):
+        self.do_copy_from(
+            cursor,
+            statement,
+            context._postgresql_copy,
+            context._bulk_load_rows(parameters),
+            context,
+        )
+
+    def do_copy_from(self, cursor, statement, copy_from, rows, context):
+        """Load the given rows, each a tuple of values in the order of the
+        columns named by the COPY FROM STDIN ``statement``.
+
+        Implemented by drivers which set ``supports_copy_from``.
+
+        """
+        raise NotImplementedError()
+
     def do_begin_twophase(self, connection, xid):
         self.do_begin(connection.connection)
 
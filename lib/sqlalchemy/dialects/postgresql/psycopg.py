@@ -167,11 +167,42 @@ specified::
 
     `Client-side-binding cursors <https://www.psycopg.org/psycopg3/docs/advanced/cursors.html#client-side-binding-cursors>`_
 
+.. _psycopg_pipeline:
+
+Pipeline Mode
+-------------
+
+The psycopg dialect supports the :meth:`_engine.Connection.pipeline`
+context manager, which runs the DBAPI connection in psycopg's
+`pipeline mode <https://www.psycopg.org/psycopg3/docs/advanced/pipeline.html>`_
+so that INSERT, UPDATE and DELETE statements are sent to the server
+without waiting for the result of each one::
+
+    with engine.begin() as conn:
+        with conn.pipeline():
+            for id_, value in data:
+                conn.execute(
+                    table.update().where(table.c.id == id_),
+                    {"value": value},
+                )
+
+Pipeline mode requires psycopg 3.1 or greater, built against libpq 14 or
+greater; when it's not available, :meth:`_engine.Connection.pipeline` has
+no effect.  Pipeline mode is supported by both the sync and the asyncio
+versions of the dialect.
+
+.. versionadded:: 2.1
+
+.. seealso::
+
+    :ref:`session_pipeline_flush` - pipelining the ORM unit of work
+
 """  # noqa
 
 from __future__ import annotations
 
 import collections
+import contextlib
 import logging
 from types import NoneType
 from typing import cast
@@ -373,6 +404,8 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
     supports_server_side_cursors = True
     default_paramstyle = "pyformat"
     supports_sane_multi_rowcount = True
+    supports_copy_from = True
+    supports_bulk_load = True
 
     supports_native_json_serialization = True
     supports_native_json_deserialization = True
@@ -451,6 +484,12 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
 
                 set_json_dumps(self._json_serializer, adapters_map)
 
+            # pipeline mode is new in psycopg 3.1 and requires libpq 14
+            pipeline_cls = getattr(self.dbapi, "Pipeline", None)
+            self.supports_pipeline = bool(
+                pipeline_cls is not None and pipeline_cls.is_supported()
+            )
+
     def create_connect_args(self, url):
         # see https://github.com/psycopg/psycopg/issues/83
         cargs, cparams = super().create_connect_args(url)
@@ -593,6 +632,17 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
 
         return on_connect
 
+    def do_copy_from(self, cursor, statement, copy_from, rows, context):
+        with cursor.copy(statement) as copy:
+            for row in rows:
+                copy.write_row(row)
+
+    def do_pipeline(self, dbapi_connection):
+        return dbapi_connection.dbapi_connection.pipeline()
+
+    def do_pipeline_sync(self, pipeline):
+        pipeline.sync()
+
     def is_disconnect(self, e, connection, cursor):
         if isinstance(e, self.dbapi.Error) and connection is not None:
             if connection.closed or connection.broken:
@@ -629,6 +679,16 @@ class AsyncAdapt_psycopg_cursor(AsyncAdapt_dbapi_cursor):
         else:
             result = await self._cursor.execute(operation, parameters)
 
+        pipeline = self._adapt_connection._pipeline
+        if pipeline is not None and not self.server_side:
+            # results aren't available until the pipeline is synced;
+            # rows are pulled at that point
+            pipeline._cursors.append(self)
+        else:
+            await self._fetch_rows()
+        return result
+
+    async def _fetch_rows(self):
         # sqlalchemy result is not async, so need to pull all rows here
         # (assuming not a server side cursor)
         res = self._cursor.pgresult
@@ -641,7 +701,6 @@ class AsyncAdapt_psycopg_cursor(AsyncAdapt_dbapi_cursor):
             and res.status == self._adapt_connection.dbapi.ExecStatus.TUPLES_OK
         ):
             self._rows = collections.deque(await self._cursor.fetchall())
-        return result
 
     async def _executemany_async(
         self,
@@ -651,6 +710,14 @@ class AsyncAdapt_psycopg_cursor(AsyncAdapt_dbapi_cursor):
         # override to not use mutex, psycopg3 already has mutex
         return await self._cursor.executemany(operation, seq_of_parameters)
 
+    def copy_rows(self, statement, rows):
+        await_(self._copy_rows_async(statement, rows))
+
+    async def _copy_rows_async(self, statement, rows):
+        async with self._cursor.copy(statement) as copy:
+            for row in rows:
+                await copy.write_row(row)
+
 
 class AsyncAdapt_psycopg_ss_cursor(
     AsyncAdapt_dbapi_ss_cursor, AsyncAdapt_psycopg_cursor
@@ -667,13 +734,53 @@ class AsyncAdapt_psycopg_ss_cursor(
         return connection.cursor(self.name)
 
 
+class AsyncAdapt_psycopg_pipeline:
+    __slots__ = ("_pipeline", "_cursors")
+
+    def __init__(self, pipeline):
+        self._pipeline = pipeline
+        self._cursors = []
+
+    def sync(self):
+        await_(self._sync())
+
+    async def _sync(self):
+        await self._pipeline.sync()
+        cursors, self._cursors = self._cursors, []
+        for cursor in cursors:
+            await cursor._fetch_rows()
+
+
 class AsyncAdapt_psycopg_connection(AsyncAdapt_dbapi_connection):
     _connection: AsyncConnection
-    __slots__ = ()
+    __slots__ = ("_pipeline",)
 
     _cursor_cls = AsyncAdapt_psycopg_cursor
     _ss_cursor_cls = AsyncAdapt_psycopg_ss_cursor
 
+    def __init__(self, dbapi, connection):
+        super().__init__(dbapi, connection)
+        self._pipeline = None
+
+    @contextlib.contextmanager
+    def pipeline(self):
+        ctx = self._connection.pipeline()
+        self._pipeline = pipeline = AsyncAdapt_psycopg_pipeline(
+            await_(ctx.__aenter__())
+        )
+        try:
+            yield pipeline
+            # results of statements emitted since the last sync are
+            # received when the pipeline exits; pull their rows first
+            await_(pipeline._sync())
+        except BaseException as err:
+            self._pipeline = None
+            if not await_(ctx.__aexit__(type(err), err, err.__traceback__)):
+                raise
+        else:
+            self._pipeline = None
+            await_(ctx.__aexit__(None, None, None))
+
     def add_notice_handler(self, handler):
         self._connection.add_notice_handler(handler)
 
@@ -786,6 +893,9 @@ class PGDialectAsync_psycopg(PGDialect_psycopg):
     def _do_autocommit(self, connection, value):
         connection.set_autocommit(value)
 
+    def do_copy_from(self, cursor, statement, copy_from, rows, context):
+        cursor.copy_rows(statement, rows)
+
     def set_readonly(self, connection, value):
         connection.set_read_only(value)
 
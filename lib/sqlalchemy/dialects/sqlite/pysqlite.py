@@ -563,10 +563,12 @@ from ... import util
 from ...util.typing import Self
 
 if TYPE_CHECKING:
+    from ...engine.interfaces import _DBAPIMultiExecuteParams
     from ...engine.interfaces import ConnectArgsType
     from ...engine.interfaces import DBAPIConnection
     from ...engine.interfaces import DBAPICursor
     from ...engine.interfaces import DBAPIModule
+    from ...engine.interfaces import ExecutionContext
     from ...engine.interfaces import IsolationLevel
     from ...engine.interfaces import ServerVersionInfoType
     from ...engine.url import URL
@@ -615,6 +617,7 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
     default_paramstyle = "qmark"
     supports_statement_cache = True
     returns_native_bytes = True
+    supports_bulk_load = True
 
     colspecs = util.update_copy(
         SQLiteDialect.colspecs,
@@ -711,6 +714,33 @@ class SQLiteDialect_pysqlite(SQLiteDialect):
     def detect_autocommit_setting(self, dbapi_conn: DBAPIConnection) -> bool:
         return dbapi_conn.isolation_level is None
 
+    def do_bulk_load(
+        self,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: _DBAPIMultiExecuteParams,
+        context: ExecutionContext,
+    ) -> None:
+        dbapi_connection = context.root_connection.connection
+        if not self.detect_autocommit_setting(dbapi_connection):
+            cursor.executemany(statement, parameters)
+            return
+
+        # in autocommit mode, each row would otherwise be committed
+        # separately; load them within a single transaction instead
+        tx_cursor = dbapi_connection.cursor()
+        try:
+            tx_cursor.execute("BEGIN")
+            try:
+                cursor.executemany(statement, parameters)
+            except BaseException:
+                tx_cursor.execute("ROLLBACK")
+                raise
+            else:
+                tx_cursor.execute("COMMIT")
+        finally:
+            tx_cursor.close()
+
     def on_connect(self) -> Callable[[DBAPIConnection], None]:
         def regexp(a: str, b: Optional[str]) -> Optional[bool]:
             if b is None:
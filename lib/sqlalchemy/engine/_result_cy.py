@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
 
+from .processors import to_batch_processor
 from .row import Row
 from .row import RowMapping
 from .. import exc
@@ -30,6 +31,8 @@ from ..util.typing import TupleAny
 from ..util.typing import Unpack
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from .result import _ProcessorsType
     from .result import Result
     from .result import ResultMetaData
@@ -76,6 +79,15 @@ across all the result types
 _UniqueFilterType = Callable[[Any], Any]
 _UniqueFilterStateType = tuple[set[Any], _UniqueFilterType | None]
 
+# number of rows in each of the chunks submitted to the
+# result_processing_executor
+_EXECUTOR_CHUNK_SIZE = cython.declare(cython.Py_ssize_t, 1000)
+
+# processors are applied column-wise to a chunk of rows only when at
+# least one in this many columns has a processor; otherwise the cost of
+# transposing the rows exceeds the savings of the batch processors
+_COLUMNWISE_PROCESSOR_RATIO = cython.declare(cython.Py_ssize_t, 6)
+
 _FLAG_SIMPLE = cython.declare(cython.char, 0)
 _FLAG_SCALAR_TO_TUPLE = cython.declare(cython.char, 1)
 _FLAG_TUPLE_FILTER = cython.declare(cython.char, 2)
@@ -105,6 +117,8 @@ class BaseResultInternal(Generic[_R]):
 
     _source_supports_scalars: bool
     _yield_per: int | None
+    _lazy_row_processing: bool = False
+    _processing_executor: Executor | None = None
 
     def _fetchiter_impl(
         self,
@@ -245,6 +259,122 @@ class BaseResultInternal(Generic[_R]):
                 row = log_row(row)
             return row
 
+        if proc_size != 0 and flag != _FLAG_SCALAR_TO_TUPLE:
+            if len(proc_valid) * _COLUMNWISE_PROCESSOR_RATIO >= proc_size:
+                # when a chunk of rows is present, apply processors to
+                # each column as a whole using the batch variants, rather
+                # than invoking each processor once per row
+                batch_processors: tuple = tuple(
+                    [
+                        to_batch_processor(p) if p is not None else None
+                        for p in processors
+                    ]
+                )
+
+                def processed_rows_serial(rows: Sequence[Any], /) -> list[Any]:
+                    nonlocal first_row
+
+                    if not rows:
+                        return []
+                    if flag == _FLAG_TUPLE_FILTER:
+                        rows = [tuple_filters(row) for row in rows]
+                    if first_row:
+                        first_row = False
+                        assert len(rows[0]) == proc_size
+
+                    columns: list = list(zip(*rows))
+                    for i in proc_valid:
+                        columns[i] = batch_processors[i](columns[i])
+                    return list(zip(*columns))
+
+            else:
+
+                def processed_rows_serial(rows: Sequence[Any], /) -> list[Any]:
+                    nonlocal first_row
+
+                    if not rows:
+                        return []
+                    if flag == _FLAG_TUPLE_FILTER:
+                        rows = [tuple_filters(row) for row in rows]
+                    if first_row:
+                        first_row = False
+                        assert len(rows[0]) == proc_size
+
+                    return [
+                        _apply_processors(
+                            processors, proc_size, proc_valid, row
+                        )
+                        for row in rows
+                    ]
+
+            executor = real_result._processing_executor
+            if executor is not None:
+
+                def processed_rows_parallel(
+                    rows: Sequence[Any], /
+                ) -> list[Any]:
+                    size: cython.Py_ssize_t = len(rows)
+                    if size <= _EXECUTOR_CHUNK_SIZE:
+                        return processed_rows_serial(rows)
+
+                    # executor.map() delivers the processed chunks in
+                    # the order they were submitted
+                    result: list = []
+                    for chunk in executor.map(
+                        processed_rows_serial,
+                        [
+                            rows[i : i + _EXECUTOR_CHUNK_SIZE]
+                            for i in range(0, size, _EXECUTOR_CHUNK_SIZE)
+                        ],
+                    ):
+                        result.extend(chunk)
+                    return result
+
+                processed_rows = processed_rows_parallel
+            else:
+                processed_rows = processed_rows_serial
+
+            def many_rows_batch(rows: Sequence[Any], /) -> list[Any]:
+                result: list[Any] = [
+                    _Row(metadata, None, key_to_index, row)
+                    for row in processed_rows(rows)
+                ]
+                if has_log_row:
+                    result = [log_row(row) for row in result]
+                return result
+
+            if real_result._lazy_row_processing:
+                # rows store the unprocessed values and apply processors
+                # upon first access of each column
+                def single_row_lazy(input_row: Sequence[Any], /) -> Row:
+                    nonlocal first_row
+
+                    if flag == _FLAG_TUPLE_FILTER:
+                        input_row = tuple_filters(input_row)
+                    if first_row:
+                        first_row = False
+                        assert len(input_row) == proc_size
+
+                    row: Row = _Row(
+                        metadata, processors, key_to_index, input_row, True
+                    )
+                    if has_log_row:
+                        row = log_row(row)
+                    return row
+
+                def many_rows_lazy(rows: Sequence[Any], /) -> list[Any]:
+                    return [single_row_lazy(row) for row in rows]
+
+                if has_log_row:
+                    return single_row_lazy, many_rows_lazy, many_rows_lazy  # type: ignore[return-value] # noqa: E501
+                else:
+                    return single_row_lazy, many_rows_lazy, processed_rows  # type: ignore[return-value] # noqa: E501
+            elif has_log_row:
+                # row logging requires the Row objects themselves
+                return single_row, many_rows_batch, many_rows_batch  # type: ignore[return-value] # noqa: E501
+            else:
+                return single_row, many_rows_batch, processed_rows  # type: ignore[return-value] # noqa: E501
+
         if cython.compiled:
 
             def many_rows(rows: Sequence[Any], /) -> list[Any]:
@@ -269,12 +399,10 @@ class BaseResultInternal(Generic[_R]):
         else:
 
             def single_interim_row(input_row: Sequence[Any], /) -> Any:
+                # processors are not present here, as they are handled
+                # by processed_rows() above
                 if flag == _FLAG_TUPLE_FILTER:
                     input_row = tuple_filters(input_row)
-                if proc_size != 0:
-                    input_row = _apply_processors(
-                        processors, proc_size, proc_valid, input_row
-                    )
                 elif type(input_row) is not tuple:
                     input_row = tuple(input_row)
                 return input_row
@@ -44,9 +44,51 @@ def _is_compiled() -> bool:
 # END GENERATED CYTHON IMPORT
 
 
+class _Unprocessed:
+    """Marks a column value not yet processed in a lazy row."""
+
+
+_UNPROCESSED = _Unprocessed()
+
+
+@cython.cclass
+class _LazyValues:
+    """Holds the result processors of a row created in "lazy" mode along
+    with the processed values, which are produced on first access of each
+    column.
+
+    """
+
+    __slots__ = ("processors", "values")
+
+    if cython.compiled:
+        processors: Tuple[Any, ...]
+        values: List[Any]
+
+    def __init__(self, processors: Sequence[Any], size: int):
+        self.processors = tuple(processors)
+        self.values = [_UNPROCESSED] * size
+
+    @cython.ccall
+    def get(self, data: Tuple[Any, ...], index: Any) -> object:
+        value = self.values[index]
+        if value is _UNPROCESSED:
+            p = self.processors[index]
+            value = p(data[index]) if p is not None else data[index]
+            self.values[index] = value
+        return value
+
+    @cython.ccall
+    def all(self, data: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        i: cython.Py_ssize_t
+        for i in range(len(data)):
+            self.get(data, i)
+        return tuple(self.values)
+
+
 @cython.cclass
 class BaseRow:
-    __slots__ = ("_parent", "_data", "_key_to_index")
+    __slots__ = ("_parent", "_data", "_key_to_index", "_lazy")
 
     if cython.compiled:
         _parent: ResultMetaData = cython.declare(object, visibility="readonly")
@@ -54,6 +96,9 @@ class BaseRow:
             dict, visibility="readonly"
         )
         _data: Tuple[Any, ...] = cython.declare(tuple, visibility="readonly")
+        _lazy: Optional[_LazyValues] = cython.declare(
+            _LazyValues, visibility="readonly"
+        )
 
     def __init__(
         self,
@@ -61,17 +106,28 @@ class BaseRow:
         processors: Optional[_ProcessorsType],
         key_to_index: Dict[_KeyType, int],
         data: Sequence[Any],
+        lazy: cython.bint = False,
     ) -> None:
         """Row objects are constructed by CursorResult objects."""
-        self._set_attrs(
-            parent,
-            key_to_index,
-            (
-                _apply_processors(processors, data)
-                if processors is not None
-                else data if isinstance(data, tuple) else tuple(data)
-            ),
-        )
+        if lazy and processors is not None:
+            data = data if isinstance(data, tuple) else tuple(data)
+            self._set_attrs(
+                parent,
+                key_to_index,
+                data,
+                _LazyValues(processors, len(data)),
+            )
+        else:
+            self._set_attrs(
+                parent,
+                key_to_index,
+                (
+                    _apply_processors(processors, data)
+                    if processors is not None
+                    else data if isinstance(data, tuple) else tuple(data)
+                ),
+                None,
+            )
 
     @cython.cfunc
     @cython.inline
@@ -80,17 +136,41 @@ class BaseRow:
         parent: ResultMetaData,
         key_to_index: Dict[_KeyType, int],
         data: Tuple[Any, ...],
+        lazy: Optional[_LazyValues],
     ):
         if cython.compiled:
             # cython does not use __setattr__
             self._parent = parent
             self._key_to_index = key_to_index
             self._data = data
+            self._lazy = lazy
         else:
             # python does, so use object.__setattr__
             object.__setattr__(self, "_parent", parent)
             object.__setattr__(self, "_key_to_index", key_to_index)
             object.__setattr__(self, "_data", data)
+            object.__setattr__(self, "_lazy", lazy)
+
+    @cython.cfunc
+    def _process_lazy(self) -> None:
+        # process all remaining columns, after which this row
+        # behaves the same as a non-lazy one
+        assert self._lazy is not None
+        self._set_attrs(
+            self._parent,
+            self._key_to_index,
+            self._lazy.all(self._data),
+            None,
+        )
+
+    def _with_class(self, cls: Type[BaseRow]) -> BaseRow:
+        """Return a new row of the given class against the same data,
+        sharing lazily processed values with this one."""
+        obj: BaseRow = cls.__new__(cls)
+        obj._set_attrs(
+            self._parent, self._key_to_index, self._data, self._lazy
+        )
+        return obj
 
     def __reduce__(self) -> Tuple[Any, Any]:
         return (
@@ -99,27 +179,40 @@ class BaseRow:
         )
 
     def __getstate__(self) -> Dict[str, Any]:
+        if self._lazy is not None:
+            self._process_lazy()
         return {"_parent": self._parent, "_data": self._data}
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         parent = state["_parent"]
-        self._set_attrs(parent, parent._key_to_index, state["_data"])
+        self._set_attrs(parent, parent._key_to_index, state["_data"], None)
 
     def _values_impl(self) -> List[Any]:
+        if self._lazy is not None:
+            self._process_lazy()
         return list(self._data)
 
     def __iter__(self) -> Iterator[Any]:
+        if self._lazy is not None:
+            self._process_lazy()
         return iter(self._data)
 
     def __len__(self) -> int:
         return len(self._data)
 
     def __hash__(self) -> int:
+        if self._lazy is not None:
+            self._process_lazy()
         return hash(self._data)
 
     if not TYPE_CHECKING:
 
         def __getitem__(self, key: Any) -> Any:
+            lazy = self._lazy
+            if lazy is not None:
+                if not isinstance(key, slice):
+                    return lazy.get(self._data, key)
+                self._process_lazy()
             return self._data[key]
 
     def _get_by_key_impl_mapping(self, key: _KeyType) -> Any:
@@ -132,6 +225,9 @@ class BaseRow:
         # do a type check
         index = self._key_to_index.get(key)
         if index is not None:
+            lazy = self._lazy
+            if lazy is not None:
+                return lazy.get(self._data, index)
             return self._data[index]
         self._parent._key_not_found(key, attr_err)
 
@@ -148,6 +244,9 @@ class BaseRow:
                 # take precedence over column names.
                 index = self._key_to_index.get(name)
                 if index is not None and not hasattr(type(self), name):
+                    lazy = self._lazy
+                    if lazy is not None:
+                        return lazy.get(self._data, index)
                     return self._data[index]
 
             return object.__getattribute__(self, name)
@@ -163,9 +262,13 @@ class BaseRow:
         raise AttributeError("can't delete attribute")
 
     def _to_tuple_instance(self) -> Tuple[Any, ...]:
+        if self._lazy is not None:
+            self._process_lazy()
         return self._data
 
     def __contains__(self, key: Any) -> cython.bint:
+        if self._lazy is not None:
+            self._process_lazy()
         return key in self._data
 
 
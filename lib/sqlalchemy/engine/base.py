@@ -8,12 +8,16 @@
 
 from __future__ import annotations
 
+import bisect
 import contextlib
+import operator
 import sys
+from time import perf_counter
 import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Dict
 from typing import Iterable
 from typing import Iterator
 from typing import List
@@ -27,6 +31,7 @@ from typing import TypeVar
 from typing import Union
 
 from .interfaces import BindTyping
+from .interfaces import CacheStats
 from .interfaces import ConnectionEventsTarget
 from .interfaces import DBAPICursor
 from .interfaces import ExceptionContext
@@ -48,8 +53,11 @@ from ..util.typing import TypeVarTuple
 from ..util.typing import Unpack
 
 if typing.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from . import CursorResult
     from . import ScalarResult
+    from .default import DefaultExecutionContext
     from .interfaces import _AnyExecuteParams
     from .interfaces import _AnyMultiExecuteParams
     from .interfaces import _CoreAnyExecuteParams
@@ -78,11 +86,20 @@ if typing.TYPE_CHECKING:
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
     from ..sql.schema import SchemaVisitable
+    from ..sql.selectable import TableClause
     from ..sql.selectable import TypedReturnsRows
 
 
 _T = TypeVar("_T", bound=Any)
 _Ts = TypeVarTuple("_Ts")
+
+_CacheWarmupStatement = Union[
+    "Executable", Tuple["Executable", "_CoreAnyExecuteParams"]
+]
+_CacheWarmupParameter = Union[
+    Iterable[_CacheWarmupStatement],
+    Callable[[], Iterable[_CacheWarmupStatement]],
+]
 _EMPTY_EXECUTION_OPTS: _ExecuteOptions = util.EMPTY_DICT
 NO_OPTIONS: Mapping[str, Any] = util.EMPTY_DICT
 
@@ -132,6 +149,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     _transaction: Optional[RootTransaction]
     _nested_transaction: Optional[NestedTransaction]
 
+    _pipeline: Optional[Any] = None
+    _pipeline_pending: List[DefaultExecutionContext]
+
     def __init__(
         self,
         engine: Engine,
@@ -249,9 +269,13 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         max_row_buffer: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_latency: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         preserve_rowcount: bool = False,
+        bulk_load: bool = False,
         driver_column_names: bool = False,
+        lazy_row_processing: bool = False,
+        result_processing_executor: Executor = ...,
         **opt: Any,
     ) -> Connection: ...
 
@@ -477,6 +501,25 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
                 :ref:`engine_insertmanyvalues`
 
+        :param insertmanyvalues_target_latency: Available on:
+            :class:`_engine.Connection`, :class:`_engine.Engine`. Number of
+            seconds, e.g. ``0.1``, that each batch of an "insertmanyvalues"
+            INSERT should take to execute.  When set, the number of rows
+            in each batch starts at the
+            :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
+            and is then tuned after each batch based on the time the batch
+            took, limited only by the dialect's limits on the number of
+            bound parameters and size of a statement.  May also be set on a
+            per-engine basis using the
+            :paramref:`_sa.create_engine.insertmanyvalues_target_latency`
+            parameter.
+
+            .. versionadded:: 2.1
+
+            .. seealso::
+
+                :ref:`engine_insertmanyvalues_page_size`
+
         :param schema_translate_map: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -503,6 +546,22 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
           .. versionadded:: 2.0.28
 
+        :param bulk_load: Boolean; when True, an :func:`_sql.insert`
+          construct executed with a list of parameter dictionaries loads the
+          rows using the dialect's native bulk loading facility, such as
+          ``COPY`` for PostgreSQL, rather than ``cursor.executemany()`` or
+          :ref:`insertmanyvalues <engine_insertmanyvalues>` batches.  Only
+          plain INSERT statements are affected, i.e. those which don't
+          use RETURNING and whose values are all bound parameters; other
+          statements, and dialects without such a facility, execute in the
+          usual way.  See :meth:`_engine.Connection.bulk_load`.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`engine_bulk_load`
+
         .. seealso::
 
             :meth:`_engine.Engine.execution_options`
@@ -526,6 +585,69 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
          .. versionadded:: 2.1
 
+        :param lazy_row_processing: When True, :class:`_engine.Row` objects
+         returned by the :class:`_engine.CursorResult` store the raw values
+         received from the DBAPI, and apply result processors, such as those
+         which convert strings to dates or deserialize JSON, to each column
+         only when that column is first accessed, memoizing the result.  This
+         reduces CPU use when reading a small number of columns from rows of
+         a wide table where many columns have result processors.  Accessing
+         the row as a whole, e.g. iterating it, comparing it or
+         using it as a tuple, processes all remaining columns.  Rows
+         produced for ORM results are not affected.
+
+         .. versionadded:: 2.1
+
+        :param result_processing_executor: A
+         :class:`concurrent.futures.Executor`, typically a
+         :class:`concurrent.futures.ThreadPoolExecutor`, which will be used to
+         apply result processors to large groups of fetched rows in parallel,
+         such as when :meth:`_engine.Result.all` is called or when rows are
+         fully buffered.  The rows are split into chunks which are processed
+         by the executor, and are delivered in their original order.  This
+         is of benefit for costly processors that release the GIL, or on
+         free-threaded Python builds.  A
+         :class:`concurrent.futures.ProcessPoolExecutor` is not supported,
+         as result processors generally can't be pickled, and raises
+         :class:`.ArgumentError` when the statement is executed.
+
+         .. versionadded:: 2.1
+
+        :param checkout_priority: Available on: :class:`_engine.Engine`.
+
+          An integer priority used when a :class:`_engine.Connection` from
+          this :class:`_engine.Engine` must wait for a connection to be
+          returned to a pool configured with
+          :paramref:`.QueuePool.fair_waiters`.  Waiting checkouts with a
+          higher priority are served first.  As this option takes effect
+          when the connection is procured from the pool, it's set using
+          :meth:`_engine.Engine.execution_options`, and has no effect when
+          set on an existing :class:`_engine.Connection`.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`pool_fair_waiters`
+
+        :param readonly: Available on: :class:`_engine.Engine`.
+
+          When True, indicates that connections from this
+          :class:`_engine.Engine` are used only for reading, so that a
+          :class:`.MultiHostPool`, as set up using
+          :paramref:`_sa.create_engine.replica_urls`, checks them out from a
+          read replica rather than from the primary host.  As with
+          ``checkout_priority``, this option takes effect when the
+          connection is procured from the pool, so it's set using
+          :meth:`_engine.Engine.execution_options`.  The option doesn't
+          itself make the transaction read-only on the database side.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`pool_multi_host`
+
         """  # noqa
         if self._has_events or self.engine._has_events:
             self.dispatch.set_connection_execution_options(self, opt)
@@ -801,6 +923,72 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             )
         pool_proxied_connection.detach()
 
+    @contextlib.contextmanager
+    def pipeline(self) -> Iterator[Connection]:
+        """Return a context manager within which statements are sent to the
+        database without waiting for the result of each one.
+
+        E.g.::
+
+            with engine.begin() as conn:
+                with conn.pipeline():
+                    conn.execute(table.update().values(x=5).where(...))
+                    conn.execute(table.delete().where(...))
+                    conn.execute(other_table.insert(), [{...}, {...}])
+
+        Within the block, INSERT, UPDATE and DELETE statements which don't
+        make use of RETURNING are queued by the driver, so that a series
+        of such statements costs a single round trip to the database
+        rather than one per statement, which is significant when the
+        database is at a distance.  The results of queued statements are
+        received as soon as a statement which returns rows is executed, when
+        :attr:`_engine.CursorResult.rowcount` of a queued statement is
+        accessed, or when the block ends.  An error raised by a queued
+        statement is therefore raised at one of these points, rather than
+        by the call to :meth:`_engine.Connection.execute` which sent it.
+
+        Pipelining is currently supported by the ``psycopg`` dialect, for
+        both its sync and asyncio forms, when the installed ``psycopg`` and
+        ``libpq`` support it; for dialects that don't support pipelining, as
+        indicated by :attr:`.Dialect.supports_pipeline`, or when the
+        :class:`_engine.Connection` is already within a pipeline, the block
+        executes statements normally.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`session_pipeline_flush`
+
+        """
+        if self._pipeline is not None or not self.dialect.supports_pipeline:
+            yield self
+            return
+
+        self._pipeline_pending = []
+        with self.dialect.do_pipeline(self.connection) as pipeline:
+            self._pipeline = pipeline
+            try:
+                yield self
+                self._pipeline_sync()
+            finally:
+                self._pipeline = None
+                pending, self._pipeline_pending = self._pipeline_pending, []
+                for context in pending:
+                    context._pipeline_received()
+
+    def _pipeline_sync(self) -> None:
+        """Receive the results of all statements sent within the current
+        pipeline."""
+        pending, self._pipeline_pending = self._pipeline_pending, []
+        try:
+            self.dialect.do_pipeline_sync(self._pipeline)
+        except BaseException as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+        finally:
+            for context in pending:
+                context._pipeline_received()
+
     def _autobegin(self) -> None:
         if self._allow_autobegin and not self.__in_begin:
             self.begin()
@@ -1655,6 +1843,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             "compiled_cache", self.engine._compiled_cache
         )
 
+        cache_stats = self.engine.compiled_cache_stats
+        if cache_stats is not None:
+            start = perf_counter()
+
         compiled_sql, extracted_params, param_dict, cache_hit = (
             elem._compile_w_cache(
                 dialect=dialect,
@@ -1665,6 +1857,11 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
             )
         )
+
+        if cache_stats is not None:
+            cache_stats._record(
+                cache_hit, compiled_sql, perf_counter() - start
+            )
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
@@ -1764,6 +1961,54 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         return ret
 
+    def bulk_load(
+        self,
+        table: TableClause,
+        parameters: _CoreMultiExecuteParams,
+        *,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+    ) -> CursorResult[Unpack[TupleAny]]:
+        r"""INSERT a list of rows into a table using the dialect's native
+        bulk loading facility, where available.
+
+        E.g.::
+
+            with engine.begin() as conn:
+                conn.bulk_load(
+                    my_table,
+                    [{"id": i, "data": "row %d" % i} for i in range(100000)],
+                )
+
+        This is equivalent to executing :func:`_sql.insert` with the given
+        list of parameter dictionaries, using the
+        :paramref:`_engine.Connection.execution_options.bulk_load` execution
+        option.  Depending on the dialect, the rows are loaded using
+        ``COPY``, ``LOAD DATA LOCAL INFILE``, or an optimized form of
+        ``cursor.executemany()``; see :ref:`engine_bulk_load` for details.
+        Dialects without such a facility execute the INSERT in the usual
+        way.
+
+        :param table: the :class:`_schema.Table` to load rows into.
+
+        :param parameters: a list of dictionaries, each keyed on the column
+         names of the table.
+
+        :param execution_options: optional dictionary of execution options,
+         as for :meth:`_engine.Connection.execute`.
+
+        :return: a :class:`_engine.CursorResult`.
+
+        .. versionadded:: 2.1
+
+        """
+        return self.execute(
+            table.insert(),
+            parameters,
+            execution_options=util.EMPTY_DICT.merge_with(
+                execution_options, {"bulk_load": True}
+            ),
+        )
+
     def _execute_context(
         self,
         dialect: Dialect,
@@ -1908,7 +2153,16 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                         ):
                             evt_handled = True
                             break
-                if not evt_handled:
+                if evt_handled:
+                    pass
+                elif context._is_bulk_load:
+                    self.dialect.do_bulk_load(
+                        cursor,
+                        str_statement,
+                        effective_parameters,
+                        context,
+                    )
+                else:
                     self.dialect.do_executemany(
                         cursor,
                         str_statement,
@@ -2890,6 +3144,210 @@ class TwoPhaseTransaction(RootTransaction):
         self.connection._commit_twophase_impl(self.xid, self._is_prepared)
 
 
+def _estimate_compiled_size(compiled: Compiled) -> int:
+    """Return an approximate number of bytes of memory used by a
+    :class:`.Compiled` object and its cache key when stored in the compiled
+    cache, for use with :paramref:`_sa.create_engine.query_cache_max_bytes`.
+
+    """
+    # each bound parameter and result column accounts for several
+    # dictionary entries and tuples within the compiler as well as within
+    # the cache key; these dominate the size of the SQL string itself
+    return (
+        4096
+        + len(compiled.string) * 2
+        + 1024
+        * (
+            len(getattr(compiled, "binds", ()))
+            + len(getattr(compiled, "_result_columns", ()))
+        )
+    )
+
+
+def _memoize_for_execution(
+    dialect: Dialect, compiled: compiler.SQLCompiler
+) -> None:
+    """Establish the memoized attributes of a :class:`.SQLCompiler` which
+    are otherwise created when the statement is first executed, so that
+    those of a statement compiled by :meth:`_engine.Engine.warm_compiled_cache`
+    are created in the parent process ahead of a fork.
+
+    The :class:`.CursorResultMetaData` of a statement that returns rows is
+    not established here, as it's built from ``cursor.description``.
+
+    """
+    compiled._bind_processors
+    if dialect.bind_typing is BindTyping.SETINPUTSIZES:
+        compiled._get_set_input_sizes_lookup()  # type: ignore[no-untyped-call]  # noqa: E501
+    if compiled.isinsert and compiled.compile_state is not None:
+        compiled._bulk_load
+        compiled._inserted_primary_key_from_lastrowid_getter
+        if compiled.implicit_returning:
+            compiled._inserted_primary_key_from_returning_getter
+
+
+class CompiledCacheStatistics:
+    """Collects statistics regarding the use of the SQL compilation cache
+    by an :class:`_engine.Engine`.
+
+    An instance of this object is available from the
+    :attr:`_engine.Engine.compiled_cache_stats` attribute when the
+    :paramref:`_sa.create_engine.query_cache_stats` parameter is set.
+    Counters are updated for each execution of a SQL expression construct,
+    corresponding to the badges described at :ref:`sql_caching_logging`,
+    without the need for SQL logging to be enabled.
+
+    Counters are not guarded by a mutex and may be approximate when the
+    engine is used by many threads concurrently.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`sql_caching_stats`
+
+    """
+
+    histogram_bounds: Tuple[float, ...] = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+    )
+    """Upper bounds, in seconds, for the buckets of
+    :attr:`.CompiledCacheStatistics.compile_time_histogram`."""
+
+    hits: int
+    """Number of executions that located their compiled form in the
+    cache."""
+
+    misses: int
+    """Number of executions that compiled their statement and then
+    placed it in the cache."""
+
+    no_key: int
+    """Number of executions for which the statement did not produce a cache
+    key, and was therefore compiled without being cached.
+
+    .. seealso::
+
+        :attr:`.CompiledCacheStatistics.no_key_statements`
+
+    """
+
+    caching_disabled: int
+    """Number of executions where caching was disabled, either because no
+    cache was in use or because the dialect does not support caching."""
+
+    evictions: int
+    """Number of compiled forms removed from the engine's cache in order
+    to keep it within its configured size."""
+
+    compile_time: float
+    """Total time in seconds spent generating cache keys and compiling
+    statements that were not located in the cache."""
+
+    compile_time_histogram: List[int]
+    """Count of compilations by elapsed time, where each element
+    corresponds to the bound at the same position in
+    :attr:`.CompiledCacheStatistics.histogram_bounds`, plus one final
+    element counting compilations that exceeded the largest bound."""
+
+    def __init__(self, max_tracked_statements: int = 10):
+        self.max_tracked_statements = max_tracked_statements
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        self.hits = self.misses = self.no_key = self.caching_disabled = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+        self.compile_time_histogram = [0] * (len(self.histogram_bounds) + 1)
+        self._most_expensive: Dict[str, float] = {}
+        self._no_key_statements: Dict[str, int] = {}
+
+    @property
+    def most_expensive(self) -> List[Tuple[float, str]]:
+        """A list of ``(elapsed, sql)`` tuples for the statements that took
+        longest to compile, most expensive first.
+
+        Each distinct SQL string appears once, with the longest time taken
+        by any one compilation of it.  The length of the list is limited to
+        the ``max_tracked_statements`` value, which defaults to ten.
+
+        """
+        return sorted(
+            ((elapsed, sql) for sql, elapsed in self._most_expensive.items()),
+            reverse=True,
+        )
+
+    @property
+    def no_key_statements(self) -> List[Tuple[str, int]]:
+        """A list of ``(sql, count)`` tuples for statements that could not be
+        cached as they did not produce a cache key, most frequent first.
+
+        At most ``max_tracked_statements`` distinct SQL strings are
+        tracked.  When a statement not yet tracked is encountered, it
+        replaces the least frequent one and takes over its count plus one,
+        so that a frequent statement is reported even if it first appears
+        after many others; counts of statements tracked in this way may
+        therefore be overestimated.
+
+        """
+        return sorted(
+            self._no_key_statements.items(),
+            key=operator.itemgetter(1),
+            reverse=True,
+        )
+
+    def _record(
+        self, cache_hit: CacheStats, compiled: Compiled, elapsed: float
+    ) -> None:
+        if cache_hit is CacheStats.CACHE_HIT:
+            self.hits += 1
+            return
+
+        string = compiled.string
+        if cache_hit is CacheStats.CACHE_MISS:
+            self.misses += 1
+        elif cache_hit is CacheStats.NO_CACHE_KEY:
+            self.no_key += 1
+            no_key_statements = self._no_key_statements
+            if string in no_key_statements:
+                no_key_statements[string] += 1
+            elif len(no_key_statements) < self.max_tracked_statements:
+                no_key_statements[string] = 1
+            elif no_key_statements:
+                # "space saving" top-N; the new statement replaces the
+                # least frequent one, inheriting its count
+                least = min(
+                    no_key_statements, key=no_key_statements.__getitem__
+                )
+                no_key_statements[string] = no_key_statements.pop(least) + 1
+        else:
+            self.caching_disabled += 1
+
+        self.compile_time += elapsed
+        self.compile_time_histogram[
+            bisect.bisect_left(self.histogram_bounds, elapsed)
+        ] += 1
+
+        most_expensive = self._most_expensive
+        if string in most_expensive:
+            if elapsed > most_expensive[string]:
+                most_expensive[string] = elapsed
+        elif len(most_expensive) < self.max_tracked_statements:
+            most_expensive[string] = elapsed
+        elif most_expensive:
+            least = min(most_expensive, key=most_expensive.__getitem__)
+            if elapsed > most_expensive[least]:
+                del most_expensive[least]
+                most_expensive[string] = elapsed
+
+
 class Engine(
     ConnectionEventsTarget, log.Identified, inspection.Inspectable["Inspector"]
 ):
@@ -2912,6 +3370,16 @@ class Engine(
     dispatch: dispatcher[ConnectionEventsTarget]
 
     _compiled_cache: Optional[CompiledCacheType]
+    _query_cache_warmup: Optional[_CacheWarmupParameter]
+
+    compiled_cache_stats: Optional[CompiledCacheStatistics]
+    """A :class:`.CompiledCacheStatistics` object that collects statistics
+    regarding the use of the compiled cache, or ``None`` if
+    :paramref:`_sa.create_engine.query_cache_stats` was not set.
+
+    .. versionadded:: 2.1
+
+    """
 
     _execution_options: _ExecuteOptions = _EMPTY_EXECUTION_OPTS
     _has_events: bool = False
@@ -2935,6 +3403,9 @@ class Engine(
         logging_name: Optional[str] = None,
         echo: Optional[_EchoFlagType] = None,
         query_cache_size: int = 500,
+        query_cache_max_bytes: Optional[int] = None,
+        query_cache_warmup: Optional[_CacheWarmupParameter] = None,
+        query_cache_stats: bool = False,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
     ):
@@ -2945,23 +3416,53 @@ class Engine(
             self.logging_name = logging_name
         self.echo = echo
         self.hide_parameters = hide_parameters
-        if query_cache_size != 0:
+        if query_cache_size != 0 and query_cache_max_bytes is not None:
+            self._compiled_cache = util.SegmentedLRUCache(
+                query_cache_size,
+                max_weight=query_cache_max_bytes,
+                weigher=_estimate_compiled_size,
+                size_alert=self._lru_size_alert,
+            )
+        elif query_cache_size != 0:
             self._compiled_cache = util.LRUCache(
                 query_cache_size, size_alert=self._lru_size_alert
             )
         else:
             self._compiled_cache = None
+        self._query_cache_warmup = query_cache_warmup
+        if query_cache_stats:
+            self.compiled_cache_stats = CompiledCacheStatistics()
+        else:
+            self.compiled_cache_stats = None
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
 
-    def _lru_size_alert(self, cache: util.LRUCache[Any, Any]) -> None:
+    def _lru_size_alert(
+        self,
+        cache: Union[
+            util.LRUCache[Any, Any], util.SegmentedLRUCache[Any, Any]
+        ],
+        num_pruned: Optional[int] = None,
+    ) -> None:
+        if num_pruned is None:
+            # LRUCache alerts before pruning down to its capacity
+            size_before = len(cache)
+            size_after = cache.capacity
+            num_pruned = size_before - size_after
+        else:
+            # SegmentedLRUCache alerts after items have been evicted
+            size_after = len(cache)
+            size_before = size_after + num_pruned
+        if self.compiled_cache_stats is not None:
+            self.compiled_cache_stats.evictions += num_pruned
+        self.dispatch.compiled_cache_pruned(self, num_pruned)
         if self._should_log_info():
             self.logger.info(
                 "Compiled cache size pruning from %d items to %d.  "
                 "Increase cache size to reduce the frequency of pruning.",
-                len(cache),
-                cache.capacity,
+                size_before,
+                size_after,
             )
 
     @property
@@ -2988,6 +3489,118 @@ class Engine(
         if self._compiled_cache:
             self._compiled_cache.clear()
 
+    def warm_compiled_cache(
+        self, statements: Iterable[_CacheWarmupStatement]
+    ) -> None:
+        """Compile the given statements into the compiled cache associated
+        with this :class:`_engine.Engine`.
+
+        This is the explicit form of the
+        :paramref:`_sa.create_engine.query_cache_warmup` parameter, and is
+        intended for applications that run within pre-forking servers, where
+        the :class:`_engine.Engine` is created in the parent process; the
+        cache is populated once in the parent, rather than individually in
+        each child process after the fork.  If the engine has not yet
+        connected to the database, a connection is made first so that the
+        dialect may be initialized, as the SQL generated for a statement may
+        vary based on server version.
+
+        Each element of ``statements`` is either an :class:`.Executable`,
+        or a tuple of ``(statement, parameters)`` where the parameters are
+        in the same form as would be passed to
+        :meth:`_engine.Connection.execute`.
+
+        When used before forking, :meth:`_engine.Engine.dispose` should be
+        called afterwards, so that the connection used to initialize the
+        dialect is not carried into child processes; the compiled cache
+        is not affected by this method.
+
+        A statement that fails to compile emits a warning and is skipped;
+        the remaining statements are still compiled.
+
+        .. seealso::
+
+            :ref:`sql_caching_prefork`
+
+            :paramref:`_sa.create_engine.query_cache_warmup`
+
+        .. versionadded:: 2.1
+
+        """
+        if self._compiled_cache is None:
+            return
+
+        # connect if not done already, so that dialect.initialize() has
+        # taken place before anything is compiled
+        with self.connect():
+            pass
+
+        self._warm_compiled_cache(statements)
+
+    def _warm_compiled_cache(
+        self, statements: Iterable[_CacheWarmupStatement]
+    ) -> None:
+        """Compile the given statements into the compiled cache.
+
+        Each element is either an :class:`.Executable`, or a tuple of
+        ``(statement, parameters)`` where ``parameters`` are in the same
+        form as would be passed to :meth:`_engine.Connection.execute`; the
+        parameter keys and whether or not it's an "executemany" form part
+        of the cache key, so that the entry established here is the same
+        one that is located when the statement is later executed.
+
+        The dialect should have been initialized against the database
+        before this method is called, as the SQL generated for a particular
+        statement may vary based on server version and other per-connection
+        characteristics.
+
+        A statement that fails to compile emits a warning and is skipped,
+        so that a single problematic statement does not prevent the
+        remaining statements from being cached, nor the first connection
+        from being established.
+
+        """
+        compiled_cache = self._compiled_cache
+        if compiled_cache is None:
+            return
+
+        dialect = self.dialect
+        schema_translate_map = self._execution_options.get(
+            "schema_translate_map", None
+        )
+
+        for elem in statements:
+            if isinstance(elem, tuple):
+                elem, parameters = elem
+                distilled_parameters = _distill_params_20(parameters)
+            else:
+                distilled_parameters = _distill_params_20(None)
+
+            if distilled_parameters:
+                keys = sorted(distilled_parameters[0])
+                for_executemany = len(distilled_parameters) > 1
+            else:
+                keys = []
+                for_executemany = False
+
+            try:
+                compiled_sql, _, _, _ = elem._compile_w_cache(
+                    dialect=dialect,
+                    compiled_cache=compiled_cache,
+                    column_keys=keys,
+                    for_executemany=for_executemany,
+                    schema_translate_map=schema_translate_map,
+                    linting=dialect.compiler_linting | compiler.WARN_LINTING,
+                )
+            except Exception as err:
+                util.warn(
+                    "Could not compile statement %r for the compiled "
+                    "cache: %s" % (elem, err)
+                )
+            else:
+                if isinstance(compiled_sql, compiler.SQLCompiler):
+                    _memoize_for_execution(dialect, compiled_sql)
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -3017,7 +3630,10 @@ class Engine(
         logging_token: str = ...,
         isolation_level: IsolationLevel = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_latency: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
+        checkout_priority: int = ...,
+        readonly: bool = ...,
         **opt: Any,
     ) -> OptionEngine: ...
 
@@ -3281,6 +3897,8 @@ class Engine(
             :ref:`dbapi_connections`
 
         """
+        if self._execution_options:
+            return self.pool._connect_w_options(self._execution_options)
         return self.pool.connect()
 
 
@@ -3289,6 +3907,7 @@ class OptionEngineMixin(log.Identified):
 
     dispatch: dispatcher[ConnectionEventsTarget]
     _compiled_cache: Optional[CompiledCacheType]
+    compiled_cache_stats: Optional[CompiledCacheStatistics]
     dialect: Dialect
     pool: Pool
     url: URL
@@ -3304,6 +3923,7 @@ class OptionEngineMixin(log.Identified):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self.compiled_cache_stats = proxied.compiled_cache_stats
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
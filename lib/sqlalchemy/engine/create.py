@@ -12,10 +12,12 @@ import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Collection
 from typing import Dict
 from typing import List
 from typing import Optional
 from typing import overload
+from typing import Sequence
 from typing import Type
 from typing import Union
 
@@ -28,12 +30,14 @@ from .. import exc
 from .. import util
 from ..pool import _AdhocProxiedConnection
 from ..pool import ConnectionPoolEntry
+from ..pool import MultiHostPool
 from ..sql import compiler
 from ..util import immutabledict
 
 if typing.TYPE_CHECKING:
     from typing import Literal
 
+    from .base import _CacheWarmupParameter
     from .base import Engine
     from .interfaces import _ExecuteOptions
     from .interfaces import _ParamStyle
@@ -44,6 +48,7 @@ if typing.TYPE_CHECKING:
     from ..pool import _CreatorWRecFnType
     from ..pool import _ResetStyleArgType
     from ..pool import Pool
+    from ..pool import PoolMetrics
 
 
 @overload
@@ -61,6 +66,7 @@ def create_engine(
     hide_parameters: bool = ...,
     implicit_returning: Literal[True] = ...,
     insertmanyvalues_page_size: int = ...,
+    insertmanyvalues_target_latency: float = ...,
     isolation_level: IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
     json_serializer: Callable[..., Any] = ...,
@@ -72,8 +78,16 @@ def create_engine(
     paramstyle: Optional[_ParamStyle] = ...,
     pool: Optional[Pool] = ...,
     poolclass: Optional[Type[Pool]] = ...,
+    pool_fair_waiters: bool = ...,
     pool_logging_name: str = ...,
+    pool_maintenance_interval: Optional[float] = ...,
+    pool_metrics: Optional[PoolMetrics] = ...,
+    pool_min_idle: int = ...,
     pool_pre_ping: bool = ...,
+    pool_pre_ping_interval: Optional[float] = ...,
+    pool_replica_failure_threshold: int = ...,
+    pool_replica_isolation_levels: Collection[str] = ...,
+    pool_replica_retry_interval: float = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
     pool_reset_on_return: Optional[_ResetStyleArgType] = ...,
@@ -81,6 +95,10 @@ def create_engine(
     pool_use_lifo: bool = ...,
     plugins: List[str] = ...,
     query_cache_size: int = ...,
+    query_cache_max_bytes: Optional[int] = ...,
+    query_cache_stats: bool = ...,
+    query_cache_warmup: Optional[_CacheWarmupParameter] = ...,
+    replica_urls: Sequence[Union[str, URL]] = ...,
     use_insertmanyvalues: bool = ...,
     **kwargs: Any,
 ) -> Engine: ...
@@ -292,6 +310,22 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
         :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
 
+    :param insertmanyvalues_target_latency: number of seconds, e.g. ``0.1``,
+     that each batch of an "insertmanyvalues" INSERT should take to execute.
+     When set, the number of rows in each batch starts at
+     :paramref:`_sa.create_engine.insertmanyvalues_page_size` and is tuned
+     after each batch based on the time the batch took, limited only by
+     the dialect's limits on the number of bound parameters and size of a
+     statement.  Defaults to None, meaning the batch size is fixed.
+
+     .. versionadded:: 2.1
+
+     .. seealso::
+
+        :ref:`engine_insertmanyvalues_page_size`
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_target_latency`
+
     :param isolation_level: optional string name of an isolation level
         which will be set on all new connections unconditionally.
         Isolation levels are typically some subset of the string names
@@ -419,6 +453,49 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_fair_waiters=False: if True, connections returned to a
+        :class:`~sqlalchemy.pool.QueuePool` that has reached its overflow
+        limit are handed to waiting checkouts in the order in which they
+        began waiting, taking into account the ``checkout_priority``
+        execution option.  See :paramref:`.QueuePool.fair_waiters`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_fair_waiters`
+
+    :param pool_maintenance_interval=None: if set, number of seconds
+        between runs of a background worker which pre-creates idle
+        connections, recycles aged connections and, if ``pool_pre_ping``
+        is set, pings idle connections, ahead of checkout.  This is used
+        with :class:`~sqlalchemy.pool.QueuePool`; see
+        :paramref:`.QueuePool.maintenance_interval`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_maintenance`
+
+    :param pool_metrics=None: a :class:`.PoolMetrics` object which will
+        collect statistics such as checkout wait times, connection hold
+        times and timeout counts for the connection pool.  See
+        :paramref:`_pool.Pool.metrics`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_metrics`
+
+    :param pool_min_idle=0: number of idle connections the pool
+        maintenance worker will try to keep present in the pool.  Only
+        takes effect when ``pool_maintenance_interval`` is set.  See
+        :paramref:`.QueuePool.min_idle`.
+
+        .. versionadded:: 2.1
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -427,6 +504,42 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_interval=None: when used with ``pool_pre_ping``,
+        number of seconds within which a connection that was returned to
+        the pool without error is trusted to be alive, skipping the "ping"
+        upon checkout.  See :paramref:`_pool.Pool.pre_ping_interval`.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+    :param pool_replica_failure_threshold=3: when
+        :paramref:`_sa.create_engine.replica_urls` is used, the number of
+        consecutive failures to connect to a replica after which it's no
+        longer used for ``pool_replica_retry_interval`` seconds.  See
+        :paramref:`.MultiHostPool.replica_failure_threshold`.
+
+        .. versionadded:: 2.1
+
+    :param pool_replica_isolation_levels: when
+        :paramref:`_sa.create_engine.replica_urls` is used, a collection of
+        isolation level names which, when set using the ``isolation_level``
+        execution option of :meth:`_engine.Engine.execution_options`, route
+        connections to a replica.  See
+        :paramref:`.MultiHostPool.replica_isolation_levels`.
+
+        .. versionadded:: 2.1
+
+    :param pool_replica_retry_interval=30: when
+        :paramref:`_sa.create_engine.replica_urls` is used, number of
+        seconds for which a replica which has reached
+        ``pool_replica_failure_threshold`` is not used.  See
+        :paramref:`.MultiHostPool.replica_retry_interval`.
+
+        .. versionadded:: 2.1
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -512,6 +625,88 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
      .. versionadded:: 1.4
 
+    :param query_cache_max_bytes: when set to an integer number of bytes,
+     the cache used to cache the SQL string form of queries is additionally
+     bounded by the approximate amount of memory used by the compiled forms
+     of statements, as well as by the number of statements given by
+     :paramref:`_sa.create_engine.query_cache_size`.  This is suited to
+     applications where some statements, such as very wide SELECT
+     statements, are much larger than others.
+
+     Setting this parameter also selects an alternate cache implementation
+     which prunes least recently used items without sorting the whole
+     cache; this implementation additionally favors statements which have
+     been used more than once when choosing which statements to evict.  The
+     memory used by each statement is an estimate based on the length of
+     its SQL string and its number of bound parameters and result columns.
+
+     .. seealso::
+
+        :ref:`sql_caching_memory`
+
+     .. versionadded:: 2.1
+
+    :param query_cache_stats: when True, a
+     :class:`.CompiledCacheStatistics` object is established at
+     :attr:`_engine.Engine.compiled_cache_stats`, which counts cache hits,
+     misses, pruned entries and time spent compiling SQL statements.
+
+     .. seealso::
+
+        :ref:`sql_caching_stats`
+
+     .. versionadded:: 2.1
+
+    :param query_cache_warmup: a sequence of statements, or a callable
+     that returns a sequence of statements, which will be compiled into
+     the cache established by :paramref:`_sa.create_engine.query_cache_size`
+     when the engine first connects to the database, so that the first
+     executions of these statements within the process don't incur the
+     cost of SQL compilation.   The callable form allows ORM statements to
+     be constructed at a point where mappers are fully set up.
+
+     Elements of the sequence are either individual statements, or a tuple
+     of ``(statement, parameters)``, where the parameters are in the same
+     form as would be passed to :meth:`_engine.Connection.execute`; the
+     parameter names in use as well as whether or not a list of parameter
+     sets is present is part of the cache key under which the compiled
+     form is stored.
+
+     Compilation is deferred until the first connection as the SQL that's
+     generated is dependent on characteristics of the database, such as
+     server version, which are only established at that point.  The
+     cache itself exists in memory only; compiled forms refer to the
+     in-process :class:`.Table` and other objects from which they were
+     generated, and can't be persisted outside of the process.
+
+     A statement which fails to compile, or a callable which raises,
+     emits a warning rather than an error, so that the connection is
+     still established.
+
+     .. seealso::
+
+        :ref:`sql_caching_warmup`
+
+     .. versionadded:: 2.1
+
+    :param replica_urls: a sequence of :ref:`URLs <database_urls>` of
+     read replicas of the database.  When present, the engine uses a
+     :class:`.MultiHostPool` which maintains a pool of the class indicated
+     by :paramref:`_sa.create_engine.poolclass` for the primary host and
+     for each replica.  Connections are made to the primary host, unless
+     requested from an engine with the ``readonly`` execution option set,
+     in which case a healthy replica is chosen, weighted by its recent
+     checkout latency and error rate.  Replicas use the same dialect and
+     :paramref:`_sa.create_engine.connect_args` as the primary host; each
+     replica URL must have the same drivername as the primary URL, and may
+     not specify plugins, which apply to the engine as a whole.
+
+     .. versionadded:: 2.1
+
+     .. seealso::
+
+        :ref:`pool_multi_host`
+
     :param skip_autocommit_rollback: When True, the dialect will
        unconditionally skip all calls to the DBAPI ``connection.rollback()``
        method if the DBAPI connection is confirmed to be in "autocommit" mode.
@@ -615,12 +810,13 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
     dialect = dialect_cls(**dialect_args)
 
     # assemble connection arguments
-    cargs_tup, _cparams = dialect.create_connect_args(u)
-    cparams = util.immutabledict(_cparams).union(pop_kwarg("connect_args", {}))
+    connect_args = pop_kwarg("connect_args", {})
 
-    # look for existing pool or create
-    pool = pop_kwarg("pool", None)
-    if pool is None:
+    def make_connect(
+        connect_url: URL,
+    ) -> Callable[[Optional[ConnectionPoolEntry]], DBAPIConnection]:
+        cargs_tup, _cparams = dialect.create_connect_args(connect_url)
+        cparams = util.immutabledict(_cparams).union(connect_args)
 
         def connect(
             connection_record: Optional[ConnectionPoolEntry] = None,
@@ -644,16 +840,35 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
             else:
                 return dialect.connect(*cargs_tup, **cparams)
 
+        return connect
+
+    connect = make_connect(u)
+
+    # look for existing pool or create
+    pool = pop_kwarg("pool", None)
+    if pool is None:
         creator = pop_kwarg("creator", connect)
 
         poolclass = pop_kwarg("poolclass", None)
         if poolclass is None:
             poolclass = dialect.get_dialect_pool_class(u)
-        pool_args = {"dialect": dialect}
+        pool_args: Dict[str, Any] = {"dialect": dialect}
+        pool_kwargs = util.get_cls_kwargs(poolclass)
+
+        replica_urls = pop_kwarg("replica_urls", None)
+        if replica_urls:
+            # a pool of poolclass is maintained for each host
+            pool_args["poolclass"] = poolclass
+            pool_args["replicas"] = [
+                make_connect(_make_replica_url(u, replica_url))
+                for replica_url in replica_urls
+            ]
+            poolclass = MultiHostPool
+            pool_kwargs = pool_kwargs.union(util.get_cls_kwargs(poolclass))
 
         # consume pool arguments from kwargs, translating a few of
         # the arguments
-        for k in util.get_cls_kwargs(poolclass):
+        for k in pool_kwargs:
             tk = _pool_translate_kwargs.get(k, k)
             if tk in kwargs:
                 pool_args[k] = pop_kwarg(tk)
@@ -749,6 +964,17 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             try:
                 dialect.initialize(c)
+                if engine._query_cache_warmup is not None:
+                    warmup = engine._query_cache_warmup
+                    try:
+                        statements = warmup() if callable(warmup) else warmup
+                    except Exception as err:
+                        util.warn(
+                            "Could not generate statements for "
+                            "query_cache_warmup: %s" % err
+                        )
+                    else:
+                        engine._warm_compiled_cache(statements)
             finally:
                 # note that "invalidated" and "closed" are mutually
                 # exclusive in 1.4 Connection.
@@ -777,6 +1003,27 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
     return engine
 
 
+def _make_replica_url(primary: URL, replica_url: Union[str, URL]) -> URL:
+    """Return the URL given in ``replica_urls``, checking that it's
+    suitable for connecting using the dialect of the primary URL."""
+
+    replica = _url.make_url(replica_url)
+    if replica.drivername != primary.drivername:
+        raise exc.ArgumentError(
+            f"Replica URL {replica!r} has drivername "
+            f"{replica.drivername!r}, which differs from the drivername "
+            f"{primary.drivername!r} of the primary URL; all replicas "
+            "are connected using the dialect of the primary URL"
+        )
+    if "plugin" in replica.query:
+        raise exc.ArgumentError(
+            f"Replica URL {replica!r} specifies plugins; plugins apply to "
+            "the engine as a whole and may only be specified with the "
+            "primary URL"
+        )
+    return replica
+
+
 def engine_from_config(
     configuration: Dict[str, Any], prefix: str = "sqlalchemy.", **kwargs: Any
 ) -> Engine:
@@ -872,6 +1119,14 @@ _pool_translate_kwargs = immutabledict(
         "events": "pool_events",  # deprecated
         "reset_on_return": "pool_reset_on_return",
         "pre_ping": "pool_pre_ping",
+        "pre_ping_interval": "pool_pre_ping_interval",
         "use_lifo": "pool_use_lifo",
+        "min_idle": "pool_min_idle",
+        "maintenance_interval": "pool_maintenance_interval",
+        "metrics": "pool_metrics",
+        "fair_waiters": "pool_fair_waiters",
+        "replica_failure_threshold": "pool_replica_failure_threshold",
+        "replica_retry_interval": "pool_replica_retry_interval",
+        "replica_isolation_levels": "pool_replica_isolation_levels",
     }
 )
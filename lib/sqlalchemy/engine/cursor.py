@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import collections
 import operator
+import sys
 import typing
 from typing import Any
 from typing import cast
@@ -56,6 +57,8 @@ from ..util.typing import TypeVarTuple
 from ..util.typing import Unpack
 
 if typing.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from .base import Connection
     from .default import DefaultExecutionContext
     from .interfaces import _DBAPICursorDescription
@@ -1603,6 +1606,21 @@ def null_dml_result() -> IteratorResult[Any]:
     return it
 
 
+def _validate_processing_executor(executor: Executor) -> Executor:
+    # the module is present if a ProcessPoolExecutor was created; it's
+    # not imported otherwise, as it imports multiprocessing
+    process_module = sys.modules.get("concurrent.futures.process")
+    if process_module is not None and isinstance(
+        executor, process_module.ProcessPoolExecutor
+    ):
+        raise exc.ArgumentError(
+            "The result_processing_executor execution option does not "
+            "support ProcessPoolExecutor, as result processors generally "
+            "can't be pickled; use a ThreadPoolExecutor"
+        )
+    return executor
+
+
 class CursorResult(Result[Unpack[_Ts]]):
     """A Result that is representing state from a DBAPI cursor.
 
@@ -1662,6 +1680,14 @@ class CursorResult(Result[Unpack[_Ts]]):
         if cursor_description is not None:
             self._init_metadata(context, cursor_description)
 
+            execution_options = context.execution_options
+            if execution_options.get("lazy_row_processing", False):
+                self._lazy_row_processing = True
+            if "result_processing_executor" in execution_options:
+                self._processing_executor = _validate_processing_executor(
+                    execution_options["result_processing_executor"]
+                )
+
             if echo:
                 log = self.context.connection._log_debug
 
@@ -28,6 +28,7 @@ from typing import cast
 from typing import Dict
 from typing import Final
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Literal
 from typing import Mapping
@@ -363,6 +364,8 @@ class DefaultDialect(Dialect):
 
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
+    supports_pipeline = False
+    supports_bulk_load = False
     colspecs: MutableMapping[Type[TypeEngine[Any]], Type[TypeEngine[Any]]] = {}
     default_paramstyle = "named"
 
@@ -383,6 +386,8 @@ class DefaultDialect(Dialect):
 
     supports_multivalues_insert = False
 
+    supports_in_array_parameter = False
+
     use_insertmanyvalues: bool = False
 
     use_insertmanyvalues_wo_returning: bool = False
@@ -393,6 +398,8 @@ class DefaultDialect(Dialect):
 
     insertmanyvalues_page_size: int = 1000
     insertmanyvalues_max_parameters = 32700
+    insertmanyvalues_max_bytes: Optional[int] = None
+    insertmanyvalues_target_latency: Optional[float] = None
 
     supports_is_distinct_from = True
 
@@ -452,6 +459,7 @@ class DefaultDialect(Dialect):
         max_identifier_length: Optional[int] = None,
         label_length: Optional[int] = None,
         insertmanyvalues_page_size: Union[_NoArg, int] = _NoArg.NO_ARG,
+        insertmanyvalues_target_latency: Optional[float] = None,
         use_insertmanyvalues: Optional[bool] = None,
         # util.deprecated_params decorator cannot render the
         # Linting.NO_LINTING constant
@@ -527,6 +535,11 @@ class DefaultDialect(Dialect):
         if insertmanyvalues_page_size is not _NoArg.NO_ARG:
             self.insertmanyvalues_page_size = insertmanyvalues_page_size
 
+        if insertmanyvalues_target_latency is not None:
+            self.insertmanyvalues_target_latency = (
+                insertmanyvalues_target_latency
+            )
+
         self._check_minimum_dbapi_version()
 
     @property
@@ -1027,6 +1040,10 @@ class DefaultDialect(Dialect):
         batch_size = context.execution_options.get(
             "insertmanyvalues_page_size", self.insertmanyvalues_page_size
         )
+        target_latency = context.execution_options.get(
+            "insertmanyvalues_target_latency",
+            self.insertmanyvalues_target_latency,
+        )
 
         if compiled.schema_translate_map:
             schema_translate_map = context.execution_options.get(
@@ -1053,6 +1070,7 @@ class DefaultDialect(Dialect):
             batch_size,
             sort_by_parameter_order,
             schema_translate_map,
+            target_latency=target_latency,
         ):
             yield imv_batch
 
@@ -1176,6 +1194,9 @@ class DefaultDialect(Dialect):
     def do_executemany(self, cursor, statement, parameters, context=None):
         cursor.executemany(statement, parameters)
 
+    def do_bulk_load(self, cursor, statement, parameters, context):
+        self.do_executemany(cursor, statement, parameters, context)
+
     def do_execute(self, cursor, statement, parameters, context=None):
         cursor.execute(statement, parameters)
 
@@ -1474,6 +1495,10 @@ class DefaultExecutionContext(ExecutionContext):
 
     _rowcount: Optional[int] = None
 
+    _pipelined_result: Optional[_cursor.CursorResult[Any]] = None
+
+    _is_bulk_load = False
+
     # a hook for SQLite's translation of
     # result column names
     # NOTE: pyhive is using this hook, can't remove it :(
@@ -1666,7 +1691,18 @@ class DefaultExecutionContext(ExecutionContext):
             ]
 
             if len(parameters) > 1:
-                if self.isinsert and compiled._insertmanyvalues:
+                if (
+                    self.isinsert
+                    and dialect.supports_bulk_load
+                    and execution_options.get("bulk_load", False)
+                    and connection._pipeline is None
+                    and compiled._bulk_load is not None
+                ):
+                    # rows are loaded by Dialect.do_bulk_load() rather
+                    # than by executemany() or insertmanyvalues batches
+                    self._is_bulk_load = True
+                    self.execute_style = ExecuteStyle.EXECUTEMANY
+                elif self.isinsert and compiled._insertmanyvalues:
                     self.execute_style = ExecuteStyle.INSERTMANYVALUES
 
                     imv = compiled._insertmanyvalues
@@ -2076,6 +2112,12 @@ class DefaultExecutionContext(ExecutionContext):
     def rowcount(self) -> int:
         if self._rowcount is not None:
             return self._rowcount
+        elif self._pipelined_result is not None:
+            # the statement was queued within Connection.pipeline();
+            # receive its result, which sets up _rowcount
+            self.root_connection._pipeline_sync()
+            assert self._rowcount is not None
+            return self._rowcount
         else:
             return self.cursor.rowcount
 
@@ -2089,9 +2131,77 @@ class DefaultExecutionContext(ExecutionContext):
     def supports_sane_multi_rowcount(self):
         return self.dialect.supports_sane_multi_rowcount
 
+    def _apply_schema_translate(self, statement: str) -> str:
+        """Render the schema translation tokens present in a statement
+        derived from the compiled statement, such as one which uses the
+        ``table_text`` of ``compiled._bulk_load``."""
+
+        compiled = cast(SQLCompiler, self.compiled)
+        if not compiled.schema_translate_map:
+            return statement
+        return compiled.preparer._render_schema_translates(
+            statement, self.execution_options.get("schema_translate_map", {})
+        )
+
+    def _bulk_load_rows(
+        self, parameters: _DBAPIMultiExecuteParams
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Return the given DBAPI parameter sets as tuples, in the order of
+        the columns of ``compiled._bulk_load``."""
+
+        compiled = cast(SQLCompiler, self.compiled)
+        assert compiled._bulk_load is not None
+        bind_names = compiled._bulk_load.bind_names
+        if compiled.positional:
+            assert compiled.positiontup is not None
+            positions = [compiled.positiontup.index(n) for n in bind_names]
+            return (
+                tuple(p[i] for i in positions)
+                for p in cast("Sequence[Sequence[Any]]", parameters)
+            )
+        else:
+            escaped = compiled.escaped_bind_names
+            keys = [escaped.get(n, n) for n in bind_names]
+            return (
+                tuple(p[k] for k in keys)
+                for p in cast("_CoreMultiExecuteParams", parameters)
+            )
+
+    def _pipeline_deferrable(self) -> bool:
+        """Return True if the result of this statement isn't needed until
+        the end of the current pipeline."""
+        if not self.is_crud or self._is_server_side:
+            return False
+        compiled = cast(SQLCompiler, self.compiled)
+        return not (
+            compiled.effective_returning
+            or compiled.postfetch_lastrowid
+            or compiled.has_out_parameters
+        )
+
+    def _pipeline_received(self) -> None:
+        """Called by the :class:`_engine.Connection` once the result of a
+        statement queued within a pipeline has been received."""
+        result = self._pipelined_result
+        if result is None:
+            return
+        self._pipelined_result = None
+        if self._rowcount is None:
+            self._rowcount = self.cursor.rowcount
+        result._soft_close()
+        self._soft_closed = True
+
     def _setup_result_proxy(self):
         exec_opt = self.execution_options
 
+        if self.root_connection._pipeline is not None:
+            if self._pipeline_deferrable():
+                return self._setup_pipelined_result()
+
+            # the statement returns rows or otherwise needs its result
+            # right away
+            self.root_connection._pipeline_sync()
+
         if self._rowcount is None and exec_opt.get("preserve_rowcount", False):
             self._rowcount = self.cursor.rowcount
 
@@ -2132,6 +2242,17 @@ class DefaultExecutionContext(ExecutionContext):
 
         return result
 
+    def _setup_pipelined_result(self):
+        # the statement has been queued by the driver and its result hasn't
+        # been received yet; the cursor is left open so that its rowcount
+        # is available once it has
+        result: _cursor.CursorResult[Any] = _cursor.CursorResult(
+            self, _cursor._NO_CURSOR_DML, None
+        )
+        self._pipelined_result = result
+        self.root_connection._pipeline_pending.append(self)
+        return result
+
     def _setup_out_parameters(self, result):
         compiled = cast(SQLCompiler, self.compiled)
 
@@ -510,6 +510,29 @@ class ConnectionEvents(event.Events[ConnectionEventsTarget]):
 
         """
 
+    def compiled_cache_pruned(self, engine: Engine, num_pruned: int) -> None:
+        """Intercept when the compiled cache of an :class:`_engine.Engine`
+        is about to be pruned of its least recently used entries.
+
+        The cache is pruned when the number of entries exceeds the size
+        configured by :paramref:`_sa.create_engine.query_cache_size` by
+        fifty percent.  Frequent pruning indicates that the application is
+        running more distinct statements than the cache can hold, and
+        that statements are repeatedly being evicted and compiled again.
+
+        :param engine: the :class:`_engine.Engine` whose cache is being
+         pruned.
+
+        :param num_pruned: the number of entries that will be removed.
+
+        .. versionadded:: 2.1
+
+        .. seealso::
+
+            :ref:`sql_caching_stats`
+
+        """
+
     def begin(self, conn: Connection) -> None:
         """Intercept begin() events.
 
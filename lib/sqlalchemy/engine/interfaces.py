@@ -15,6 +15,7 @@ from typing import Awaitable
 from typing import Callable
 from typing import ClassVar
 from typing import Collection
+from typing import ContextManager
 from typing import Dict
 from typing import Iterable
 from typing import Iterator
@@ -46,6 +47,8 @@ from ..util.concurrency import await_
 from ..util.typing import NotRequired
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from .base import Connection
     from .base import Engine
     from .cursor import CursorResult
@@ -290,9 +293,15 @@ class _CoreKnownExecutionOptions(TypedDict, total=False):
     max_row_buffer: int
     yield_per: int
     insertmanyvalues_page_size: int
+    insertmanyvalues_target_latency: float
     schema_translate_map: Optional[SchemaTranslateMapType]
     preserve_rowcount: bool
+    bulk_load: bool
     driver_column_names: bool
+    lazy_row_processing: bool
+    result_processing_executor: Executor
+    checkout_priority: int
+    readonly: bool
 
 
 _ExecuteOptions = immutabledict[str, Any]
@@ -945,6 +954,26 @@ class Dialect(EventTarget):
       executemany.
     """
 
+    supports_pipeline: bool
+    """Indicate whether the dialect supports sending statements to the
+    database without waiting for the result of each one, as used by
+    :meth:`_engine.Connection.pipeline`.
+
+    .. versionadded:: 2.1
+
+    """
+
+    supports_bulk_load: bool
+    """Indicate whether the dialect has a native facility for loading
+    the rows of an INSERT executed with executemany(), which is used by
+    :meth:`.Dialect.do_bulk_load` when the
+    :paramref:`_engine.Connection.execution_options.bulk_load` execution
+    option is set.
+
+    .. versionadded:: 2.1
+
+    """
+
     supports_empty_insert: bool
     """dialect supports INSERT () VALUES (), i.e. a plain INSERT with no
     columns in it.
@@ -983,6 +1012,20 @@ class Dialect(EventTarget):
 
     """
 
+    supports_in_array_parameter: bool
+    """Target dialect can render an IN comparison against an expanding
+    bound parameter as a comparison to a single array-valued bound
+    parameter, e.g. ``col = ANY (%(param)s)``, when the comparison is
+    marked with the ``in_as_array`` modifier.
+
+    This is used by the ORM :func:`_orm.selectinload` loader so that the
+    number of primary key values sent in one statement is not bound by the
+    dialect's limit on the number of bound parameters.
+
+    .. versionadded:: 2.1
+
+    """
+
     _json_serializer: Callable[[_JSON_VALUE], str] | None
 
     _json_deserializer: Callable[[str], _JSON_VALUE] | None
@@ -1117,6 +1160,36 @@ class Dialect(EventTarget):
 
     """
 
+    insertmanyvalues_max_bytes: Optional[int]
+    """Alternate to insertmanyvalues_page_size, will additionally limit
+    page size so that the estimated size in bytes of the statement and its
+    parameters doesn't exceed this value.
+
+    The default dialect defaults this to None, meaning no limit; the MySQL
+    and MariaDB dialects set it based on the ``max_allowed_packet``
+    server variable.
+
+    .. versionadded:: 2.1
+
+    """
+
+    insertmanyvalues_target_latency: Optional[float]
+    """When set, the page size for :attr:`.ExecuteStyle.INSERTMANYVALUES`
+    executions is tuned after each batch towards this number of seconds per
+    batch, starting at insertmanyvalues_page_size, and limited only by
+    insertmanyvalues_max_parameters and insertmanyvalues_max_bytes.
+
+    The default dialect defaults this to None.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_target_latency` -
+        execution option available on :class:`_engine.Connection`, statements
+
+    """  # noqa: E501
+
     preexecute_autoincrement_sequences: bool
     """True if 'implicit' primary key functions must be executed separately
       in order to get their value, if RETURNING is not used.
@@ -2213,6 +2286,36 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def do_pipeline(
+        self, dbapi_connection: PoolProxiedConnection
+    ) -> ContextManager[Any]:
+        """Return a context manager which places the given DBAPI connection
+        in pipeline mode for the duration of the block.
+
+        The object produced by the context manager is passed to
+        :meth:`.Dialect.do_pipeline_sync`.  Upon exit, the context manager
+        is expected to have received the results of all statements sent.
+
+        This hook is used by :meth:`_engine.Connection.pipeline` when
+        :attr:`.Dialect.supports_pipeline` is True.
+
+        .. versionadded:: 2.1
+
+        """
+
+        raise NotImplementedError()
+
+    def do_pipeline_sync(self, pipeline: Any) -> None:
+        """Wait for the results of all statements sent so far within
+        a pipeline established by :meth:`.Dialect.do_pipeline`, raising
+        the DBAPI error of the first one that failed, if any.
+
+        .. versionadded:: 2.1
+
+        """
+
+        raise NotImplementedError()
+
     def _do_ping_w_event(self, dbapi_connection: DBAPIConnection) -> bool:
         raise NotImplementedError()
 
@@ -2387,6 +2490,30 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def do_bulk_load(
+        self,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: _DBAPIMultiExecuteParams,
+        context: ExecutionContext,
+    ) -> None:
+        """Load the rows of an INSERT statement using the dialect's native
+        bulk loading facility.
+
+        This hook is used in place of :meth:`.Dialect.do_executemany` when
+        the :paramref:`_engine.Connection.execution_options.bulk_load`
+        execution option is set for a plain INSERT executed with multiple
+        parameter sets, and :attr:`.Dialect.supports_bulk_load` is True.
+        ``statement`` and ``parameters`` are those of the INSERT statement;
+        the columns and the bound parameter names to which each refers are
+        available from ``context.compiled._bulk_load``.
+
+        .. versionadded:: 2.1
+
+        """
+
+        raise NotImplementedError()
+
     def do_execute(
         self,
         cursor: DBAPICursor,
@@ -3197,6 +3324,11 @@ class ExecutionContext:
 
     """
 
+    _is_bulk_load: bool
+    """internal flag indicating the statement will be passed to
+    :meth:`.Dialect.do_bulk_load` rather than to
+    :meth:`.Dialect.do_executemany`"""
+
     executemany: bool
     """True if the context has a list of more than one parameter set.
 
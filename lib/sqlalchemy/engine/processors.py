@@ -16,18 +16,28 @@ They all share one common characteristic: None is passed through unchanged.
 from __future__ import annotations
 
 import datetime
+from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Pattern
+from typing import Sequence
 from typing import TypeVar
 from typing import Union
 
 from ._processors_cy import int_to_boolean as int_to_boolean  # noqa: F401
+from ._processors_cy import int_to_boolean_batch as int_to_boolean_batch
 from ._processors_cy import str_to_date as str_to_date  # noqa: F401
+from ._processors_cy import str_to_date_batch as str_to_date_batch
 from ._processors_cy import str_to_datetime as str_to_datetime  # noqa: F401
+from ._processors_cy import str_to_datetime_batch as str_to_datetime_batch
 from ._processors_cy import str_to_time as str_to_time  # noqa: F401
+from ._processors_cy import str_to_time_batch as str_to_time_batch
 from ._processors_cy import to_float as to_float  # noqa: F401
+from ._processors_cy import to_float_batch as to_float_batch
 from ._processors_cy import to_str as to_str  # noqa: F401
+from ._processors_cy import to_str_batch as to_str_batch
 
 if True:
     from ._processors_cy import (  # noqa: F401
@@ -35,6 +45,44 @@ if True:
     )
 
 
+_BatchProcessorType = Callable[[Sequence[Any]], List[Any]]
+
+_batch_processors: Dict[Callable[[Any], Any], _BatchProcessorType] = {
+    int_to_boolean: int_to_boolean_batch,
+    to_str: to_str_batch,
+    to_float: to_float_batch,
+    str_to_datetime: str_to_datetime_batch,
+    str_to_time: str_to_time_batch,
+    str_to_date: str_to_date_batch,
+}
+
+
+def to_batch_processor(
+    processor: Callable[[Any], Any],
+) -> _BatchProcessorType:
+    """Return a callable that applies the given processor to a sequence
+    of values, returning a list.
+
+    The batch variant of one of the processors in this module is returned
+    if there is one; for other processors, the processor is mapped
+    over the values.
+
+    """
+    process_batch = getattr(processor, "process_batch", None)
+    if process_batch is not None:
+        return process_batch  # type: ignore[no-any-return]
+
+    try:
+        return _batch_processors[processor]
+    except (KeyError, TypeError):
+        pass
+
+    def process(values: Sequence[Any]) -> List[Any]:
+        return list(map(processor, values))
+
+    return process
+
+
 _DT = TypeVar(
     "_DT", bound=Union[datetime.datetime, datetime.time, datetime.date]
 )
@@ -39,6 +39,7 @@ from ._result_cy import _T
 from ._result_cy import _UniqueFilterType as _UniqueFilterType
 from ._result_cy import BaseResultInternal
 from ._util_cy import tuplegetter as tuplegetter
+from .processors import to_batch_processor
 from .row import Row
 from .row import RowMapping
 from .. import exc
@@ -46,6 +47,7 @@ from .. import util
 from ..sql.base import _generative
 from ..sql.base import InPlaceGenerative
 from ..util import deprecated
+from ..util import HasMemoized_ro_memoized_attribute
 from ..util import NONE_SET
 from ..util.typing import Never
 from ..util.typing import Self
@@ -917,6 +919,164 @@ class Result(_WithKeys, ResultInternal[Row[Unpack[_Ts]]]):
             else:
                 break
 
+    @HasMemoized_ro_memoized_attribute
+    def _columnar_getter(
+        self,
+    ) -> Callable[[Sequence[Any]], Tuple[List[Any], ...]]:
+        """Return a callable that converts a sequence of raw rows into
+        a tuple of lists, one per column, with result processors applied
+        column-wise.
+
+        """
+        real_result = self if self._real_result is None else self._real_result
+
+        if real_result._source_supports_scalars:
+            raise exc.InvalidRequestError(
+                "Columnar fetching is not supported for results that "
+                "return ORM entities or other non-row objects"
+            )
+        if self._unique_filter_state is not None:
+            raise exc.InvalidRequestError(
+                "Columnar fetching can't be combined with unique()"
+            )
+
+        metadata = self._metadata
+        tuple_filters = metadata._tuplefilter
+        num_columns = len(metadata.keys)
+
+        processors: Sequence[Optional[Callable[[Sequence[Any]], List[Any]]]]
+        if metadata._effective_processors is not None:
+            ep = metadata._effective_processors
+            if tuple_filters is not None:
+                ep = tuple_filters(ep)
+            processors = [
+                to_batch_processor(p) if p is not None else None for p in ep
+            ]
+        else:
+            processors = [None] * num_columns
+
+        def columnar(rows: Sequence[Any]) -> Tuple[List[Any], ...]:
+            if not rows:
+                return tuple([] for _ in range(num_columns))
+
+            if tuple_filters is not None:
+                rows = [tuple_filters(row) for row in rows]
+
+            return tuple(
+                [
+                    proc(column) if proc is not None else list(column)
+                    for proc, column in zip(processors, zip(*rows))
+                ]
+            )
+
+        return columnar
+
+    def partitions_columnar(
+        self,
+        size: Optional[int] = None,
+        array_factory: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Iterate through partitions of rows of the size given, where each
+        partition is delivered in columnar form.
+
+        Each partition is a tuple with one element per column, in the
+        order given by :meth:`_engine.Result.keys`; each element contains
+        the values of that column for the rows in the partition.  Rows are
+        fetched from the cursor in the same way as for
+        :meth:`_engine.Result.partitions`, however result processors are
+        applied to the values of each column as a whole and no
+        :class:`_engine.Row` objects are created, which makes this method
+        suitable for efficiently loading large results into array-oriented
+        libraries::
+
+            import numpy
+            import pandas
+
+            result = connection.execute(select(table.c.x, table.c.y))
+
+            frames = [
+                pandas.DataFrame(dict(zip(result.keys(), partition)))
+                for partition in result.partitions_columnar(
+                    10000, array_factory=numpy.array
+                )
+            ]
+
+        Filtering with :meth:`_engine.Result.columns` is supported, however
+        :meth:`_engine.Result.unique` is not, nor are results that return
+        ORM entities.  Rows fetched in this way are not included in the
+        row logging emitted by ``echo="debug"``.
+
+        The result object is automatically closed when the iterator
+        is fully consumed.
+
+        .. versionadded:: 2.1
+
+        :param size: indicate the maximum number of rows to be present
+         in each partition.  Defaults in the same way as for
+         :meth:`_engine.Result.partitions`.
+
+        :param array_factory: optional callable which is passed the list of
+         values for each column and returns the object that will be
+         delivered for that column in place of the list, such as
+         ``numpy.array``, ``pyarrow.array`` or ``array.array`` with a
+         typecode applied.
+
+        :return: iterator of tuples of per-column lists, or of whatever
+         object is returned by the ``array_factory``.
+
+        .. seealso::
+
+            :meth:`_engine.Result.columns_as_arrays`
+
+        """
+        columnar = self._columnar_getter
+        if size is None:
+            real_result = (
+                self if self._real_result is None else self._real_result
+            )
+            size = real_result._yield_per
+
+        while True:
+            rows = self._fetchmany_impl(size)
+            if not rows:
+                break
+            columns = columnar(rows)
+            if array_factory is not None:
+                yield tuple(array_factory(column) for column in columns)
+            else:
+                yield columns
+
+    def columns_as_arrays(
+        self, array_factory: Optional[Callable[[List[Any]], Any]] = None
+    ) -> Tuple[Any, ...]:
+        """Return all remaining rows in columnar form.
+
+        Returns a tuple with one element per column, in the order given by
+        :meth:`_engine.Result.keys`, each element containing the values of
+        that column for all rows.  This is the "all rows" version of
+        :meth:`_engine.Result.partitions_columnar`; see that method for
+        details.
+
+        Closes the result set after invocation.
+
+        .. versionadded:: 2.1
+
+        :param array_factory: optional callable which is passed the list of
+         values for each column and returns the object that will be
+         delivered for that column in place of the list, such as
+         ``numpy.array``.
+
+        .. seealso::
+
+            :meth:`_engine.Result.partitions_columnar`
+
+        """
+        columns = self._columnar_getter(self._fetchall_impl())
+        if array_factory is not None:
+            return tuple(array_factory(column) for column in columns)
+        else:
+            return columns
+
     def fetchall(self) -> Sequence[Row[Unpack[_Ts]]]:
         """A synonym for the :meth:`_engine.Result.all` method."""
 
@@ -184,12 +184,19 @@ class Row(BaseRow, _RowBase[Unpack[_Ts]], Generic[Unpack[_Ts]]):  # type: ignore
         .. versionadded:: 1.4
 
         """
+        if self._lazy is not None:
+            return self._with_class(RowMapping)  # type: ignore[return-value]
         return RowMapping(self._parent, None, self._key_to_index, self._data)
 
     def _filter_on_values(
         self, processor: Optional[_ProcessorsType]
     ) -> Row[Unpack[_Ts]]:
-        return Row(self._parent, processor, self._key_to_index, self._data)
+        return Row(
+            self._parent,
+            processor,
+            self._key_to_index,
+            self._data if self._lazy is None else self._to_tuple_instance(),
+        )
 
     if not TYPE_CHECKING:
 
@@ -49,8 +49,11 @@ from ...util.typing import TypeVarTuple
 from ...util.typing import Unpack
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from ...engine.cursor import CursorResult
     from ...engine.interfaces import _CoreAnyExecuteParams
+    from ...engine.interfaces import _CoreMultiExecuteParams
     from ...engine.interfaces import _CoreSingleExecuteParams
     from ...engine.interfaces import _DBAPIAnyExecuteParams
     from ...engine.interfaces import _ExecuteOptions
@@ -65,6 +68,7 @@ if TYPE_CHECKING:
     from ...pool import PoolProxiedConnection
     from ...sql._typing import _InfoType
     from ...sql.base import Executable
+    from ...sql.selectable import TableClause
     from ...sql.selectable import TypedReturnsRows
 
 _P = ParamSpec("_P")
@@ -424,9 +428,13 @@ class AsyncConnection(  # type: ignore[misc]
         max_row_buffer: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_latency: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         preserve_rowcount: bool = False,
+        bulk_load: bool = False,
         driver_column_names: bool = False,
+        lazy_row_processing: bool = False,
+        result_processing_executor: Executor = ...,
         **opt: Any,
     ) -> AsyncConnection: ...
 
@@ -522,6 +530,35 @@ class AsyncConnection(  # type: ignore[misc]
 
         return await _ensure_sync_result(result, self.exec_driver_sql)
 
+    async def bulk_load(
+        self,
+        table: TableClause,
+        parameters: _CoreMultiExecuteParams,
+        *,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+    ) -> CursorResult[Unpack[TupleAny]]:
+        r"""INSERT a list of rows into a table using the dialect's native
+        bulk loading facility, where available.
+
+        .. seealso::
+
+            :meth:`_engine.Connection.bulk_load` - includes a complete
+            description of the method
+
+        .. versionadded:: 2.1
+
+        """
+
+        result = await greenlet_spawn(
+            self._proxied.bulk_load,
+            table,
+            parameters,
+            execution_options=execution_options,
+            _require_await=True,
+        )
+
+        return await _ensure_sync_result(result, self.bulk_load)
+
     @overload
     def stream(
         self,
@@ -1123,7 +1160,10 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):  # type: ignore[mi
         logging_token: str = ...,
         isolation_level: IsolationLevel = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_latency: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
+        checkout_priority: int = ...,
+        readonly: bool = ...,
         **opt: Any,
     ) -> AsyncEngine: ...
 
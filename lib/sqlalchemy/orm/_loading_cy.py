@@ -0,0 +1,493 @@
+# orm/_loading_cy.py
+# Copyright (C) 2010-2026 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+# mypy: ignore-errors
+
+"""Row-to-instance routines used by :mod:`sqlalchemy.orm.loading`, which
+are compiled when the cython extensions are built.
+
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from . import exc as orm_exc
+from .base import state_str
+from .. import util
+
+# START GENERATED CYTHON IMPORT
+# This section is automatically generated by the script tools/cython_imports.py
+try:
+    # NOTE: the cython compiler needs this "import cython" in the file, it
+    # can't be only "from sqlalchemy.util import cython" with the fallback
+    # in that module
+    import cython
+except ModuleNotFoundError:
+    from sqlalchemy.util import cython
+
+
+def _is_compiled() -> bool:
+    """Utility function to indicate if this module is compiled or not."""
+    return cython.compiled  # type: ignore[no-any-return,unused-ignore]
+
+
+# END GENERATED CYTHON IMPORT
+
+
+def _warn_for_runid_changed(state):
+    util.warn(
+        "Loading context for %s has changed within a load/refresh "
+        "handler, suggesting a row refresh operation took place. If this "
+        "event handler is expected to be "
+        "emitting row refresh operations within an existing load or refresh "
+        "operation, set restore_load_context=True when establishing the "
+        "listener to ensure the context remains unchanged when the event "
+        "handler completes." % (state_str(state),)
+    )
+
+
+def _validate_version_id(mapper, state, dict_, row, getter):
+    if mapper._get_state_attr_by_column(
+        state, dict_, mapper.version_id_col
+    ) != getter(row):
+        raise orm_exc.StaleDataError(
+            "Instance '%s' has version id '%s' which "
+            "does not match database-loaded version id '%s'."
+            % (
+                state_str(state),
+                mapper._get_state_attr_by_column(
+                    state, dict_, mapper.version_id_col
+                ),
+                getter(row),
+            )
+        )
+
+
+@cython.ccall
+def _populate_full(
+    context: object,
+    row: object,
+    state: object,
+    dict_: object,
+    isnew: cython.bint,
+    load_path: object,
+    populate_existing: cython.bint,
+    quick: list,
+    expire: list,
+    new: list,
+    existing: list,
+) -> None:
+    """Populate an instance from a row that is the first row with its
+    identity in the current load, or is subject to populate_existing.
+
+    Used by :class:`._InstanceLoader` as well as by the ``readonly_entities``
+    loader in :mod:`sqlalchemy.orm.loading`.
+
+    """
+    if isnew:
+        # first time we are seeing a row with this identity.
+        state.runid = context.runid
+
+        for key, getter in quick:
+            dict_[key] = getter(row)
+        if populate_existing:
+            for key, set_callable in expire:
+                dict_.pop(key, None)
+                if set_callable:
+                    state.expired_attributes.add(key)
+        else:
+            for key, set_callable in expire:
+                if set_callable:
+                    state.expired_attributes.add(key)
+
+        for key, populator in new:
+            populator(state, dict_, row)
+
+    elif load_path != state.load_path:
+        # new load path, e.g. object is present in more than one
+        # column position in a series of rows.
+        #
+        # the shallowest path wins.  state.load_path is paired with
+        # state.load_options and the two are replayed together when the
+        # object is later refreshed or unexpired; taking whichever path
+        # happened to be processed last made that replay depend on column
+        # order within the row, row order within the result, and which
+        # eager loader style was in use.  the shallowest path is both
+        # deterministic and the most conservative choice, as a deeper
+        # path matches loader options that were registered for some other
+        # occurrence of this entity.  See #13507.
+        #
+        # only move the path if the current load is the one that stamped
+        # it; the condition here mirrors the one in _InstanceLoader
+        # that assigns load_path / load_options together.  when
+        # populate_existing is in effect with no propagated options, the
+        # path in place belongs to a previous load and is left alone.
+        if len(load_path) < len(state.load_path) and (
+            context.propagated_loader_options or not populate_existing
+        ):
+            state.load_path = load_path
+
+        # if we have data, and the data isn't in the dict, OK, let's put
+        # it in.
+        for key, getter in quick:
+            if key not in dict_:
+                dict_[key] = getter(row)
+
+        # otherwise treat like an "already seen" row
+        for key, populator in existing:
+            populator(state, dict_, row)
+            # TODO:  allow "existing" populator to know this is
+            # a new path for the state:
+            # populator(state, dict_, row, new_path=True)
+
+    else:
+        # have already seen rows with this identity in this same path.
+        for key, populator in existing:
+            populator(state, dict_, row)
+
+            # TODO: same path
+            # populator(state, dict_, row, new_path=False)
+
+
+@cython.cclass
+class _InstanceLoader:
+    """Produce a mapped instance from a row.
+
+    This is the callable returned by :func:`.loading._instance_processor`
+    for a mapper, other than when the ``readonly_entities`` execution
+    option is in use.
+
+    """
+
+    __slots__ = (
+        "mapper",
+        "context",
+        "load_path",
+        "post_load",
+        "refresh_state",
+        "refresh_identity_key",
+        "only_load_props",
+        "primary_key_getter",
+        "version_id_getter",
+        "is_not_primary_key",
+        "instance_state",
+        "instance_dict",
+        "identity_class",
+        "identity_token",
+        "session_identity_map",
+        "session_id",
+        "runid",
+        "propagated_loader_options",
+        "loaded_as_persistent",
+        "quick",
+        "new",
+        "expire",
+        "existing",
+        "eager",
+        "populate_existing",
+        "version_check",
+        "load_evt",
+        "refresh_evt",
+        "persistent_evt",
+    )
+
+    if cython.compiled:
+        mapper: object
+        context: object
+        load_path: object
+        post_load: object
+        refresh_state: object
+        refresh_identity_key: object
+        only_load_props: object
+        primary_key_getter: object
+        version_id_getter: object
+        is_not_primary_key: object
+        instance_state: object
+        instance_dict: object
+        identity_class: object
+        identity_token: object
+        session_identity_map: object
+        session_id: object
+        runid: object
+        propagated_loader_options: object
+        loaded_as_persistent: object
+        quick: list
+        new: list
+        expire: list
+        existing: list
+        eager: list
+        populate_existing: cython.bint
+        version_check: cython.bint
+        load_evt: cython.bint
+        refresh_evt: cython.bint
+        persistent_evt: cython.bint
+
+    def __init__(
+        self,
+        mapper: Any,
+        context: Any,
+        populators: Any,
+        load_path: Any,
+        post_load: Any,
+        refresh_state: Any,
+        refresh_identity_key: Any,
+        only_load_props: Any,
+        primary_key_getter: Any,
+        version_id_getter: Any,
+        is_not_primary_key: Any,
+        instance_state: Any,
+        instance_dict: Any,
+        populate_existing: bool,
+        load_evt: bool,
+        refresh_evt: bool,
+        persistent_evt: bool,
+    ):
+        session = context.session
+
+        self.mapper = mapper
+        self.context = context
+        self.load_path = load_path
+        self.post_load = post_load
+        self.refresh_state = refresh_state
+        self.refresh_identity_key = refresh_identity_key
+        self.only_load_props = only_load_props
+        self.primary_key_getter = primary_key_getter
+        self.version_id_getter = version_id_getter
+        self.is_not_primary_key = is_not_primary_key
+        self.instance_state = instance_state
+        self.instance_dict = instance_dict
+        self.identity_class = mapper._identity_class
+        self.identity_token = context.identity_token
+        self.session_identity_map = session.identity_map
+        self.session_id = session.hash_key
+        self.runid = context.runid
+        self.propagated_loader_options = context.propagated_loader_options
+        self.loaded_as_persistent = (
+            session.dispatch.loaded_as_persistent if persistent_evt else None
+        )
+        self.quick = populators["quick"]
+        self.new = populators["new"]
+        self.expire = populators["expire"]
+        self.existing = populators["existing"]
+        self.eager = populators["eager"]
+        self.populate_existing = populate_existing
+        self.version_check = context.version_check
+        self.load_evt = load_evt
+        self.refresh_evt = refresh_evt
+        self.persistent_evt = persistent_evt
+
+    def __call__(self, row: Any) -> Any:
+        isnew: cython.bint
+        currentload: cython.bint
+        loaded_instance: cython.bint
+        effective_populate_existing: cython.bint
+
+        # determine the state that we'll be populating
+        if self.refresh_identity_key:
+            # fixed state that we're refreshing
+            state = self.refresh_state
+            instance = state.obj()
+            dict_ = self.instance_dict(instance)
+            isnew = state.runid != self.runid
+            currentload = True
+            loaded_instance = False
+        else:
+            # look at the row, see if that identity is in the
+            # session, or we have to create a new one
+            identitykey = (
+                self.identity_class,
+                self.primary_key_getter(row),
+                self.identity_token,
+            )
+
+            instance = self.session_identity_map.get(identitykey)
+
+            if instance is not None:
+                # existing instance
+                state = self.instance_state(instance)
+                dict_ = self.instance_dict(instance)
+
+                isnew = state.runid != self.runid
+                currentload = not isnew
+                loaded_instance = False
+
+                if (
+                    self.version_check
+                    and self.version_id_getter
+                    and not currentload
+                ):
+                    _validate_version_id(
+                        self.mapper, state, dict_, row, self.version_id_getter
+                    )
+
+            else:
+                # create a new instance
+
+                # check for non-NULL values in the primary key columns,
+                # else no entity is returned for the row
+                if self.is_not_primary_key(identitykey[1]):
+                    return None
+
+                isnew = True
+                currentload = True
+                loaded_instance = True
+
+                instance = self.mapper.class_manager.new_instance()
+
+                dict_ = self.instance_dict(instance)
+                state = self.instance_state(instance)
+                state.key = identitykey
+                state.identity_token = self.identity_token
+
+                # attach instance to session.
+                state.session_id = self.session_id
+                self.session_identity_map._add_unpresent(state, identitykey)
+
+        effective_populate_existing = self.populate_existing
+        if self.refresh_state is state:
+            effective_populate_existing = True
+
+        # populate.  this looks at whether this state is new
+        # for this load or was existing, and whether or not this
+        # row is the first row with this identity.
+        if currentload or effective_populate_existing:
+            # full population routines.  Objects here are either
+            # just created, or we are doing a populate_existing
+
+            # be conservative about setting load_path when populate_existing
+            # is in effect; want to maintain options from the original
+            # load.  see test_expire->test_refresh_maintains_deferred_options
+            if isnew and (
+                self.propagated_loader_options
+                or not effective_populate_existing
+            ):
+                state.load_options = self.propagated_loader_options
+                state.load_path = self.load_path
+
+            _populate_full(
+                self.context,
+                row,
+                state,
+                dict_,
+                isnew,
+                self.load_path,
+                effective_populate_existing,
+                self.quick,
+                self.expire,
+                self.new,
+                self.existing,
+            )
+
+            if isnew:
+                # state.runid should be equal to context.runid / runid
+                # here, however for event checks we are being more conservative
+                # and checking against existing run id
+                # assert state.runid == runid
+
+                existing_runid = state.runid
+
+                if loaded_instance:
+                    if self.load_evt:
+                        state.manager.dispatch.load(state, self.context)
+                        if state.runid != existing_runid:
+                            _warn_for_runid_changed(state)
+                    if self.persistent_evt:
+                        self.loaded_as_persistent(self.context.session, state)
+                        if state.runid != existing_runid:
+                            _warn_for_runid_changed(state)
+                elif self.refresh_evt:
+                    state.manager.dispatch.refresh(
+                        state, self.context, self.only_load_props
+                    )
+                    if state.runid != self.runid:
+                        _warn_for_runid_changed(state)
+
+                if effective_populate_existing or state.modified:
+                    if self.refresh_state and self.only_load_props:
+                        state._commit(dict_, self.only_load_props)
+                    else:
+                        state._commit_all(dict_, self.session_identity_map)
+
+            if self.post_load:
+                self.post_load.add_state(state, True)
+
+        else:
+            # partial population routines, for objects that were already
+            # in the Session, but a row matches them; apply eager loaders
+            # on existing objects, etc.
+            unloaded = state.unloaded
+            isnew = state not in self.context.partials
+
+            if not isnew or unloaded or self.eager:
+                # state is having a partial set of its attributes
+                # refreshed.  Populate those attributes,
+                # and add to the "context.partials" collection.
+
+                to_load = self._populate_partial(
+                    row, state, dict_, isnew, unloaded
+                )
+
+                if isnew:
+                    if self.refresh_evt:
+                        existing_runid = state.runid
+                        state.manager.dispatch.refresh(
+                            state, self.context, to_load
+                        )
+                        if state.runid != existing_runid:
+                            _warn_for_runid_changed(state)
+
+                    state._commit(dict_, to_load)
+
+            if self.post_load and self.context.invoke_all_eagers:
+                self.post_load.add_state(state, False)
+
+        return instance
+
+    @cython.cfunc
+    @cython.inline
+    def _populate_partial(
+        self,
+        row: object,
+        state: object,
+        dict_: object,
+        isnew: cython.bint,
+        unloaded: object,
+    ) -> object:
+        context = self.context
+
+        if not isnew:
+            if unloaded:
+                # extra pass, see #8166
+                for key, getter in self.quick:
+                    if key in unloaded:
+                        dict_[key] = getter(row)
+
+            to_load = context.partials[state]
+            for key, populator in self.existing:
+                if key in to_load:
+                    populator(state, dict_, row)
+        else:
+            to_load = unloaded
+            context.partials[state] = to_load
+
+            for key, getter in self.quick:
+                if key in to_load:
+                    dict_[key] = getter(row)
+            for key, set_callable in self.expire:
+                if key in to_load:
+                    dict_.pop(key, None)
+                    if set_callable:
+                        state.expired_attributes.add(key)
+            for key, populator in self.new:
+                if key in to_load:
+                    populator(state, dict_, row)
+
+        for key, populator in self.eager:
+            if key not in unloaded:
+                populator(state, dict_, row)
+
+        return to_load
@@ -85,6 +85,7 @@ _ORMCOLEXPR = TypeVar("_ORMCOLEXPR", bound=ColumnElement[Any])
 
 class _OrmKnownExecutionOptions(_CoreKnownExecutionOptions, total=False):
     populate_existing: bool
+    readonly_entities: bool
     autoflush: bool
     synchronize_session: SynchronizeSessionArgument
     dml_strategy: DMLStrategyArgument
@@ -1785,7 +1785,9 @@ class _BulkORMUpdate(_BulkUDCompileState, UpdateDMLState):
     ):
         matched_objects = cls._get_matched_objects_on_criteria(
             update_options,
-            session.identity_map.all_states(),
+            session.identity_map._states_for_mapper(
+                update_options._subject_mapper
+            ),
         )
 
         cls._apply_update_set_values_to_objects(
@@ -2114,7 +2116,9 @@ class _BulkORMDelete(_BulkUDCompileState, DeleteDMLState):
     ):
         matched_objects = cls._get_matched_objects_on_criteria(
             update_options,
-            session.identity_map.all_states(),
+            session.identity_map._states_for_mapper(
+                update_options._subject_mapper
+            ),
         )
 
         to_delete = []
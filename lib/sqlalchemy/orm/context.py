@@ -114,6 +114,8 @@ class QueryContext:
         "session",
         "autoflush",
         "populate_existing",
+        "readonly_entities",
+        "readonly_instances",
         "invoke_all_eagers",
         "version_check",
         "refresh_state",
@@ -140,6 +142,7 @@ class QueryContext:
     class default_load_options(Options):
         _only_return_tuples = False
         _populate_existing = False
+        _readonly_entities = False
         _version_check = False
         _invoke_all_eagers = True
         _autoflush = True
@@ -215,6 +218,7 @@ class QueryContext:
 
         self.autoflush = load_options._autoflush
         self.populate_existing = load_options._populate_existing
+        self.readonly_entities = load_options._readonly_entities
         self.invoke_all_eagers = load_options._invoke_all_eagers
         self.version_check = load_options._version_check
         self.refresh_state = load_options._refresh_state
@@ -521,6 +525,7 @@ class _ORMCompileState(_AbstractORMCompileState):
             "_sa_orm_load_options",
             {
                 "populate_existing",
+                "readonly_entities",
                 "autoflush",
                 "yield_per",
                 "identity_token",
@@ -946,7 +946,9 @@ class _DetectKeySwitch(_DependencyProcessor):
         if switchers:
             # if primary key values have actually changed somewhere, perform
             # a linear search through the UOW in search of a parent.
-            for state in uowcommit.session.identity_map.all_states():
+            for state in uowcommit.session.identity_map._states_for_mapper(
+                self.parent
+            ):
                 if not issubclass(state.class_, self.parent.class_):
                     continue
                 dict_ = state.dict
@@ -1203,7 +1205,9 @@ class _ManyToManyDP(_DependencyProcessor):
     def _run_crud(
         self, uowcommit, secondary_insert, secondary_update, secondary_delete
     ):
-        connection = uowcommit.transaction.connection(self.mapper)
+        connection = uowcommit.pipelined(
+            uowcommit.transaction.connection(self.mapper)
+        )
 
         if secondary_delete:
             associationrow = secondary_delete[0]
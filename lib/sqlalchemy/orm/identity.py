@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 from typing import cast
 from typing import Dict
@@ -17,6 +18,7 @@ from typing import NoReturn
 from typing import Optional
 from typing import Set
 from typing import Tuple
+from typing import Type
 from typing import TYPE_CHECKING
 from typing import TypeVar
 import weakref
@@ -26,6 +28,7 @@ from .. import exc as sa_exc
 
 if TYPE_CHECKING:
     from ._typing import _IdentityKeyType
+    from .mapper import Mapper
     from .state import InstanceState
 
 
@@ -38,10 +41,17 @@ class IdentityMap:
     _wr: weakref.ref[IdentityMap]
 
     _dict: Dict[_IdentityKeyType[Any], Any]
+    _by_class: Optional[Dict[Type[Any], Dict[_IdentityKeyType[Any], Any]]]
     _modified: Set[InstanceState[Any]]
 
     def __init__(self) -> None:
         self._dict = {}
+        # the same entries as _dict, grouped by identity class, so that
+        # operations which apply to the objects of one mapper don't need
+        # to scan the whole identity map.  built on first use by
+        # _states_for_mapper(), so that sessions which never make use of it
+        # don't pay for maintaining it
+        self._by_class = None
         self._modified = set()
         self._wr = weakref.ref(self)
 
@@ -51,6 +61,37 @@ class IdentityMap:
     def all_states(self) -> List[InstanceState[Any]]:
         raise NotImplementedError()
 
+    def _states_for_mapper(
+        self, mapper: Mapper[Any]
+    ) -> List[InstanceState[Any]]:
+        """return the states whose identity class is that of the given
+        mapper or of any of its descendant mappers.
+
+        As the identity class is that of the base mapper of an inheritance
+        hierarchy, the states returned may include those of other mappers
+        in the hierarchy; callers filter these as needed.
+
+        """
+        by_class = self._by_class
+        if by_class is None:
+            # assigned before it's populated, so that an object garbage
+            # collected in the meantime is discarded from it; objects
+            # already collected are skipped
+            by_class = self._by_class = defaultdict(dict)
+            for key, state in list(self._dict.items()):
+                if state.obj() is not None:
+                    by_class[key[0]][key] = state
+
+        seen: Set[Type[Any]] = set()
+        result: List[InstanceState[Any]] = []
+        for m in mapper.self_and_descendants:
+            identity_class = m._identity_class
+            if identity_class not in seen:
+                seen.add(identity_class)
+                if identity_class in by_class:
+                    result.extend(by_class[identity_class].values())
+        return result
+
     def contains_state(self, state: InstanceState[Any]) -> bool:
         raise NotImplementedError()
 
@@ -175,6 +216,8 @@ class _WeakInstanceDict(IdentityMap):
             existing = None
 
         self._dict[state.key] = state
+        if self._by_class is not None:
+            self._by_class[state.key[0]][state.key] = state
         self._manage_incoming_state(state)
         return existing
 
@@ -201,6 +244,8 @@ class _WeakInstanceDict(IdentityMap):
                 else:
                     return False
         self._dict[key] = state
+        if self._by_class is not None:
+            self._by_class[key[0]][key] = state
         self._manage_incoming_state(state)
         return True
 
@@ -209,6 +254,8 @@ class _WeakInstanceDict(IdentityMap):
     ) -> None:
         # inlined form of add() called by loading.py
         self._dict[key] = state
+        if self._by_class is not None:
+            self._by_class[key[0]][key] = state
         state._instance_dict = self._wr
 
     def fast_get_state(
@@ -272,6 +319,17 @@ class _WeakInstanceDict(IdentityMap):
         else:
             if st is state:
                 self._dict.pop(key, None)
+                if self._by_class is not None:
+                    self._discard_by_class(key)
+
+    def _discard_by_class(self, key: _IdentityKeyType[Any]) -> None:
+        by_class = self._by_class
+        assert by_class is not None
+        class_states = by_class.get(key[0])
+        if class_states is not None:
+            class_states.pop(key, None)
+            if not class_states:
+                del by_class[key[0]]
 
     def discard(self, state: InstanceState[Any]) -> None:
         self.safe_discard(state)
@@ -288,6 +346,8 @@ class _WeakInstanceDict(IdentityMap):
             else:
                 if st is state:
                     self._dict.pop(key, None)
+                    if self._by_class is not None:
+                        self._discard_by_class(key)
                     self._manage_removed_state(state)
 
 
@@ -32,6 +32,8 @@ from typing import Union
 from . import attributes
 from . import exc as orm_exc
 from . import path_registry
+from ._loading_cy import _InstanceLoader
+from ._loading_cy import _populate_full
 from .base import _DEFER_FOR_STATE
 from .base import _RAISE_FOR_STATE
 from .base import _SET_DEFERRED_EXPIRED
@@ -216,6 +218,8 @@ def instances(
             yield_per = size
 
             context.partials = {}
+            if context.readonly_entities:
+                context.readonly_instances = {}
 
             if yield_per:
                 if _uniquing_is_active:
@@ -804,18 +808,6 @@ def _setup_entity_query(
         column_collection.append(pd)
 
 
-def _warn_for_runid_changed(state):
-    util.warn(
-        "Loading context for %s has changed within a load/refresh "
-        "handler, suggesting a row refresh operation took place. If this "
-        "event handler is expected to be "
-        "emitting row refresh operations within an existing load or refresh "
-        "operation, set restore_load_context=True when establishing the "
-        "listener to ensure the context remains unchanged when the event "
-        "handler completes." % (state_str(state),)
-    )
-
-
 def _instance_processor(
     query_entity,
     mapper,
@@ -831,11 +823,9 @@ def _instance_processor(
     """Produce a mapper level row processor callable
     which processes rows into mapped instances."""
 
-    # note that this method, most of which exists in a closure
-    # called _instance(), resists being broken out, as
-    # attempts to do so tend to add significant function
-    # call overhead.  _instance() is the most
-    # performance-critical section in the whole ORM.
+    # the per-row work is performed by _loading_cy._InstanceLoader, the
+    # most performance-critical section in the whole ORM, which is
+    # compiled when the cython extensions are built.
 
     identity_class = mapper._identity_class
     compile_state = context.compile_state
@@ -967,25 +957,18 @@ def _instance_processor(
             context, query_entity, path, mapper, result, adapter, populators
         )
 
-    propagated_loader_options = context.propagated_loader_options
     load_path = (
         context.compile_state.current_path + path
         if context.compile_state.current_path.path
         else path
     )
 
-    session_identity_map = context.session.identity_map
-
     populate_existing = context.populate_existing or mapper.always_refresh
     load_evt = bool(mapper.class_manager.dispatch.load)
     refresh_evt = bool(mapper.class_manager.dispatch.refresh)
     persistent_evt = bool(context.session.dispatch.loaded_as_persistent)
-    if persistent_evt:
-        loaded_as_persistent = context.session.dispatch.loaded_as_persistent
     instance_state = attributes.instance_state
     instance_dict = attributes.instance_dict
-    session_id = context.session.hash_key
-    runid = context.runid
     identity_token = context.identity_token
 
     version_check = context.version_check
@@ -1018,6 +1001,15 @@ def _instance_processor(
             # loading does not apply
             assert only_load_props is None
 
+            if context.readonly_entities:
+                # the additional SELECT populates the objects already
+                # loaded by locating them in the identity map
+                raise sa_exc.InvalidRequestError(
+                    "The readonly_entities execution option can't be used "
+                    "with selectin polymorphic loading, which is in effect "
+                    f"for {selectin_load_via}"
+                )
+
             if selectin_load_via.is_mapper:
                 _load_supers = []
                 _endmost_mapper = selectin_load_via
@@ -1072,165 +1064,37 @@ def _instance_processor(
     else:
         is_not_primary_key = _none_set.intersection
 
-    def _instance(row):
-        # determine the state that we'll be populating
-        if refresh_identity_key:
-            # fixed state that we're refreshing
-            state = refresh_state
-            instance = state.obj()
-            dict_ = instance_dict(instance)
-            isnew = state.runid != runid
-            currentload = True
-            loaded_instance = False
-        else:
-            # look at the row, see if that identity is in the
-            # session, or we have to create a new one
-            identitykey = (
-                identity_class,
-                primary_key_getter(row),
-                identity_token,
-            )
-
-            instance = session_identity_map.get(identitykey)
-
-            if instance is not None:
-                # existing instance
-                state = instance_state(instance)
-                dict_ = instance_dict(instance)
-
-                isnew = state.runid != runid
-                currentload = not isnew
-                loaded_instance = False
-
-                if version_check and version_id_getter and not currentload:
-                    _validate_version_id(
-                        mapper, state, dict_, row, version_id_getter
-                    )
-
-            else:
-                # create a new instance
-
-                # check for non-NULL values in the primary key columns,
-                # else no entity is returned for the row
-                if is_not_primary_key(identitykey[1]):
-                    return None
-
-                isnew = True
-                currentload = True
-                loaded_instance = True
-
-                instance = mapper.class_manager.new_instance()
-
-                dict_ = instance_dict(instance)
-                state = instance_state(instance)
-                state.key = identitykey
-                state.identity_token = identity_token
-
-                # attach instance to session.
-                state.session_id = session_id
-                session_identity_map._add_unpresent(state, identitykey)
-
-        effective_populate_existing = populate_existing
-        if refresh_state is state:
-            effective_populate_existing = True
-
-        # populate.  this looks at whether this state is new
-        # for this load or was existing, and whether or not this
-        # row is the first row with this identity.
-        if currentload or effective_populate_existing:
-            # full population routines.  Objects here are either
-            # just created, or we are doing a populate_existing
-
-            # be conservative about setting load_path when populate_existing
-            # is in effect; want to maintain options from the original
-            # load.  see test_expire->test_refresh_maintains_deferred_options
-            if isnew and (
-                propagated_loader_options or not effective_populate_existing
-            ):
-                state.load_options = propagated_loader_options
-                state.load_path = load_path
-
-            _populate_full(
-                context,
-                row,
-                state,
-                dict_,
-                isnew,
-                load_path,
-                loaded_instance,
-                effective_populate_existing,
-                populators,
-            )
-
-            if isnew:
-                # state.runid should be equal to context.runid / runid
-                # here, however for event checks we are being more conservative
-                # and checking against existing run id
-                # assert state.runid == runid
-
-                existing_runid = state.runid
-
-                if loaded_instance:
-                    if load_evt:
-                        state.manager.dispatch.load(state, context)
-                        if state.runid != existing_runid:
-                            _warn_for_runid_changed(state)
-                    if persistent_evt:
-                        loaded_as_persistent(context.session, state)
-                        if state.runid != existing_runid:
-                            _warn_for_runid_changed(state)
-                elif refresh_evt:
-                    state.manager.dispatch.refresh(
-                        state, context, only_load_props
-                    )
-                    if state.runid != runid:
-                        _warn_for_runid_changed(state)
-
-                if effective_populate_existing or state.modified:
-                    if refresh_state and only_load_props:
-                        state._commit(dict_, only_load_props)
-                    else:
-                        state._commit_all(dict_, session_identity_map)
-
-            if post_load:
-                post_load.add_state(state, True)
-
-        else:
-            # partial population routines, for objects that were already
-            # in the Session, but a row matches them; apply eager loaders
-            # on existing objects, etc.
-            unloaded = state.unloaded
-            isnew = state not in context.partials
-
-            if not isnew or unloaded or populators["eager"]:
-                # state is having a partial set of its attributes
-                # refreshed.  Populate those attributes,
-                # and add to the "context.partials" collection.
-
-                to_load = _populate_partial(
-                    context,
-                    row,
-                    state,
-                    dict_,
-                    isnew,
-                    load_path,
-                    unloaded,
-                    populators,
-                )
-
-                if isnew:
-                    if refresh_evt:
-                        existing_runid = state.runid
-                        state.manager.dispatch.refresh(state, context, to_load)
-                        if state.runid != existing_runid:
-                            _warn_for_runid_changed(state)
-
-                    state._commit(dict_, to_load)
-
-            if post_load and context.invoke_all_eagers:
-                post_load.add_state(state, False)
-
-        return instance
+    if context.readonly_entities and not refresh_state:
+        _instance = _readonly_instance_processor(
+            mapper,
+            context,
+            populators,
+            load_path,
+            post_load,
+            primary_key_getter,
+            is_not_primary_key,
+            load_evt,
+        )
+    else:
+        _instance = _InstanceLoader(
+            mapper,
+            context,
+            populators,
+            load_path,
+            post_load,
+            refresh_state,
+            refresh_identity_key,
+            only_load_props,
+            getters["primary_key_getter"],
+            version_id_getter if version_check else None,
+            is_not_primary_key,
+            instance_state,
+            instance_dict,
+            populate_existing,
+            load_evt,
+            refresh_evt,
+            persistent_evt,
+        )
 
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
@@ -1261,6 +1125,93 @@ def _instance_processor(
     return _instance
 
 
+def _readonly_instance_processor(
+    mapper,
+    context,
+    populators,
+    load_path,
+    post_load,
+    primary_key_getter,
+    is_not_primary_key,
+    load_evt,
+):
+    """Produce the _instance() callable used for the ``readonly_entities``
+    execution option.
+
+    Instances are created from rows and populated without consulting or
+    adding to the Session's identity map, and without the Session-level
+    events, leaving them in the detached state.   Identities are tracked
+    only among the rows of the current result, so that rows repeating an
+    identity, as when joined eager loading a collection, populate the same
+    instance.
+
+    """
+    identity_class = mapper._identity_class
+    identity_token = context.identity_token
+    propagated_loader_options = context.propagated_loader_options
+    new_instance = mapper.class_manager.new_instance
+    instance_state = attributes.instance_state
+    instance_dict = attributes.instance_dict
+
+    def _instance(row):
+        identitykey = (identity_class, primary_key_getter(row), identity_token)
+
+        readonly_instances = context.readonly_instances
+        instance = readonly_instances.get(identitykey)
+
+        if instance is not None:
+            # a subsequent row for an instance created by this result
+            _populate_full(
+                context,
+                row,
+                instance_state(instance),
+                instance_dict(instance),
+                False,
+                load_path,
+                False,
+                populators["quick"],
+                populators["expire"],
+                populators["new"],
+                populators["existing"],
+            )
+            return instance
+
+        if is_not_primary_key(identitykey[1]):
+            return None
+
+        instance = new_instance()
+        dict_ = instance_dict(instance)
+        state = instance_state(instance)
+        state.key = identitykey
+        state.identity_token = identity_token
+        state.load_options = propagated_loader_options
+        state.load_path = load_path
+        readonly_instances[identitykey] = instance
+
+        _populate_full(
+            context,
+            row,
+            state,
+            dict_,
+            True,
+            load_path,
+            False,
+            populators["quick"],
+            populators["expire"],
+            populators["new"],
+            populators["existing"],
+        )
+
+        if load_evt:
+            state.manager.dispatch.load(state, context)
+        if post_load:
+            post_load.add_state(state, True)
+
+        return instance
+
+    return _instance
+
+
 def _load_subclass_via_in(
     context, path, entity, polymorphic_from, option_entities
 ):
@@ -1333,136 +1284,6 @@ def _load_subclass_via_in(
     return do_load
 
 
-def _populate_full(
-    context,
-    row,
-    state,
-    dict_,
-    isnew,
-    load_path,
-    loaded_instance,
-    populate_existing,
-    populators,
-):
-    if isnew:
-        # first time we are seeing a row with this identity.
-        state.runid = context.runid
-
-        for key, getter in populators["quick"]:
-            dict_[key] = getter(row)
-        if populate_existing:
-            for key, set_callable in populators["expire"]:
-                dict_.pop(key, None)
-                if set_callable:
-                    state.expired_attributes.add(key)
-        else:
-            for key, set_callable in populators["expire"]:
-                if set_callable:
-                    state.expired_attributes.add(key)
-
-        for key, populator in populators["new"]:
-            populator(state, dict_, row)
-
-    elif load_path != state.load_path:
-        # new load path, e.g. object is present in more than one
-        # column position in a series of rows.
-        #
-        # the shallowest path wins.  state.load_path is paired with
-        # state.load_options and the two are replayed together when the
-        # object is later refreshed or unexpired; taking whichever path
-        # happened to be processed last made that replay depend on column
-        # order within the row, row order within the result, and which
-        # eager loader style was in use.  the shallowest path is both
-        # deterministic and the most conservative choice, as a deeper
-        # path matches loader options that were registered for some other
-        # occurrence of this entity.  See #13507.
-        #
-        # only move the path if the current load is the one that stamped
-        # it; the condition here mirrors the one in _instance_processor()
-        # that assigns load_path / load_options together.  when
-        # populate_existing is in effect with no propagated options, the
-        # path in place belongs to a previous load and is left alone.
-        if len(load_path) < len(state.load_path) and (
-            context.propagated_loader_options or not populate_existing
-        ):
-            state.load_path = load_path
-
-        # if we have data, and the data isn't in the dict, OK, let's put
-        # it in.
-        for key, getter in populators["quick"]:
-            if key not in dict_:
-                dict_[key] = getter(row)
-
-        # otherwise treat like an "already seen" row
-        for key, populator in populators["existing"]:
-            populator(state, dict_, row)
-            # TODO:  allow "existing" populator to know this is
-            # a new path for the state:
-            # populator(state, dict_, row, new_path=True)
-
-    else:
-        # have already seen rows with this identity in this same path.
-        for key, populator in populators["existing"]:
-            populator(state, dict_, row)
-
-            # TODO: same path
-            # populator(state, dict_, row, new_path=False)
-
-
-def _populate_partial(
-    context, row, state, dict_, isnew, load_path, unloaded, populators
-):
-    if not isnew:
-        if unloaded:
-            # extra pass, see #8166
-            for key, getter in populators["quick"]:
-                if key in unloaded:
-                    dict_[key] = getter(row)
-
-        to_load = context.partials[state]
-        for key, populator in populators["existing"]:
-            if key in to_load:
-                populator(state, dict_, row)
-    else:
-        to_load = unloaded
-        context.partials[state] = to_load
-
-        for key, getter in populators["quick"]:
-            if key in to_load:
-                dict_[key] = getter(row)
-        for key, set_callable in populators["expire"]:
-            if key in to_load:
-                dict_.pop(key, None)
-                if set_callable:
-                    state.expired_attributes.add(key)
-        for key, populator in populators["new"]:
-            if key in to_load:
-                populator(state, dict_, row)
-
-    for key, populator in populators["eager"]:
-        if key not in unloaded:
-            populator(state, dict_, row)
-
-    return to_load
-
-
-def _validate_version_id(mapper, state, dict_, row, getter):
-    if mapper._get_state_attr_by_column(
-        state, dict_, mapper.version_id_col
-    ) != getter(row):
-        raise orm_exc.StaleDataError(
-            "Instance '%s' has version id '%s' which "
-            "does not match database-loaded version id '%s'."
-            % (
-                state_str(state),
-                mapper._get_state_attr_by_column(
-                    state, dict_, mapper.version_id_col
-                ),
-                getter(row),
-            )
-        )
-
-
 def _decorate_polymorphic_switch(
     instance_fn,
     context,
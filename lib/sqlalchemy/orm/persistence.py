@@ -792,7 +792,7 @@ def _emit_update_statements(
             rec[7],  # has all pks
         ),
     ):
-        rows = 0
+        results = []
         records = list(records)
 
         statement = cached_stmt
@@ -871,7 +871,7 @@ def _emit_update_statements(
                         True,
                         c.returned_defaults,
                     )
-                rows += c.rowcount
+                results.append(c)
                 check_rowcount = enable_check_rowcount and assert_singlerow
         else:
             if not allow_executemany:
@@ -904,7 +904,7 @@ def _emit_update_statements(
                             True,
                             c.returned_defaults,
                         )
-                    rows += c.rowcount
+                    results.append(c)
             else:
                 multiparams = [rec[2] for rec in records]
 
@@ -917,7 +917,7 @@ def _emit_update_statements(
                     statement, multiparams, execution_options=execution_options
                 )
 
-                rows += c.rowcount
+                results.append(c)
 
                 for (
                     state,
@@ -948,12 +948,11 @@ def _emit_update_statements(
                         )
 
         if check_rowcount:
-            if rows != len(records):
-                raise orm_exc.StaleDataError(
-                    "UPDATE statement on table '%s' expected to "
-                    "update %d row(s); %d were matched."
-                    % (table.description, len(records), rows)
-                )
+            check = _check_update_rowcount(table, records, results)
+            if uowtransaction is not None:
+                uowtransaction.check_rowcount(check)
+            else:
+                check()
 
         elif needs_version_id:
             util.warn(
@@ -1334,7 +1333,7 @@ def _emit_post_update_statements(
         update,
         lambda rec: (rec[3], set(rec[4])),  # connection  # parameter keys
     ):
-        rows = 0
+        results = []
 
         records = list(records)
         connection = key[0]
@@ -1362,7 +1361,7 @@ def _emit_post_update_statements(
                     c,
                     c.context.compiled_parameters[0],
                 )
-                rows += c.rowcount
+                results.append(c)
         else:
             multiparams = [
                 params
@@ -1377,7 +1376,7 @@ def _emit_post_update_statements(
                 statement, multiparams, execution_options=execution_options
             )
 
-            rows += c.rowcount
+            results.append(c)
             for i, (
                 state,
                 state_dict,
@@ -1396,12 +1395,9 @@ def _emit_post_update_statements(
                 )
 
         if check_rowcount:
-            if rows != len(records):
-                raise orm_exc.StaleDataError(
-                    "UPDATE statement on table '%s' expected to "
-                    "update %d row(s); %d were matched."
-                    % (table.description, len(records), rows)
-                )
+            uowtransaction.check_rowcount(
+                _check_update_rowcount(table, records, results)
+            )
 
         elif needs_version_id:
             util.warn(
@@ -1445,8 +1441,7 @@ def _emit_delete_statements(
         del_objects = [params for params, connection in recs]
 
         execution_options = {"compiled_cache": base_mapper._compiled_cache}
-        expected = len(del_objects)
-        rows_matched = -1
+        results = None
         only_warn = False
 
         if (
@@ -1454,14 +1449,14 @@ def _emit_delete_statements(
             and not connection.dialect.supports_sane_multi_rowcount
         ):
             if connection.dialect.supports_sane_rowcount:
-                rows_matched = 0
+                results = []
                 # execute deletes individually so that versioned
                 # rows can be verified
                 for params in del_objects:
                     c = connection.execute(
                         statement, params, execution_options=execution_options
                     )
-                    rows_matched += c.rowcount
+                    results.append(c)
             else:
                 util.warn(
                     "Dialect %s does not support deleted rowcount "
@@ -1479,11 +1474,36 @@ def _emit_delete_statements(
             if not need_version_id:
                 only_warn = True
 
-            rows_matched = c.rowcount
+            results = [c]
+
+        if results is not None and base_mapper.confirm_deleted_rows:
+            uowtransaction.check_rowcount(
+                _check_delete_rowcount(
+                    connection, table, del_objects, results, only_warn
+                )
+            )
+
+
+def _check_update_rowcount(table, records, results):
+    def check():
+        rows = sum(c.rowcount for c in results)
+        if rows != len(records):
+            raise orm_exc.StaleDataError(
+                "UPDATE statement on table '%s' expected to "
+                "update %d row(s); %d were matched."
+                % (table.description, len(records), rows)
+            )
+
+    return check
+
+
+def _check_delete_rowcount(connection, table, del_objects, results, only_warn):
+    def check():
+        expected = len(del_objects)
+        rows_matched = sum(c.rowcount for c in results)
 
         if (
-            base_mapper.confirm_deleted_rows
-            and rows_matched > -1
+            rows_matched > -1
             and expected != rows_matched
             and (
                 connection.dialect.supports_sane_multi_rowcount
@@ -1509,6 +1529,8 @@ def _emit_delete_statements(
                     % (table.description, expected, rows_matched)
                 )
 
+    return check
+
 
 def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
     """finalize state on states that have been inserted or updated,
@@ -1758,12 +1780,16 @@ def _connections_for_states(base_mapper, uowtransaction, states):
     if uowtransaction.session.connection_callable:
         connection_callable = uowtransaction.session.connection_callable
     else:
-        connection = uowtransaction.transaction.connection(base_mapper)
+        connection = uowtransaction.pipelined(
+            uowtransaction.transaction.connection(base_mapper)
+        )
         connection_callable = None
 
     for state in _sort_states(base_mapper, states):
         if connection_callable:
-            connection = connection_callable(base_mapper, state.obj())
+            connection = uowtransaction.pipelined(
+                connection_callable(base_mapper, state.obj())
+            )
 
         mapper = state.manager.mapper
 
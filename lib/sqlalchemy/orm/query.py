@@ -101,6 +101,8 @@ from ..util.typing import TypeVarTuple
 from ..util.typing import Unpack
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from ._typing import _EntityType
     from ._typing import _ExternalEntityType
     from ._typing import _InternalEntityType
@@ -1731,11 +1733,16 @@ class Query(
         max_row_buffer: int = ...,
         yield_per: int = ...,
         driver_column_names: bool = ...,
+        lazy_row_processing: bool = ...,
+        result_processing_executor: Executor = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_latency: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
+        readonly_entities: bool = False,
         autoflush: bool = False,
         preserve_rowcount: bool = False,
+        bulk_load: bool = False,
         **opt: Any,
     ) -> Self: ...
 
@@ -1753,6 +1760,10 @@ class Query(
         ``populate_existing=True`` - equivalent to using
         :meth:`_orm.Query.populate_existing`
 
+        ``readonly_entities=True`` - load objects in the detached state,
+        without involving the identity map; see
+        :ref:`orm_queryguide_readonly_entities`
+
         ``autoflush=True|False`` - equivalent to using
         :meth:`_orm.Query.autoflush`
 
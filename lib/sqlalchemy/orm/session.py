@@ -1511,6 +1511,8 @@ class Session(_SessionClassMethods, EventTarget):
     enable_baked_queries: bool
     twophase: bool
     join_transaction_mode: JoinTransactionMode
+    pipeline_flush: bool
+    batch_lazyload: bool
     execution_options: _ExecuteOptions = util.EMPTY_DICT
     _query_cls: Type[Query[Any]]
     _close_state: _SessionCloseState
@@ -1532,6 +1534,8 @@ class Session(_SessionClassMethods, EventTarget):
         join_transaction_mode: JoinTransactionMode = "conditional_savepoint",
         close_resets_only: Union[bool, _NoArg] = _NoArg.NO_ARG,
         execution_options: OrmExecuteOptionsParameter = util.EMPTY_DICT,
+        pipeline_flush: bool = False,
+        batch_lazyload: bool = False,
     ):
         r"""Construct a new :class:`_orm.Session`.
 
@@ -1563,6 +1567,20 @@ class Session(_SessionClassMethods, EventTarget):
 
                 :ref:`session_autobegin_disable`
 
+        :param batch_lazyload: When ``True``, a lazy load of a relationship
+           which emits a SELECT, triggered by accessing the attribute on an
+           object, also loads the same relationship for all other objects in
+           the identity map that don't yet have it loaded, in the manner of
+           :func:`_orm.selectinload`.  This avoids the "N plus one" problem
+           for objects loaded by different queries, where eager loading
+           can't be indicated ahead of time.
+
+           .. versionadded:: 2.1
+
+           .. seealso::
+
+                :ref:`session_batch_lazyload`
+
         :param bind: An optional :class:`_engine.Engine` or
            :class:`_engine.Connection` to
            which this ``Session`` should be bound. When specified, all SQL
@@ -1671,6 +1689,20 @@ class Session(_SessionClassMethods, EventTarget):
            :class:`.Session` dictionary will be local to that
            :class:`.Session`.
 
+        :param pipeline_flush: When ``True``, the INSERT, UPDATE and DELETE
+           statements emitted by :meth:`_orm.Session.flush` are sent within
+           :meth:`_engine.Connection.pipeline`, so that a flush of many
+           objects costs fewer round trips to the database, on dialects
+           which support it.  Checks of the number of rows matched, which
+           raise :class:`.StaleDataError`, take place at the end of the
+           flush rather than after each statement.
+
+           .. versionadded:: 2.1
+
+           .. seealso::
+
+                :ref:`session_pipeline_flush`
+
         :param query_cls:  Class which should be used to create new Query
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`_query.Query`.
@@ -1831,6 +1863,8 @@ class Session(_SessionClassMethods, EventTarget):
                 f'"{join_transaction_mode}"'
             )
         self.join_transaction_mode = join_transaction_mode
+        self.pipeline_flush = pipeline_flush
+        self.batch_lazyload = batch_lazyload
 
         self.twophase = twophase
         self._query_cls = query_cls if query_cls else query.Query
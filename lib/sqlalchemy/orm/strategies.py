@@ -55,6 +55,7 @@ from .. import inspect
 from .. import log
 from .. import sql
 from .. import util
+from ..sql import operators
 from ..sql import util as sql_util
 from ..sql import visitors
 from ..sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
@@ -1003,6 +1004,19 @@ class _LazyLoader(
             ):
                 return LoaderCallableStatus.PASSIVE_NO_RESULT
 
+        if (
+            session.batch_lazyload
+            and passive == PASSIVE_OFF
+            and loadopt is None
+            and not extra_options
+            and alternate_effective_path is None
+            and not pending
+            and not self._raise_on_sql
+        ):
+            self._emit_batch_lazyload(session, state, execution_options)
+            if self.key in state.dict:
+                return LoaderCallableStatus.ATTR_WAS_SET
+
         return self._emit_lazyload(
             session,
             state,
@@ -1030,6 +1044,66 @@ class _LazyLoader(
             for pk in self.mapper.primary_key
         ]
 
+    def _emit_batch_lazyload(self, session, state, execution_options):
+        """Load this attribute for the given state along with all other
+        persistent objects in the session that have it unloaded, using the
+        "selectin" loader for the relationship.
+
+        Used when :paramref:`_orm.Session.batch_lazyload` is set.
+
+        """
+        key = self.key
+        prop = self.parent_property
+        load_options = state.load_options
+        load_path = state.load_path
+        identity_token = state.identity_token
+
+        # other objects are loaded along with this one only when the
+        # same statement would be emitted for them, that is they have
+        # the same loader options, and don't have an instance-level
+        # loader callable for the attribute set up by a lazyload() option.
+        # objects that were garbage collected but not yet discarded from
+        # the identity map have an empty dict and are skipped
+        states = [
+            (sibling, False)
+            for sibling in session.identity_map._states_for_mapper(self.parent)
+            if sibling.obj() is not None
+            and key not in sibling.dict
+            and key not in sibling.callables
+            and sibling.manager.mapper._props.get(key) is prop
+            and sibling.identity_token == identity_token
+            and sibling.load_options == load_options
+            and (not load_options or sibling.load_path == load_path)
+        ]
+
+        if load_options:
+            effective_path = load_path[prop]
+        else:
+            effective_path = state.mapper._path_registry[prop]
+
+        if identity_token is not None:
+            execution_options = util.EMPTY_DICT.merge_with(
+                execution_options, {"identity_token": identity_token}
+            )
+
+        # the dialect limits the number of keys loaded per SELECT, as it
+        # does for a selectinload() following the parent query
+        dialect = session.get_bind(self.mapper).dialect
+
+        strategy = prop._get_strategy((("lazy", "selectin"),))
+        strategy._load_states(
+            session,
+            states,
+            strategy.entity,
+            load_options,
+            effective_path,
+            None,
+            execution_options,
+            dialect,
+            False,
+            False,
+        )
+
     @util.preload_module("sqlalchemy.orm.strategy_options")
     def _emit_lazyload(
         self,
@@ -3186,6 +3260,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
             loadopt,
             recursion_depth,
             execution_options,
+            getattr(result, "dialect", None),
         )
 
     def _load_for_path(
@@ -3198,10 +3273,101 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
         loadopt,
         recursion_depth,
         execution_options,
+        dialect,
     ):
         if load_only and self.key not in load_only:
             return
 
+        # a test which exercises what these comments talk about is
+        # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
+        #
+        # effective_entity above is given to us in terms of the cached
+        # statement, namely this one:
+        orig_query = context.compile_state.select_statement
+
+        # the actual statement that was requested is this one:
+        #  context_query = context.user_passed_query
+        #
+        # that's not the cached one, however.  So while it is of the identical
+        # structure, if it has entities like AliasedInsp, which we get from
+        # aliased() or with_polymorphic(), the AliasedInsp will likely be a
+        # different object identity each time, and will not match up
+        # hashing-wise to the corresponding AliasedInsp that's in the
+        # cached query, meaning it won't match on paths and loader lookups
+        # and loaders like this one will be skipped if it is used in options.
+        #
+        # as it turns out, standard loader options like selectinload(),
+        # lazyload() that have a path need
+        # to come from the cached query so that the AliasedInsp etc. objects
+        # that are in the query line up with the object that's in the path
+        # of the strategy object. however other options like
+        # with_loader_criteria() that doesn't have a path (has a fixed entity)
+        # and needs to have access to the latest closure state in order to
+        # be correct, we need to use the uncached one.
+        #
+        # as of #8399 we let the loader option itself figure out what it
+        # wants to do given cached and uncached version of itself.
+
+        effective_path = path[self.parent_property]
+
+        if orig_query is context.user_passed_query:
+            new_options = orig_query._with_options
+        else:
+            cached_options = orig_query._with_options
+            uncached_options = context.user_passed_query._with_options
+
+            # propagate compile state options from the original query,
+            # updating their "extra_criteria" as necessary.
+            # note this will create a different cache key than
+            # "orig" options if extra_criteria is present, because the copy
+            # of extra_criteria will have different boundparam than that of
+            # the QueryableAttribute in the path
+            new_options = [
+                orig_opt._adapt_cached_option_to_uncached_option(
+                    context, uncached_opt
+                )
+                for orig_opt, uncached_opt in zip(
+                    cached_options, uncached_options
+                )
+            ]
+
+        if loadopt and loadopt._extra_criteria:
+            new_options += (
+                orm_util.LoaderCriteriaOption(
+                    effective_entity,
+                    loadopt._generate_extra_criteria(context),
+                ),
+            )
+
+        if recursion_depth is not None:
+            effective_path = effective_path._truncate_recursive()
+
+        self._load_states(
+            context.session,
+            states,
+            effective_entity,
+            new_options,
+            effective_path,
+            loadopt,
+            execution_options,
+            dialect,
+            context.populate_existing,
+            context.readonly_entities,
+        )
+
+    def _load_states(
+        self,
+        session,
+        states,
+        effective_entity,
+        options,
+        effective_path,
+        loadopt,
+        execution_options,
+        dialect,
+        populate_existing,
+        readonly_entities,
+    ):
         query_info = self._query_info
 
         if query_info.load_only_child:
@@ -3302,77 +3468,33 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
                 )
             )
 
-        q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
-
-        # a test which exercises what these comments talk about is
-        # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
-        #
-        # effective_entity above is given to us in terms of the cached
-        # statement, namely this one:
-        orig_query = context.compile_state.select_statement
-
-        # the actual statement that was requested is this one:
-        #  context_query = context.user_passed_query
-        #
-        # that's not the cached one, however.  So while it is of the identical
-        # structure, if it has entities like AliasedInsp, which we get from
-        # aliased() or with_polymorphic(), the AliasedInsp will likely be a
-        # different object identity each time, and will not match up
-        # hashing-wise to the corresponding AliasedInsp that's in the
-        # cached query, meaning it won't match on paths and loader lookups
-        # and loaders like this one will be skipped if it is used in options.
-        #
-        # as it turns out, standard loader options like selectinload(),
-        # lazyload() that have a path need
-        # to come from the cached query so that the AliasedInsp etc. objects
-        # that are in the query line up with the object that's in the path
-        # of the strategy object. however other options like
-        # with_loader_criteria() that doesn't have a path (has a fixed entity)
-        # and needs to have access to the latest closure state in order to
-        # be correct, we need to use the uncached one.
-        #
-        # as of #8399 we let the loader option itself figure out what it
-        # wants to do given cached and uncached version of itself.
-
-        effective_path = path[self.parent_property]
-
-        if orig_query is context.user_passed_query:
-            new_options = orig_query._with_options
-        else:
-            cached_options = orig_query._with_options
-            uncached_options = context.user_passed_query._with_options
-
-            # propagate compile state options from the original query,
-            # updating their "extra_criteria" as necessary.
-            # note this will create a different cache key than
-            # "orig" options if extra_criteria is present, because the copy
-            # of extra_criteria will have different boundparam than that of
-            # the QueryableAttribute in the path
-            new_options = [
-                orig_opt._adapt_cached_option_to_uncached_option(
-                    context, uncached_opt
+        # on backends that accept an array as a single bound parameter, a
+        # single column key is compared using "= ANY (array)" rather than an
+        # expanding IN, which also frees the chunk size from the dialect's
+        # limit on the number of bound parameters
+        use_array = (
+            query_info.zero_idx
+            and dialect is not None
+            and dialect.supports_in_array_parameter
+        )
+        if use_array:
+            q = q.filter(
+                in_expr.comparator.operate(
+                    operators.in_op,
+                    sql.bindparam("primary_keys"),
+                    in_as_array=True,
                 )
-                for orig_opt, uncached_opt in zip(
-                    cached_options, uncached_options
-                )
-            ]
-
-        if loadopt and loadopt._extra_criteria:
-            new_options += (
-                orm_util.LoaderCriteriaOption(
-                    effective_entity,
-                    loadopt._generate_extra_criteria(context),
-                ),
             )
+        else:
+            q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
 
-        if recursion_depth is not None:
-            effective_path = effective_path._truncate_recursive()
-
-        q = q.options(*new_options)
+        q = q.options(*options)
 
         q = q._update_compile_options({"_current_path": effective_path})
-        if context.populate_existing:
+        if populate_existing:
             q = q.execution_options(populate_existing=True)
+        if readonly_entities:
+            q = q.execution_options(readonly_entities=True)
 
         if self.parent_property.order_by:
             if not query_info.load_with_join:
@@ -3395,6 +3517,14 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
                 )
 
         chunksize = self._set_chunksize(loadopt)
+        if dialect is not None and not use_array:
+            chunksize = min(
+                chunksize,
+                max(
+                    dialect.insertmanyvalues_max_parameters // query_info.n_pk,
+                    1,
+                ),
+            )
 
         if query_info.load_only_child:
             self._load_via_child(
@@ -3402,7 +3532,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
                 none_states,
                 query_info,
                 q,
-                context,
+                session,
                 execution_options,
                 chunksize,
             )
@@ -3411,7 +3541,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
                 our_states,
                 query_info,
                 q,
-                context,
+                session,
                 execution_options,
                 chunksize,
             )
@@ -3422,7 +3552,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
         none_states,
         query_info,
         q,
-        context,
+        session,
         execution_options,
         chunksize,
     ):
@@ -3437,7 +3567,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
             chunk = our_keys[0:chunksize]
             our_keys = our_keys[chunksize:]
             primary_keys = [key[0] if zero_idx else key for key in chunk]
-            result = context.session.execute(
+            result = session.execute(
                 q,
                 params={"primary_keys": primary_keys},
                 execution_options=execution_options,
@@ -3474,7 +3604,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
             state.get_impl(self.key).set_committed_value(state, dict_, None)
 
     def _load_via_parent(
-        self, our_states, query_info, q, context, execution_options, chunksize
+        self, our_states, query_info, q, session, execution_options, chunksize
     ):
         uselist = self.uselist
         n_pk = query_info.n_pk
@@ -3489,7 +3619,7 @@ class _SelectInLoader(_PostLoader, util.MemoizedSlots):
                 item[0][0] if zero_idx else item[0] for item in chunk
             ]
 
-            result = context.session.execute(
+            result = session.execute(
                 q,
                 params={"primary_keys": primary_keys},
                 execution_options=execution_options,
@@ -403,7 +403,12 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
 
         :param chunksize: optional int; when set to a positive non-zero
          integer, the keys from the IN statement will be chunked relative
-         to the passed parameter
+         to the passed parameter.  The chunk size, whether given or the
+         default of 500, is limited so that the number of bound parameters
+         in a single statement does not exceed the limit of the dialect in
+         use; on PostgreSQL, single-column keys are instead sent as one
+         array parameter using ``= ANY (...)``, so that larger chunk sizes
+         may be used without regard to this limit.
 
          .. versionadded:: 2.1.0b3
 
@@ -17,8 +17,11 @@ organizes them in order of dependency, and executes.
 
 from __future__ import annotations
 
+import contextlib
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Optional
 from typing import Set
 from typing import TYPE_CHECKING
@@ -32,6 +35,7 @@ from ..util import topological
 
 if TYPE_CHECKING:
     from .dependency import _DependencyProcessor
+    from ..engine import Connection
     from .interfaces import MapperProperty
     from .mapper import Mapper
     from .session import Session
@@ -207,6 +211,14 @@ class UOWTransaction:
         # columns which should be included in the update.
         self.post_update_states = util.defaultdict(lambda: (set(), set()))
 
+        # when Session.pipeline_flush is set, an ExitStack holding the
+        # Connection.pipeline() blocks entered during the flush, the
+        # connections in pipeline mode, and the rowcount checks deferred
+        # until the end of the flush
+        self._pipelines: Optional[contextlib.ExitStack] = None
+        self._pipelined_connections: Set[Connection] = set()
+        self._deferred_checks: List[Callable[[], None]] = []
+
     @property
     def has_work(self):
         return bool(self.states)
@@ -439,7 +451,46 @@ class UOWTransaction:
             a for a in self.postsort_actions.values() if not a.disabled
         }.difference(cycles)
 
+    def pipelined(self, connection: Connection) -> Connection:
+        """Place the given :class:`_engine.Connection` in pipeline mode for
+        the remainder of the flush, if :paramref:`.Session.pipeline_flush`
+        is set."""
+
+        if (
+            self._pipelines is not None
+            and connection not in self._pipelined_connections
+        ):
+            self._pipelined_connections.add(connection)
+            self._pipelines.enter_context(connection.pipeline())
+        return connection
+
+    def check_rowcount(self, check: Callable[[], None]) -> None:
+        """Run the given rowcount check, or defer it until the end of the
+        flush if connections are in pipeline mode."""
+
+        if self._pipelines is not None:
+            self._deferred_checks.append(check)
+        else:
+            check()
+
     def execute(self) -> None:
+        if self.session.pipeline_flush:
+            with contextlib.ExitStack() as stack:
+                self._pipelines = stack
+                try:
+                    self._execute()
+
+                    # accessing rowcount receives all pending results
+                    for check in self._deferred_checks:
+                        check()
+                finally:
+                    self._pipelines = None
+                    self._pipelined_connections.clear()
+                    self._deferred_checks.clear()
+        else:
+            self._execute()
+
+    def _execute(self) -> None:
         postsort_actions = self._generate_actions()
 
         postsort_actions = sorted(
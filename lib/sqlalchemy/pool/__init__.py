@@ -35,7 +35,12 @@ from .base import reset_none as reset_none
 from .base import reset_rollback as reset_rollback
 from .impl import AssertionPool as AssertionPool
 from .impl import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+from .impl import ConcurrentQueuePool as ConcurrentQueuePool
+from .impl import MultiHostPool as MultiHostPool
 from .impl import NullPool as NullPool
 from .impl import QueuePool as QueuePool
 from .impl import SingletonThreadPool as SingletonThreadPool
 from .impl import StaticPool as StaticPool
+from .metrics import HistogramSnapshot as HistogramSnapshot
+from .metrics import PoolMetrics as PoolMetrics
+from .metrics import PoolMetricsSnapshot as PoolMetricsSnapshot
@@ -23,6 +23,7 @@ from typing import Deque
 from typing import Dict
 from typing import List
 from typing import Literal
+from typing import Mapping
 from typing import Optional
 from typing import Protocol
 from typing import Tuple
@@ -44,6 +45,7 @@ if TYPE_CHECKING:
     from ..event import _ListenerFnType
     from ..event import dispatcher
     from ..sql._typing import _InfoType
+    from .metrics import PoolMetrics
 
 
 @dataclasses.dataclass(frozen=True)
@@ -164,6 +166,7 @@ class Pool(log.Identified, event.EventTarget):
     _creator_arg: Union[_CreatorFnType, _CreatorWRecFnType]
     _invoke_creator: _CreatorWRecFnType
     _invalidate_time: float
+    _disconnect_time: float
 
     def __init__(
         self,
@@ -175,6 +178,8 @@ class Pool(log.Identified, event.EventTarget):
         events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
         dialect: Optional[Union[_ConnDialect, Dialect]] = None,
         pre_ping: bool = False,
+        pre_ping_interval: Optional[float] = None,
+        metrics: Optional[PoolMetrics] = None,
         _dispatch: Optional[_DispatchCommon[Pool]] = None,
     ):
         """
@@ -270,6 +275,32 @@ class Pool(log.Identified, event.EventTarget):
          invalidated.     Requires that a dialect is passed as well to
          interpret the disconnection error.
 
+        :param pre_ping_interval: when used with
+         :paramref:`_pool.Pool.pre_ping`, a number of seconds within which
+         a connection that was last returned to the pool without error is
+         trusted to be alive, so that the "ping" is skipped upon checkout.
+         Connections which have been idle for longer than this interval are
+         pinged as usual, as are all connections returned before a
+         disconnect was most recently detected within the pool.  Defaults to
+         ``None``, meaning every checkout is pinged.
+
+         .. versionadded:: 2.1
+
+         .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+        :param metrics: a :class:`.PoolMetrics` object which will collect
+         statistics such as checkout wait times, connection hold times and
+         timeout counts for this pool.  Defaults to ``None``, meaning no
+         statistics are collected.
+
+         .. versionadded:: 2.1
+
+         .. seealso::
+
+            :ref:`pool_metrics`
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -280,7 +311,10 @@ class Pool(log.Identified, event.EventTarget):
         self._creator = creator
         self._recycle = recycle
         self._invalidate_time = 0
+        self._disconnect_time = 0
         self._pre_ping = pre_ping
+        self._pre_ping_interval = pre_ping_interval
+        self._metrics = metrics
         self._reset_on_return = util.parse_user_argument_for_enum(
             reset_on_return,
             {
@@ -405,6 +439,7 @@ class Pool(log.Identified, event.EventTarget):
         rec = getattr(connection, "_connection_record", None)
         if not rec or self._invalidate_time < rec.starttime:
             self._invalidate_time = time.time()
+        self._disconnect_time = time.time()
         if _checkin and getattr(connection, "is_valid", False):
             connection.invalidate(exception)
 
@@ -445,6 +480,18 @@ class Pool(log.Identified, event.EventTarget):
         """
         return _ConnectionFairy._checkout(self)
 
+    def _connect_w_options(
+        self, options: Mapping[str, Any]
+    ) -> PoolProxiedConnection:
+        """Return a DBAPI connection from the pool, given the execution
+        options of the :class:`_engine.Engine` requesting it.
+
+        Pools which support options that affect checkout, such as
+        ``checkout_priority``, override this method.
+
+        """
+        return self.connect()
+
     def _return_conn(self, record: ConnectionPoolEntry) -> None:
         """Given a _ConnectionRecord, return it to the :class:`_pool.Pool`.
 
@@ -459,6 +506,12 @@ class Pool(log.Identified, event.EventTarget):
 
         raise NotImplementedError()
 
+    def _do_get_w_priority(self, priority: int) -> ConnectionPoolEntry:
+        """Implementation for prioritized checkouts, supplied by
+        subclasses which support them."""
+
+        return self._do_get()
+
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
         """Implementation for :meth:`return_conn`, supplied by subclasses."""
 
@@ -669,7 +722,12 @@ class _ConnectionRecord(ConnectionPoolEntry):
 
         self.__pool = pool
         if connect:
-            self.__connect()
+            if pool._metrics is not None:
+                start = time.perf_counter()
+                self.__connect()
+                self._create_connect_time = time.perf_counter() - start
+            else:
+                self.__connect()
         self.finalize_callback = deque()
 
     dbapi_connection: Optional[DBAPIConnection]
@@ -693,6 +751,13 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return self.dbapi_connection
 
     _soft_invalidate_time: float = 0
+    _verified_time: float = 0
+    _checkout_time: float = 0
+
+    # time spent connecting when the record was created, when metrics
+    # are collected; excluded from the checkout wait of the checkout
+    # which created it
+    _create_connect_time: float = 0
 
     @util.ro_memoized_property
     def info(self) -> _InfoType:
@@ -703,11 +768,32 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return {}
 
     @classmethod
-    def checkout(cls, pool: Pool) -> _ConnectionFairy:
+    def checkout(cls, pool: Pool, priority: int = 0) -> _ConnectionFairy:
+        metrics = pool._metrics
+        if metrics is not None:
+            start = time.perf_counter()
+        try:
+            if priority:
+                pool_rec = pool._do_get_w_priority(priority)
+            else:
+                pool_rec = pool._do_get()
+        except exc.TimeoutError:
+            if metrics is not None:
+                metrics._record_timeout(time.perf_counter() - start)
+            raise
+
         if TYPE_CHECKING:
-            rec = cast(_ConnectionRecord, pool._do_get())
+            rec = cast(_ConnectionRecord, pool_rec)
         else:
-            rec = pool._do_get()
+            rec = pool_rec
+
+        if metrics is not None:
+            # a record created by _do_get() connected within the
+            # measured time; that's recorded as connect_time instead
+            wait = time.perf_counter() - start
+            if rec._create_connect_time:
+                wait -= rec._create_connect_time
+                rec._create_connect_time = 0
 
         try:
             dbapi_connection = rec.get_connection()
@@ -718,6 +804,10 @@ class _ConnectionRecord(ConnectionPoolEntry):
             # not reached, for code linters only
             raise
 
+        if metrics is not None:
+            rec._checkout_time = time.perf_counter()
+            metrics._record_checkout(wait)
+
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(pool, dbapi_connection, rec, echo)
 
@@ -767,6 +857,15 @@ class _ConnectionRecord(ConnectionPoolEntry):
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
 
+        if connection is not None and pool._pre_ping_interval is not None:
+            self._verified_time = time.time()
+
+        if pool._metrics is not None and self._checkout_time:
+            pool._metrics._record_checkin(
+                time.perf_counter() - self._checkout_time
+            )
+            self._checkout_time = 0
+
         pool._return_conn(self)
 
     @property
@@ -787,6 +886,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # already invalidated
         if self.dbapi_connection is None:
             return
+        if self.__pool._metrics is not None:
+            self.__pool._metrics._record_invalidate()
         if soft:
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
@@ -811,6 +912,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         if soft:
             self._soft_invalidate_time = time.time()
         else:
+            if e is not None:
+                self.__pool._disconnect_time = time.time()
             self.__close(terminate=True)
             self.dbapi_connection = None
 
@@ -858,6 +961,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
             recycle = True
 
         if recycle:
+            if self.__pool._metrics is not None:
+                self.__pool._metrics._record_recycle()
             self.__close(terminate=True)
             self.info.clear()
 
@@ -866,6 +971,67 @@ class _ConnectionRecord(ConnectionPoolEntry):
         assert self.dbapi_connection is not None
         return self.dbapi_connection
 
+    def _maintain_idle(self, recycle_margin: float, ping: bool) -> None:
+        """Recycle or ping this record while it is idle in the pool.
+
+        Used by the pool maintenance worker so that the work of
+        reconnecting is done before the record is next checked out.
+        Records whose age will exceed the pool's recycle time within
+        ``recycle_margin`` seconds are recycled ahead of time.
+
+        """
+        pool = self.__pool
+
+        if self.dbapi_connection is not None:
+            if (
+                pool._recycle > -1
+                and time.time() - self.starttime
+                > pool._recycle - recycle_margin
+            ):
+                pool.logger.info(
+                    "Connection %r approaching recycle timeout; "
+                    "recycling in background",
+                    self.dbapi_connection,
+                )
+                if pool._metrics is not None:
+                    pool._metrics._record_recycle()
+                self.__close(terminate=True)
+                self.info.clear()
+            elif (
+                ping
+                and not self.fresh
+                and not self._is_hard_or_soft_invalidated()
+            ):
+                pool.logger.debug(
+                    "Pool maintenance ping on connection %s",
+                    self.dbapi_connection,
+                )
+                if pool._dialect._do_ping_w_event(self.dbapi_connection):
+                    self._verified_time = time.time()
+                else:
+                    pool.logger.info(
+                        "Pool maintenance ping on connection %s failed, "
+                        "reconnecting",
+                        self.dbapi_connection,
+                    )
+                    self.invalidate()
+
+        # reconnects if the connection was closed above, or was
+        # otherwise invalidated while idle
+        self.get_connection()
+
+    def _recently_verified(self) -> bool:
+        """Return True if this record's connection was known to be alive
+        within the pool's ``pre_ping_interval``, and no disconnect has been
+        detected in the pool since."""
+
+        pool = self.__pool
+        return (
+            pool._pre_ping_interval is not None
+            and self._verified_time > pool._disconnect_time
+            and time.time() - self._verified_time < pool._pre_ping_interval
+        )
+
     def _is_hard_or_soft_invalidated(self) -> bool:
         return (
             self.dbapi_connection is None
@@ -891,7 +1057,12 @@ class _ConnectionRecord(ConnectionPoolEntry):
         self.dbapi_connection = None
         try:
             self.starttime = time.time()
-            self.dbapi_connection = connection = pool._invoke_creator(self)
+            if pool._metrics is not None:
+                start = time.perf_counter()
+                self.dbapi_connection = connection = pool._invoke_creator(self)
+                pool._metrics._record_connect(time.perf_counter() - start)
+            else:
+                self.dbapi_connection = connection = pool._invoke_creator(self)
             pool.logger.debug("Created new connection %r", connection)
             self.fresh = True
         except BaseException as e:
@@ -1265,9 +1436,10 @@ class _ConnectionFairy(PoolProxiedConnection):
         pool: Pool,
         threadconns: Optional[threading.local] = None,
         fairy: Optional[_ConnectionFairy] = None,
+        priority: int = 0,
     ) -> _ConnectionFairy:
         if not fairy:
-            fairy = _ConnectionRecord.checkout(pool)
+            fairy = _ConnectionRecord.checkout(pool, priority)
 
             if threadconns is not None:
                 threadconns.current = weakref.ref(fairy)
@@ -1298,7 +1470,10 @@ class _ConnectionFairy(PoolProxiedConnection):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if (
+                        not connection_is_fresh
+                        and not fairy._connection_record._recently_verified()
+                    ):
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
@@ -1317,8 +1492,13 @@ class _ConnectionFairy(PoolProxiedConnection):
                             raise exc.InvalidatePoolError()
                     elif fairy._echo:
                         pool.logger.debug(
-                            "Connection %s is fresh, skipping pre-ping",
+                            "Connection %s is %s, skipping pre-ping",
                             fairy.dbapi_connection,
+                            (
+                                "fresh"
+                                if connection_is_fresh
+                                else "recently verified"
+                            ),
                         )
 
                 pool.dispatch.checkout(
@@ -10,21 +10,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import random
 import threading
+import time
 import traceback
 import typing
 from typing import Any
 from typing import cast
+from typing import Collection
 from typing import List
 from typing import Literal
+from typing import Mapping
 from typing import Optional
+from typing import Sequence
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
 from typing import Union
 import weakref
 
 from .base import _AsyncConnDialect
+from .base import _ConnDialect
 from .base import _ConnectionFairy
 from .base import _ConnectionRecord
 from .base import _CreatorFnType
@@ -39,6 +47,109 @@ from ..util import queue as sqla_queue
 
 if typing.TYPE_CHECKING:
     from ..engine.interfaces import DBAPIConnection
+    from ..engine.interfaces import Dialect
+    from ..event import _DispatchCommon
+    from ..event import _ListenerFnType
+
+
+class _PoolMaintenance:
+    """Runs :meth:`.QueuePool._run_maintenance` periodically in a daemon
+    thread.
+
+    The worker is started upon first checkout rather than when the pool is
+    constructed, so that the connections it creates have the event
+    listeners established by :func:`_sa.create_engine` applied, including
+    those which set up the dialect.  Only a weak reference to the pool is
+    held, so that the thread exits once the pool is garbage collected.
+
+    """
+
+    __slots__ = (
+        "_pool_ref",
+        "interval",
+        "_stop",
+        "_thread",
+        "_mutex",
+        "started",
+    )
+
+    def __init__(self, pool: QueuePool, interval: float):
+        self._pool_ref = weakref.ref(pool)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._mutex = threading.Lock()
+        self.started = False
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def start(self) -> None:
+        with self._mutex:
+            # concurrent first checkouts start only one thread
+            if self.started:
+                return
+            self.started = True
+        self._thread = threading.Thread(
+            target=self._run, name="sqlalchemy-pool-maintenance", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run_once(self) -> bool:
+        pool = self._pool_ref()
+        if pool is None or self.stopped:
+            return False
+        try:
+            pool._run_maintenance()
+        except Exception:
+            pool.logger.error("Exception in pool maintenance", exc_info=True)
+        return True
+
+    def _run(self) -> None:
+        while self._run_once() and not self._stop.wait(self.interval):
+            pass
+
+
+class _AsyncPoolMaintenance(_PoolMaintenance):
+    """Runs :meth:`.QueuePool._run_maintenance` periodically in an asyncio
+    task.
+
+    The task requires a running event loop, which is present at the
+    time of checkout.
+
+    """
+
+    __slots__ = ("_task",)
+
+    def __init__(self, pool: QueuePool, interval: float):
+        super().__init__(pool, interval)
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.started = True
+        self._task = loop.create_task(self._run_async())
+
+    def stop(self) -> None:
+        self._stop.set()
+        task = self._task
+        if task is not None and not task.done():
+            try:
+                task.get_loop().call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # event loop is closed
+                pass
+
+    async def _run_async(self) -> None:
+        while await util.greenlet_spawn(self._run_once):
+            await asyncio.sleep(self.interval)
 
 
 class QueuePool(Pool):
@@ -69,6 +180,13 @@ class QueuePool(Pool):
 
     _pool: sqla_queue.QueueCommon[ConnectionPoolEntry]
 
+    _fair_queue_class: Optional[
+        Type[sqla_queue.FairQueue[ConnectionPoolEntry]]
+    ] = sqla_queue.FairQueue
+
+    _maintenance_class: Type[_PoolMaintenance] = _PoolMaintenance
+    _maintenance: Optional[_PoolMaintenance]
+
     def __init__(
         self,
         creator: Union[_CreatorFnType, _CreatorWRecFnType],
@@ -76,6 +194,9 @@ class QueuePool(Pool):
         max_overflow: int = 10,
         timeout: float = 30.0,
         use_lifo: bool = False,
+        min_idle: int = 0,
+        maintenance_interval: Optional[float] = None,
+        fair_waiters: bool = False,
         **kw: Any,
     ):
         r"""
@@ -124,6 +245,52 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param min_idle: number of idle connections the pool maintenance
+          worker will try to keep present in the pool, up to
+          ``pool_size``.  Only takes effect when
+          :paramref:`_pool.QueuePool.maintenance_interval` is also set.
+          Defaults to 0.
+
+          .. versionadded:: 2.1
+
+        :param maintenance_interval: if set, the number of seconds
+          between runs of a background maintenance worker.  On each run,
+          the worker creates new connections until ``min_idle``
+          connections are idle in the pool, recycles idle connections
+          which will exceed :paramref:`_pool.Pool.recycle` before the
+          next run, and if :paramref:`_pool.Pool.pre_ping` is enabled,
+          pings idle connections and reconnects those which are found to
+          be disconnected.  For :class:`.QueuePool` the worker is a
+          daemon thread, and for :class:`.AsyncAdaptedQueuePool` it is an
+          asyncio task; in both cases it's started upon the first
+          checkout from the pool.  The worker is stopped when
+          :meth:`_pool.Pool.dispose` is called.  Defaults to ``None``,
+          meaning no worker is used.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`pool_maintenance`
+
+        :param fair_waiters: if True, when the pool has reached its
+          overflow limit, connections returned to the pool are handed to
+          waiting checkouts strictly in the order in which they began
+          waiting, so that a checkout that's been waiting the longest, and
+          is therefore closest to its timeout, is served first.  Checkouts
+          made with a ``checkout_priority`` execution option on the
+          :class:`_engine.Engine` are served ahead of those with a lower
+          priority.  Defaults to False, where waiting checkouts are served
+          in an unspecified order.  Not supported by
+          :class:`.AsyncAdaptedQueuePool`, which always serves waiting
+          checkouts in order, or by :class:`.ConcurrentQueuePool`.
+
+          .. versionadded:: 2.1
+
+          .. seealso::
+
+            :ref:`pool_fair_waiters`
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -132,11 +299,28 @@ class QueuePool(Pool):
         """
 
         Pool.__init__(self, creator, **kw)
-        self._pool = self._queue_class(pool_size, use_lifo=use_lifo)
+        if fair_waiters:
+            if self._fair_queue_class is None:
+                raise exc.ArgumentError(
+                    f"{self.__class__.__name__} does not support "
+                    "fair_waiters"
+                )
+            self._pool = self._fair_queue_class(pool_size, use_lifo=use_lifo)
+        else:
+            self._pool = self._queue_class(pool_size, use_lifo=use_lifo)
+        self._fair_waiters = fair_waiters
         self._overflow = 0 - pool_size
         self._max_overflow = -1 if pool_size == 0 else max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._min_idle = min_idle
+        self._maintenance_interval = maintenance_interval
+        if maintenance_interval is not None:
+            self._maintenance = self._maintenance_class(
+                self, maintenance_interval
+            )
+        else:
+            self._maintenance = None
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
         try:
@@ -147,12 +331,32 @@ class QueuePool(Pool):
             finally:
                 self._dec_overflow()
 
-    def _do_get(self) -> ConnectionPoolEntry:
+    def _connect_w_options(
+        self, options: Mapping[str, Any]
+    ) -> PoolProxiedConnection:
+        priority = options.get("checkout_priority")
+        if priority:
+            return _ConnectionFairy._checkout(self, priority=priority)
+        return self.connect()
+
+    def _do_get_w_priority(self, priority: int) -> ConnectionPoolEntry:
+        return self._do_get(priority)
+
+    def _do_get(self, priority: int = 0) -> ConnectionPoolEntry:
+        maintenance = self._maintenance
+        if maintenance is not None and not maintenance.started:
+            maintenance.start()
+
         use_overflow = self._max_overflow > -1
 
         wait = use_overflow and self._overflow >= self._max_overflow
         try:
-            return self._pool.get(wait, self._timeout)
+            if priority and self._fair_waiters:
+                return cast(
+                    "sqla_queue.FairQueue[ConnectionPoolEntry]", self._pool
+                ).get(wait, self._timeout, priority)
+            else:
+                return self._pool.get(wait, self._timeout)
         except sqla_queue.Empty:
             # don't do things inside of "except Empty", because when we say
             # we timed out or can't connect and raise, Python 3 tells
@@ -160,7 +364,7 @@ class QueuePool(Pool):
             pass
         if use_overflow and self._overflow >= self._max_overflow:
             if not wait:
-                return self._do_get()
+                return self._do_get(priority)
             else:
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
@@ -177,7 +381,7 @@ class QueuePool(Pool):
                     self._dec_overflow()
                 raise
         else:
-            return self._do_get()
+            return self._do_get(priority)
 
     def _inc_overflow(self) -> bool:
         if self._max_overflow == -1:
@@ -205,8 +409,13 @@ class QueuePool(Pool):
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
+            min_idle=self._min_idle,
+            maintenance_interval=self._maintenance_interval,
+            fair_waiters=self._fair_waiters,
             recycle=self._recycle,
             echo=self.echo,
             logging_name=self._orig_logging_name,
@@ -215,7 +424,60 @@ class QueuePool(Pool):
             dialect=self._dialect,
         )
 
+    def _run_maintenance(self) -> None:
+        """Run one pass of the pool maintenance worker.
+
+        Idle records are recycled or pinged as needed, then new
+        connections are added until ``min_idle`` connections are idle.
+
+        """
+        maintenance = self._maintenance
+        recycle_margin = self._maintenance_interval or 0
+
+        # each record is taken from the pool, maintained and returned
+        # before the next is taken, so that at most one idle connection
+        # is unavailable to checkouts at any time.  records that were
+        # checked out since the snapshot was taken are skipped
+        for record in self._pool.snapshot():
+            if maintenance is not None and maintenance.stopped:
+                break
+            if not self._pool.remove(record):
+                continue
+            try:
+                cast(_ConnectionRecord, record)._maintain_idle(
+                    recycle_margin, self._pre_ping
+                )
+            except Exception:
+                # the record is returned regardless; with no connection
+                # present, the next checkout will attempt to reconnect
+                self.logger.error(
+                    "Exception during pool maintenance of connection %r",
+                    record,
+                    exc_info=True,
+                )
+            finally:
+                self._do_return_conn(record)
+
+        while (
+            (maintenance is None or not maintenance.stopped)
+            and self._pool.qsize() < self._min_idle
+            and (self._pool.maxsize == 0 or self._overflow < 0)
+            and self._inc_overflow()
+        ):
+            try:
+                record = self._create_connection()
+            except:
+                with util.safe_reraise():
+                    self._dec_overflow()
+                raise
+            # not connected on behalf of a checkout
+            cast(_ConnectionRecord, record)._create_connect_time = 0
+            self._do_return_conn(record)
+
     def dispose(self) -> None:
+        if self._maintenance is not None:
+            self._maintenance.stop()
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -275,6 +537,42 @@ class AsyncAdaptedQueuePool(QueuePool):
 
     _dialect = _AsyncConnDialect()
 
+    _fair_queue_class = None
+
+    _maintenance_class = _AsyncPoolMaintenance
+
+
+class ConcurrentQueuePool(QueuePool):
+    """A :class:`.QueuePool` that reduces lock contention when many threads
+    check out and return connections concurrently.
+
+    Where :class:`.QueuePool` acquires a lock on every checkout and checkin,
+    :class:`.ConcurrentQueuePool` only acquires a lock when a checkout must
+    wait for a connection to be returned, or when the number of overflow
+    connections changes.  This benefits applications running many threads
+    that each hold connections for a short time, including on free-threaded
+    builds of Python.
+
+    The arguments and operation of :class:`.ConcurrentQueuePool` are
+    otherwise identical to that of :class:`.QueuePool`, with the exception
+    that threads waiting for a connection when the pool is at its overflow
+    limit are not guaranteed to be served before threads that request a
+    connection later.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`pool_concurrent`
+
+    """
+
+    _queue_class: Type[sqla_queue.QueueCommon[ConnectionPoolEntry]] = (
+        sqla_queue.ConcurrentQueue
+    )
+
+    _fair_queue_class = None
+
 
 class NullPool(Pool):
     """A Pool which does not pool connections.
@@ -310,6 +608,8 @@ class NullPool(Pool):
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -373,6 +673,8 @@ class SingletonThreadPool(Pool):
             recycle=self._recycle,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             _dispatch=self.dispatch,
@@ -483,6 +785,8 @@ class StaticPool(Pool):
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
@@ -557,6 +861,8 @@ class AssertionPool(Pool):
             self._creator,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics,
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
@@ -581,3 +887,307 @@ class AssertionPool(Pool):
         if self._store_traceback:
             self._checkout_traceback = traceback.format_stack()
         return self._conn
+
+
+class _PoolHost:
+    """Health statistics for one of the hosts of a :class:`.MultiHostPool`."""
+
+    __slots__ = ("pool", "latency", "error_rate", "failures", "down_until")
+
+    def __init__(self, pool: Pool):
+        self.pool = pool
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.down_until = 0.0
+
+    def weight(self) -> float:
+        # hosts which haven't yet been used get the highest weight, so that
+        # their latency is observed
+        latency = max(self.latency or 0.0, 0.0001)
+        return max(1.0 - self.error_rate, 0.01) / latency
+
+
+class MultiHostPool(Pool):
+    """A :class:`_pool.Pool` that maintains a separate pool of connections
+    for a primary database host and one or more read replicas.
+
+    Connections are checked out from the primary host, unless they are
+    requested by an :class:`_engine.Engine` that has the ``readonly``
+    execution option set, in which case one of the replicas is chosen at
+    random, weighted towards replicas which have recently been quicker
+    to check out connections from and have failed less often.  A replica
+    which fails to provide a connection
+    :paramref:`.MultiHostPool.replica_failure_threshold` times in a row is
+    disposed and not used again until
+    :paramref:`.MultiHostPool.replica_retry_interval` seconds have passed.
+    If no replica can provide a connection, the primary host is used.
+
+    :class:`.MultiHostPool` is normally set up using the
+    :paramref:`_sa.create_engine.replica_urls` parameter.
+
+    The :class:`.MultiHostPool` class **is compatible** with asyncio and
+    :func:`_asyncio.create_async_engine`, provided the per-host pool class
+    is.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`pool_multi_host`
+
+    """
+
+    _ewma_weight = 0.2
+
+    def __init__(
+        self,
+        creator: Union[_CreatorFnType, _CreatorWRecFnType],
+        replicas: Sequence[Union[_CreatorFnType, _CreatorWRecFnType]] = (),
+        poolclass: Type[Pool] = QueuePool,
+        replica_failure_threshold: int = 3,
+        replica_retry_interval: float = 30.0,
+        replica_isolation_levels: Collection[str] = (),
+        *,
+        events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
+        dialect: Optional[Union[_ConnDialect, Dialect]] = None,
+        _dispatch: Optional[_DispatchCommon[Pool]] = None,
+        **kw: Any,
+    ):
+        r"""
+        Construct a MultiHostPool.
+
+        :param creator: a callable function that returns a DB-API
+          connection object to the primary host, same as that of
+          :paramref:`_pool.Pool.creator`.
+
+        :param replicas: a sequence of callables, each of which returns a
+          DB-API connection object to one of the replica hosts.
+
+        :param poolclass: the :class:`_pool.Pool` subclass used to pool
+          connections for each host.  Defaults to :class:`.QueuePool`.
+
+        :param replica_failure_threshold: number of consecutive failures to
+          check out a connection from a replica, or disconnects detected on
+          its connections, after which the replica is no longer used until
+          ``replica_retry_interval`` has passed.  Defaults to 3.
+
+        :param replica_retry_interval: number of seconds for which a
+          replica that has reached ``replica_failure_threshold`` is not
+          used.  Defaults to 30.
+
+        :param replica_isolation_levels: a collection of isolation level
+          names, such as ``"SERIALIZABLE READ ONLY DEFERRABLE"``, which when
+          set as the ``isolation_level`` execution option of the
+          :class:`_engine.Engine` requesting a connection, route it to a
+          replica in the same way as the ``readonly`` execution option.
+
+        :param \**kw: Other keyword arguments, including
+          :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.pre_ping`
+          and those specific to ``poolclass`` such as
+          :paramref:`.QueuePool.pool_size`, are passed to the pool of each
+          host.
+
+        """
+        self._poolclass = poolclass
+        self._pool_kw = kw
+        self._replica_failure_threshold = replica_failure_threshold
+        self._replica_retry_interval = replica_retry_interval
+        self._replica_isolation_levels = frozenset(replica_isolation_levels)
+
+        self._primary = _PoolHost(self._create_host_pool(creator, dialect))
+        self._replicas = [
+            _PoolHost(self._create_host_pool(replica, dialect))
+            for replica in replicas
+        ]
+
+        pool_args = util.get_cls_kwargs(Pool)
+        Pool.__init__(
+            self,
+            creator,
+            events=events,
+            dialect=dialect,
+            _dispatch=_dispatch,
+            **{k: v for k, v in kw.items() if k in pool_args},
+        )
+
+    def _create_host_pool(
+        self,
+        creator: Union[_CreatorFnType, _CreatorWRecFnType],
+        dialect: Optional[Union[_ConnDialect, Dialect]],
+    ) -> Pool:
+        pool = self._poolclass(creator, dialect=dialect, **self._pool_kw)
+
+        # the pool of each host shares the event dispatch of this pool, so
+        # that listeners established on this pool or on the Engine receive
+        # events for all hosts
+        pool.__dict__["dispatch"] = self.dispatch
+        return pool
+
+    if TYPE_CHECKING:
+        _dialect: Union[_ConnDialect, Dialect]
+        _is_asyncio: bool
+    else:
+
+        @util.rw_hybridproperty
+        def _dialect(self) -> Union[_ConnDialect, Dialect]:
+            return self._primary.pool._dialect
+
+        @_dialect.setter
+        def _dialect(self, dialect: Union[_ConnDialect, Dialect]) -> None:
+            for host in self._hosts:
+                host.pool._dialect = dialect
+
+        @_dialect.classlevel
+        def _dialect(cls) -> Union[_ConnDialect, Dialect]:
+            return Pool._dialect
+
+        @util.hybridproperty
+        def _is_asyncio(self) -> bool:
+            return self._primary.pool._is_asyncio
+
+        @_is_asyncio.classlevel
+        def _is_asyncio(cls) -> bool:
+            return Pool._dialect.is_async
+
+    @property
+    def _hosts(self) -> List[_PoolHost]:
+        return [self._primary] + self._replicas
+
+    @property
+    def primary(self) -> Pool:
+        """The :class:`_pool.Pool` of the primary host."""
+        return self._primary.pool
+
+    @property
+    def replicas(self) -> List[Pool]:
+        """The :class:`_pool.Pool` of each replica host."""
+        return [host.pool for host in self._replicas]
+
+    def connect(self) -> PoolProxiedConnection:
+        return self._primary.pool.connect()
+
+    def _connect_w_options(
+        self, options: Mapping[str, Any]
+    ) -> PoolProxiedConnection:
+        if self._replicas and (
+            options.get("readonly")
+            or options.get("isolation_level") in self._replica_isolation_levels
+        ):
+            return self._connect_replica(options)
+        return self._primary.pool._connect_w_options(options)
+
+    def _connect_replica(
+        self, options: Mapping[str, Any]
+    ) -> PoolProxiedConnection:
+        now = time.time()
+        candidates = [
+            host for host in self._replicas if host.down_until <= now
+        ]
+        while candidates:
+            if len(candidates) > 1:
+                host = random.choices(
+                    candidates, [host.weight() for host in candidates]
+                )[0]
+            else:
+                host = candidates[0]
+            candidates.remove(host)
+
+            start = time.perf_counter()
+            try:
+                connection = host.pool._connect_w_options(options)
+            except exc.TimeoutError:
+                # the replica's pool is exhausted; this isn't a failure
+                # of the host itself
+                self.logger.debug(
+                    "Timed out checking out connection from replica %s",
+                    host.pool,
+                )
+            except Exception as err:
+                self.logger.warning(
+                    "Error checking out connection from replica %s: %s",
+                    host.pool,
+                    err,
+                )
+                self._record_failure(host)
+            else:
+                self._record_success(host, time.perf_counter() - start)
+                return connection
+
+        self.logger.debug("No replica available; using primary host")
+        return self._primary.pool._connect_w_options(options)
+
+    def _record_success(self, host: _PoolHost, latency: float) -> None:
+        weight = self._ewma_weight
+        host.failures = 0
+        host.error_rate *= 1.0 - weight
+        if host.latency is None:
+            host.latency = latency
+        else:
+            host.latency += weight * (latency - host.latency)
+
+    def _record_failure(self, host: _PoolHost) -> None:
+        weight = self._ewma_weight
+        host.failures += 1
+        host.error_rate += weight * (1.0 - host.error_rate)
+        if (
+            host is not self._primary
+            and host.failures >= self._replica_failure_threshold
+        ):
+            self.logger.warning(
+                "Replica %s failed %d times; not using it for %s seconds",
+                host.pool,
+                host.failures,
+                self._replica_retry_interval,
+            )
+            host.failures = 0
+            host.down_until = time.time() + self._replica_retry_interval
+            host.pool.dispose()
+
+    def _invalidate(
+        self,
+        connection: PoolProxiedConnection,
+        exception: Optional[BaseException] = None,
+        _checkin: bool = True,
+    ) -> None:
+        pool = getattr(connection, "_pool", None)
+        for host in self._hosts:
+            if host.pool is pool:
+                host.pool._invalidate(connection, exception, _checkin)
+                self._record_failure(host)
+                break
+        else:
+            Pool._invalidate(self, connection, exception, _checkin)
+
+    def recreate(self) -> MultiHostPool:
+        self.logger.info("Pool recreating")
+        return self.__class__(
+            self._primary.pool._creator,
+            replicas=[host.pool._creator for host in self._replicas],
+            poolclass=self._poolclass,
+            replica_failure_threshold=self._replica_failure_threshold,
+            replica_retry_interval=self._replica_retry_interval,
+            replica_isolation_levels=self._replica_isolation_levels,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+            **self._pool_kw,
+        )
+
+    def dispose(self) -> None:
+        for host in self._hosts:
+            host.pool.dispose()
+
+    def status(self) -> str:
+        now = time.time()
+        return "; ".join(
+            ["Primary: %s" % self._primary.pool.status()]
+            + [
+                "Replica %d%s: %s"
+                % (
+                    idx,
+                    " (down)" if host.down_until > now else "",
+                    host.pool.status(),
+                )
+                for idx, host in enumerate(self._replicas)
+            ]
+        )
@@ -0,0 +1,352 @@
+# pool/metrics.py
+# Copyright (C) 2005-2026 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: https://www.opensource.org/licenses/mit-license.php
+
+
+"""Connection pool metrics collection."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import dataclasses
+import threading
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+"""Default upper bounds, in seconds, of the buckets used by
+:class:`.PoolMetrics` histograms."""
+
+
+@dataclasses.dataclass(frozen=True)
+class HistogramSnapshot:
+    """A point-in-time copy of a duration histogram collected by
+    :class:`.PoolMetrics`.
+
+    .. versionadded:: 2.1
+
+    """
+
+    count: int
+    """Number of durations recorded."""
+
+    total: float
+    """Sum of all durations recorded, in seconds."""
+
+    max: float
+    """Longest duration recorded, in seconds."""
+
+    buckets: Tuple[Tuple[float, int], ...]
+    """Tuple of ``(upper_bound, count)`` pairs, where ``count`` is the
+    number of durations greater than the previous bucket's upper bound
+    and less than or equal to ``upper_bound``.  The last bucket has an
+    upper bound of ``float("inf")``."""
+
+    @property
+    def mean(self) -> float:
+        """Mean of all durations recorded, or ``0.0`` if none were."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimate the given quantile, e.g. ``0.99``, of the durations
+        recorded.
+
+        The estimate is the upper bound of the bucket in which the
+        quantile falls, limited to :attr:`.HistogramSnapshot.max`.
+
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for upper, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return min(upper, self.max)
+        return self.max
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "count", "total", "max")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: _Histogram) -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self.count,
+            total=self.total,
+            max=self.max,
+            buckets=tuple(zip(self.bounds + (float("inf"),), self.counts)),
+        )
+
+
+class _Collector:
+    """Statistics recorded by a single thread."""
+
+    __slots__ = (
+        "thread",
+        "generation",
+        "checkouts",
+        "timeouts",
+        "connects",
+        "recycles",
+        "invalidations",
+        "checkout_wait",
+        "hold_time",
+        "connect_time",
+    )
+
+    def __init__(
+        self,
+        buckets: Sequence[float],
+        thread: Optional[threading.Thread],
+        generation: int,
+    ):
+        self.thread = thread
+        self.generation = generation
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.recycles = 0
+        self.invalidations = 0
+        self.checkout_wait = _Histogram(buckets)
+        self.hold_time = _Histogram(buckets)
+        self.connect_time = _Histogram(buckets)
+
+    def merge(self, other: _Collector) -> None:
+        self.checkouts += other.checkouts
+        self.timeouts += other.timeouts
+        self.connects += other.connects
+        self.recycles += other.recycles
+        self.invalidations += other.invalidations
+        self.checkout_wait.merge(other.checkout_wait)
+        self.hold_time.merge(other.hold_time)
+        self.connect_time.merge(other.connect_time)
+
+
+@dataclasses.dataclass(frozen=True)
+class PoolMetricsSnapshot:
+    """A point-in-time copy of the statistics collected by
+    :class:`.PoolMetrics`.
+
+    .. versionadded:: 2.1
+
+    """
+
+    checkouts: int
+    """Number of connections checked out from the pool."""
+
+    timeouts: int
+    """Number of checkouts which failed due to the pool's timeout."""
+
+    connects: int
+    """Number of new DBAPI connections established."""
+
+    recycles: int
+    """Number of connections closed and replaced due to the pool's recycle
+    time or a prior invalidation, either upon checkout or by the pool
+    maintenance worker."""
+
+    invalidations: int
+    """Number of connections invalidated, including soft invalidations."""
+
+    checkout_wait: HistogramSnapshot
+    """Time spent obtaining a connection from the pool upon checkout,
+    including waiting for a connection to be returned.  Time spent
+    establishing a new connection is recorded in
+    :attr:`.PoolMetricsSnapshot.connect_time` and is not included."""
+
+    hold_time: HistogramSnapshot
+    """Time between a connection being checked out and returned to the
+    pool."""
+
+    connect_time: HistogramSnapshot
+    """Time spent establishing new DBAPI connections."""
+
+
+class PoolMetrics:
+    """Collects statistics about the operation of a :class:`_pool.Pool`.
+
+    An instance is passed to :paramref:`_pool.Pool.metrics`, or using
+    :paramref:`_sa.create_engine.pool_metrics`; the statistics collected so
+    far are returned by :meth:`.PoolMetrics.snapshot`::
+
+        from sqlalchemy.pool import PoolMetrics
+
+        metrics = PoolMetrics()
+        engine = create_engine("postgresql://...", pool_metrics=metrics)
+
+        # ...
+
+        snapshot = metrics.snapshot()
+        print(snapshot.timeouts, snapshot.checkout_wait.quantile(0.99))
+
+    The same :class:`.PoolMetrics` is carried over to the new pool created by
+    :meth:`_engine.Engine.dispose`, and may also be shared among several
+    pools.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`pool_metrics`
+
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_lock",
+        "_local",
+        "_generation",
+        "_collectors",
+        "_retired",
+    )
+
+    def __init__(self, buckets: Optional[Sequence[float]] = None):
+        """Construct a new :class:`.PoolMetrics`.
+
+        :param buckets: ascending sequence of upper bounds, in seconds, of
+         the buckets used by duration histograms.  Defaults to a range of
+         bounds from 100 microseconds to 60 seconds.
+
+        """
+        if buckets is None:
+            buckets = DEFAULT_BUCKETS
+        self._buckets = tuple(buckets)
+
+        # statistics are recorded without locking into a collector owned
+        # by the current thread; the lock is only acquired when a thread
+        # first records, and by snapshot() and reset(), which combine
+        # or discard the collectors of all threads
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._generation = 0
+        self._collectors: List[_Collector] = []
+        self._retired = _Collector(self._buckets, None, 0)
+
+    def _collector(self) -> _Collector:
+        collector: Optional[_Collector] = getattr(
+            self._local, "collector", None
+        )
+        if collector is None or collector.generation != self._generation:
+            collector = self._register()
+        return collector
+
+    def _register(self) -> _Collector:
+        with self._lock:
+            self._retire_finished()
+            collector = _Collector(
+                self._buckets, threading.current_thread(), self._generation
+            )
+            self._collectors.append(collector)
+        self._local.collector = collector
+        return collector
+
+    def _retire_finished(self) -> None:
+        # collectors of threads which have ended are folded into a
+        # single collector, so that the number of collectors doesn't
+        # grow with each thread that's used the pool
+        alive = []
+        for collector in self._collectors:
+            assert collector.thread is not None
+            if collector.thread.is_alive():
+                alive.append(collector)
+            else:
+                self._retired.merge(collector)
+        self._collectors = alive
+
+    def reset(self) -> None:
+        """Reset all statistics to zero."""
+        with self._lock:
+            # collectors in use by other threads are replaced by those
+            # threads upon their next record, rather than being modified
+            # here
+            self._generation += 1
+            self._collectors = []
+            self._retired = _Collector(self._buckets, None, self._generation)
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        """Return a :class:`.PoolMetricsSnapshot` of the statistics
+        collected so far."""
+        with self._lock:
+            self._retire_finished()
+            total = _Collector(self._buckets, None, self._generation)
+            total.merge(self._retired)
+            for collector in self._collectors:
+                total.merge(collector)
+
+        return PoolMetricsSnapshot(
+            checkouts=total.checkouts,
+            timeouts=total.timeouts,
+            connects=total.connects,
+            recycles=total.recycles,
+            invalidations=total.invalidations,
+            checkout_wait=total.checkout_wait.snapshot(),
+            hold_time=total.hold_time.snapshot(),
+            connect_time=total.connect_time.snapshot(),
+        )
+
+    def _record_checkout(self, wait: float) -> None:
+        collector = self._collector()
+        collector.checkouts += 1
+        collector.checkout_wait.add(wait)
+
+    def _record_timeout(self, wait: float) -> None:
+        collector = self._collector()
+        collector.timeouts += 1
+        collector.checkout_wait.add(wait)
+
+    def _record_checkin(self, hold_time: float) -> None:
+        self._collector().hold_time.add(hold_time)
+
+    def _record_connect(self, connect_time: float) -> None:
+        collector = self._collector()
+        collector.connects += 1
+        collector.connect_time.add(connect_time)
+
+    def _record_recycle(self) -> None:
+        self._collector().recycles += 1
+
+    def _record_invalidate(self) -> None:
+        self._collector().invalidations += 1
@@ -8,14 +8,20 @@
 
 from __future__ import annotations
 
+from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Literal
+from typing import Optional
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import Union
 
 if TYPE_CHECKING:
     from .cache_key import CacheConst
+    from .cache_key import HasCacheKey
+    from .elements import BindParameter
     from ..engine.interfaces import _CoreSingleExecuteParams
 
 # START GENERATED CYTHON IMPORT
@@ -125,3 +131,63 @@ class anon_map(Dict[_AM_KEY, _AM_VALUE]):
 
     def __missing__(self: anon_map, key: _AM_KEY, /) -> int:
         return self._add_missing(key)  # type: ignore[no-any-return]
+
+
+def gen_cache_key(
+    self: HasCacheKey,
+    anon_map_: anon_map,
+    bindparams: List[BindParameter[Any]],
+    /,
+) -> Optional[Tuple[Any, ...]]:
+    """Implementation of :meth:`.HasCacheKey._gen_cache_key`.
+
+    This is the entrypoint into the cache key generation of every element
+    in a statement that doesn't provide its own ``_gen_cache_key()``.  The
+    per-class traversal function is generated in Python by
+    ``_CacheKeyTraversal._generate_dispatcher()``; when compiled, this
+    function avoids the overhead of the Python-level
+    :meth:`.anon_map.get_anon` call and dispatcher lookup which is otherwise
+    incurred for each element.
+
+    """
+    cls = self.__class__
+    self_dict: dict = anon_map_  # type: ignore[type-arg]
+
+    idself: int = _get_id(self)
+    if idself in self_dict:
+        return (self_dict[idself], cls)
+    id_: int = anon_map_._add_missing(idself)
+
+    try:
+        dispatcher = cls.__dict__["_generated_cache_key_traversal"]
+    except KeyError:
+        # traversals.py -> _preconfigure_traversals()
+        # may be used to run these ahead of time, but
+        # is not enabled right now.
+        # this block will generate any remaining dispatchers.
+        dispatcher = cls._generate_cache_attrs()
+
+    # the dispatcher is a function generated specifically for this class
+    # by _CacheKeyTraversal._generate_dispatcher(); it contains the
+    # whole traversal for the class inline and returns the completed
+    # cache key tuple, or None to indicate NO_CACHE.
+    return dispatcher(  # type: ignore[no-any-return]
+        self, anon_map_, bindparams, id_, cls
+    )
+
+
+def gen_cache_key_tuple(
+    elements: Iterable[HasCacheKey],
+    anon_map_: Any,
+    bindparams: List[BindParameter[Any]],
+    /,
+) -> Tuple[Any, ...]:
+    """Generate a tuple of cache keys for a list or tuple of elements.
+
+    Used by the generated cache key traversal functions when this module is
+    compiled; otherwise the equivalent expression is emitted inline.
+
+    """
+    return tuple(
+        [elem._gen_cache_key(anon_map_, bindparams) for elem in elements]
+    )
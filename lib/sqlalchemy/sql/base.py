@@ -65,6 +65,8 @@ from ..util.typing import TypeVarTuple
 from ..util.typing import Unpack
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from . import coercions
     from . import elements
     from . import type_api
@@ -1477,9 +1479,13 @@ class Executable(roles.StatementRole):
         max_row_buffer: int = ...,
         yield_per: int = ...,
         driver_column_names: bool = ...,
+        lazy_row_processing: bool = ...,
+        result_processing_executor: Executor = ...,
         insertmanyvalues_page_size: int = ...,
+        insertmanyvalues_target_latency: float = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
+        readonly_entities: bool = False,
         autoflush: bool = False,
         synchronize_session: SynchronizeSessionArgument = ...,
         dml_strategy: DMLStrategyArgument = ...,
@@ -1487,6 +1493,7 @@ class Executable(roles.StatementRole):
         is_delete_using: bool = ...,
         is_update_from: bool = ...,
         preserve_rowcount: bool = False,
+        bulk_load: bool = False,
         **opt: Any,
     ) -> Self: ...
 
@@ -27,6 +27,7 @@ from typing import Tuple
 from typing import Type
 from typing import Union
 
+from . import _util_cy
 from .visitors import anon_map
 from .visitors import HasTraversalDispatch
 from .visitors import HasTraverseInternals
@@ -65,6 +66,17 @@ class CacheConst(enum.Enum):
 NO_CACHE: Final = CacheConst.NO_CACHE
 
 
+def _no_cache_traversal(
+    self: HasCacheKey,
+    anon_map: anon_map,
+    bindparams: List[BindParameter[Any]],
+    id_: int,
+    cls: Type[HasCacheKey],
+) -> Optional[Tuple[Any, ...]]:
+    anon_map[NO_CACHE] = True
+    return None
+
+
 _CacheKeyTraversalType = Union[
     "_TraverseInternalsType", Literal[CacheConst.NO_CACHE], Literal[None]
 ]
@@ -144,13 +156,13 @@ class HasCacheKey:
     _generated_cache_key_traversal: Any
 
     @classmethod
-    def _generate_cache_attrs(
-        cls,
-    ) -> Union[_CacheKeyTraversalDispatchType, Literal[CacheConst.NO_CACHE]]:
+    def _generate_cache_attrs(cls) -> _CacheKeyTraversalDispatchType:
         """generate cache key dispatcher for a new class.
 
         This sets the _generated_cache_key_traversal attribute once called
-        so should only be called once per class.
+        so should only be called once per class.   For a class that does
+        not support caching, the dispatcher is the ``_no_cache_traversal``
+        function, which places NO_CACHE into the anon_map.
 
         """
         inherit_cache = cls.__dict__.get("inherit_cache", None)
@@ -163,8 +175,8 @@ class HasCacheKey:
                     assert issubclass(cls, HasTraverseInternals)
                     _cache_key_traversal = cls._traverse_internals
                 except AttributeError:
-                    cls._generated_cache_key_traversal = NO_CACHE
-                    return NO_CACHE
+                    cls._generated_cache_key_traversal = _no_cache_traversal
+                    return _no_cache_traversal
 
             assert _cache_key_traversal is not NO_CACHE, (
                 f"class {cls} has _cache_key_traversal=NO_CACHE, "
@@ -193,7 +205,7 @@ class HasCacheKey:
                     "_traverse_internals", None
                 )
                 if _cache_key_traversal is None:
-                    cls._generated_cache_key_traversal = NO_CACHE
+                    cls._generated_cache_key_traversal = _no_cache_traversal
                     if (
                         inherit_cache is None
                         and cls._hierarchy_supports_caching
@@ -211,7 +223,7 @@ class HasCacheKey:
                             "disable this warning." % (cls.__name__),
                             code="cprf",
                         )
-                    return NO_CACHE
+                    return _no_cache_traversal
 
             return cast(
                 _CacheKeyTraversalDispatchType,
@@ -222,57 +234,37 @@ class HasCacheKey:
                 ),
             )
 
-    def _gen_cache_key(
-        self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
-    ) -> Optional[Tuple[Any, ...]]:
-        """return an optional cache key.
-
-        The cache key is a tuple which can contain any series of
-        objects that are hashable and also identifies
-        this object uniquely within the presence of a larger SQL expression
-        or statement, for the purposes of caching the resulting query.
-
-        The cache key should be based on the SQL compiled structure that would
-        ultimately be produced.   That is, two structures that are composed in
-        exactly the same way should produce the same cache key; any difference
-        in the structures that would affect the SQL string or the type handlers
-        should result in a different cache key.
-
-        If a structure cannot produce a useful cache key, the NO_CACHE
-        symbol should be added to the anon_map and the method should
-        return None.
+    if typing.TYPE_CHECKING:
 
-        """
+        def _gen_cache_key(
+            self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
+        ) -> Optional[Tuple[Any, ...]]:
+            """return an optional cache key.
 
-        cls = self.__class__
+            The cache key is a tuple which can contain any series of
+            objects that are hashable and also identifies
+            this object uniquely within the presence of a larger SQL
+            expression or statement, for the purposes of caching the
+            resulting query.
 
-        id_, found = anon_map.get_anon(self)
-        if found:
-            return (id_, cls)
+            The cache key should be based on the SQL compiled structure that
+            would ultimately be produced.   That is, two structures that are
+            composed in exactly the same way should produce the same cache
+            key; any difference in the structures that would affect the SQL
+            string or the type handlers should result in a different cache
+            key.
 
-        dispatcher: Union[
-            Literal[CacheConst.NO_CACHE],
-            _CacheKeyTraversalDispatchType,
-        ]
+            If a structure cannot produce a useful cache key, the NO_CACHE
+            symbol should be added to the anon_map and the method should
+            return None.
 
-        try:
-            dispatcher = cls.__dict__["_generated_cache_key_traversal"]
-        except KeyError:
-            # traversals.py -> _preconfigure_traversals()
-            # may be used to run these ahead of time, but
-            # is not enabled right now.
-            # this block will generate any remaining dispatchers.
-            dispatcher = cls._generate_cache_attrs()
+            """
+            ...
 
-        if dispatcher is NO_CACHE:
-            anon_map[NO_CACHE] = True
-            return None
-
-        # the dispatcher is a function generated specifically for this class
-        # by _CacheKeyTraversal._generate_dispatcher(); it contains the
-        # whole traversal for the class inline and returns the completed
-        # cache key tuple, or None to indicate NO_CACHE.
-        return dispatcher(self, anon_map, bindparams, id_, cls)
+    else:
+        # implemented in sql/_util_cy.py, which is compiled when the
+        # cython extensions are built
+        _gen_cache_key = _util_cy.gen_cache_key
 
     def _generate_cache_key(self) -> Optional[CacheKey]:
         """return a cache key.
@@ -657,7 +649,17 @@ def {method_name}(self, anon_map, bindparams, id_, cls):
                 or meth is InternalTraversal.dp_clauseelement_tuple
                 or meth is InternalTraversal.dp_memoized_select_entities
             ):
-                code.append(f"""\
+                if _util_cy._is_compiled():
+                    env["_gen_cache_key_tuple"] = _util_cy.gen_cache_key_tuple
+                    code.append(f"""\
+    if obj:
+        result += (
+            {attrname!r},
+            _gen_cache_key_tuple(obj, anon_map, bindparams),
+        )
+""")
+                else:
+                    code.append(f"""\
     if obj:
         result += (
             {attrname!r},
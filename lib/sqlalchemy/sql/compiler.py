@@ -136,6 +136,7 @@ if typing.TYPE_CHECKING:
     from .selectable import ReturnsRows
     from .selectable import Select
     from .selectable import SelectState
+    from .selectable import TableClause
     from .type_api import _BindProcessorType
     from .type_api import TypeDecorator
     from .type_api import TypeEngine
@@ -655,6 +656,53 @@ class _InsertManyValuesBatch(NamedTuple):
     is_downgraded: bool
 
 
+def _estimated_bind_size(value: Any) -> int:
+    """Estimate the number of bytes taken up by a bound value within an
+    INSERT statement, for insertmanyvalues_max_bytes.
+
+    Strings are assumed to take up four bytes per non-ASCII character,
+    while numeric, date and other fixed size values are assumed to take up
+    no more than 32 bytes.
+
+    """
+    if isinstance(value, str):
+        return len(value) + 2 if value.isascii() else len(value) * 4 + 2
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        # allow for escaping or hex encoding
+        return len(value) * 2 + 3
+    else:
+        return 32
+
+
+class _BulkLoad(NamedTuple):
+    """represents the columns of an INSERT statement executed with
+    executemany(), which a dialect may load using its native bulk loading
+    facility when the ``bulk_load`` execution option is used.
+
+    This is produced by the :attr:`.SQLCompiler._bulk_load` attribute and
+    consumed by :meth:`.Dialect.do_bulk_load`.
+
+    .. versionadded:: 2.1
+
+    """
+
+    table: TableClause
+    """The target table."""
+
+    table_text: str
+    """The rendered name of the target table, which may include schema
+    translation tokens."""
+
+    column_names: List[str]
+    """Names of the columns receiving values, in order."""
+
+    column_exprs: List[str]
+    """Rendered, quoted names of the columns receiving values."""
+
+    bind_names: List[str]
+    """Names of the bound parameters supplying the value of each column."""
+
+
 class InsertmanyvaluesSentinelOpts(FastIntFlag):
     """bitflag enum indicating styles of PK defaults
     which can work as implicit sentinel columns
@@ -1331,7 +1379,9 @@ class SQLCompiler(Compiled):
 
     _insertmanyvalues: Optional[_InsertManyValues] = None
 
-    _insert_crud_params: Optional[crud._CrudParamSequence] = None
+    _insert_crud_params: Optional[List[crud._CrudParamElementStr]] = None
+    """The columns and bound parameters of a top-level INSERT statement, as
+    produced by crud.py."""
 
     literal_execute_params: FrozenSet[BindParameter[Any]] = frozenset()
     """bindparameter objects that are rendered as literal values at statement
@@ -1597,6 +1647,47 @@ class SQLCompiler(Compiled):
         else:
             return self._insertmanyvalues.single_values_expr
 
+    @util.memoized_property
+    def _bulk_load(self) -> Optional[_BulkLoad]:
+        """The columns of a top-level INSERT which may be loaded using a
+        dialect's native bulk loading facility, or None if the statement
+        isn't a plain INSERT of bound parameter values.
+
+        """
+        crud_params = self._insert_crud_params
+        if not crud_params or self.effective_returning or self.ctes:
+            return None
+
+        compile_state = self.dml_compile_state
+        assert compile_state is not None
+        insert_stmt = cast("Insert", compile_state.statement)
+        if (
+            insert_stmt.select is not None
+            or insert_stmt._multi_values
+            or insert_stmt._post_values_clause is not None
+        ):
+            return None
+
+        column_names = []
+        column_exprs = []
+        bind_names = []
+        for col, col_expr, _, accumulated_names in crud_params:
+            names = list(accumulated_names)
+            if len(names) != 1 or not self.binds[names[0]]._is_crud:
+                # a SQL expression or default, rather than a value
+                return None
+            column_names.append(col.name)
+            column_exprs.append(col_expr)
+            bind_names.append(names[0])
+
+        return _BulkLoad(
+            insert_stmt.table,
+            self.preparer.format_table(insert_stmt.table),
+            column_names,
+            column_exprs,
+            bind_names,
+        )
+
     @util.ro_memoized_property
     def effective_returning(self) -> Optional[Sequence[ColumnElement[Any]]]:
         """The effective "returning" columns for INSERT, UPDATE or DELETE.
@@ -5762,6 +5853,7 @@ class SQLCompiler(Compiled):
         batch_size: int,
         sort_by_parameter_order: bool,
         schema_translate_map: Optional[SchemaTranslateMapType],
+        target_latency: Optional[float] = None,
     ) -> Iterator[_InsertManyValuesBatch]:
         imv = self._insertmanyvalues
         assert imv is not None
@@ -5877,13 +5969,46 @@ class SQLCompiler(Compiled):
             num_params_outside_of_batch = (
                 total_num_of_params - num_params_per_batch
             )
-            batch_size = min(
-                batch_size,
-                (
-                    (max_params - num_params_outside_of_batch)
-                    // num_params_per_batch
-                ),
+            max_batch_size = max(
+                (max_params - num_params_outside_of_batch)
+                // num_params_per_batch,
+                1,
             )
+            batch_size = min(batch_size, max_batch_size)
+        else:
+            max_batch_size = lenparams
+
+        # Use optional insertmanyvalues_max_bytes to end each batch
+        # before the estimated size of the statement and its parameters
+        # exceeds insertmanyvalues_max_bytes.  Currently used by MySQL /
+        # MariaDB, which limit the size of a statement to max_allowed_packet.
+        max_bytes = self.dialect.insertmanyvalues_max_bytes
+        row_sizes: Optional[List[int]]
+        if max_bytes:
+            row_overhead = len(executemany_values) + 2
+            row_values: Iterable[Iterable[Any]]
+            if self.positional:
+                row_values = cast("Sequence[Sequence[Any]]", parameters)
+            else:
+                row_values = (
+                    param.values()
+                    for param in cast(
+                        "Sequence[Mapping[str, Any]]", parameters
+                    )
+                )
+            row_sizes = [
+                row_overhead + sum(map(_estimated_bind_size, values))
+                for values in row_values
+            ]
+            max_batch_bytes = max_bytes - len(statement)
+        else:
+            row_sizes = None
+            max_batch_bytes = 0
+
+        # batch sizes vary from batch to batch when limited by size or
+        # tuned from latency, in which case total_batches is estimated
+        # from the current batch size
+        varying_batch_size = bool(row_sizes is not None or target_latency)
 
         batches = cast("List[Sequence[Any]]", list(parameters))
         compiled_batches = cast(
@@ -5988,17 +6113,40 @@ class SQLCompiler(Compiled):
                     rf"{escaped}\d+", "%s", executemany_values_w_comma
                 )
 
+        rows_delivered = 0
         while batches:
-            batch = batches[0:batch_size]
-            compiled_batch = compiled_batches[0:batch_size]
+            current_batch_size = batch_size
+
+            if row_sizes is not None:
+                batch_bytes = 0
+                for index in range(
+                    rows_delivered,
+                    min(rows_delivered + batch_size, len(row_sizes)),
+                ):
+                    batch_bytes += row_sizes[index]
+                    if (
+                        index > rows_delivered
+                        and batch_bytes > max_batch_bytes
+                    ):
+                        current_batch_size = index - rows_delivered
+                        break
 
-            batches[0:batch_size] = []
-            compiled_batches[0:batch_size] = []
+            batch = batches[0:current_batch_size]
+            compiled_batch = compiled_batches[0:current_batch_size]
 
-            if batches:
-                current_batch_size = batch_size
-            else:
-                current_batch_size = len(batch)
+            batches[0:current_batch_size] = []
+            compiled_batches[0:current_batch_size] = []
+
+            current_batch_size = len(batch)
+            rows_delivered += current_batch_size
+
+            if varying_batch_size:
+                remaining = len(batches)
+                total_batches = (
+                    batchnum
+                    + remaining // current_batch_size
+                    + (1 if remaining % current_batch_size else 0)
+                )
 
             if generic_setinputsizes:
                 # if setinputsizes is present, expand this collection to
@@ -6104,6 +6252,9 @@ class SQLCompiler(Compiled):
                     ", ".join(replaced_values_clauses),
                 )
 
+            if target_latency:
+                batch_started = perf_counter()
+
             yield _InsertManyValuesBatch(
                 replaced_statement,
                 replaced_parameters,
@@ -6120,11 +6271,27 @@ class SQLCompiler(Compiled):
                 sort_by_parameter_order,
                 False,
             )
+
+            if target_latency:
+                # the generator resumes once the batch has been executed
+                # and its rows fetched; scale the size of the next batch
+                # towards the target latency, by at most a factor of two
+                elapsed = perf_counter() - batch_started
+                if elapsed > 0:
+                    factor = min(max(target_latency / elapsed, 0.5), 2.0)
+                    batch_size = min(
+                        max(int(current_batch_size * factor), 1),
+                        max_batch_size,
+                    )
+
             batchnum += 1
 
     def visit_insert(
         self, insert_stmt, visited_bindparam=None, visiting_cte=None, **kw
     ):
+        if self._collect_params:
+            self._add_to_params(insert_stmt)
+
         compile_state = insert_stmt._compile_state_factory(
             insert_stmt, self, **kw
         )
@@ -6218,6 +6385,9 @@ class SQLCompiler(Compiled):
         else:
             crud_params_single = crud_params_struct.single_params
 
+        if toplevel:
+            self._insert_crud_params = crud_params_single
+
         preparer = self.preparer
         supports_default_values = self.dialect.supports_default_values
 
@@ -6575,6 +6745,9 @@ class SQLCompiler(Compiled):
         visiting_cte: Optional[CTE] = None,
         **kw: Any,
     ) -> str:
+        if self._collect_params:
+            self._add_to_params(update_stmt)
+
         compile_state = update_stmt._compile_state_factory(
             update_stmt, self, **kw
         )
@@ -6741,6 +6914,9 @@ class SQLCompiler(Compiled):
         )
 
     def visit_delete(self, delete_stmt, visiting_cte=None, **kw):
+        if self._collect_params:
+            self._add_to_params(delete_stmt)
+
         compile_state = delete_stmt._compile_state_factory(
             delete_stmt, self, **kw
         )
@@ -121,7 +121,9 @@ from .functions import FunctionElement as FunctionElement
 from .functions import modifier as modifier
 from .lambdas import lambda_stmt as lambda_stmt
 from .lambdas import LambdaElement as LambdaElement
+from .lambdas import statement_template as statement_template
 from .lambdas import StatementLambdaElement as StatementLambdaElement
+from .lambdas import StatementTemplate as StatementTemplate
 from .operators import ColumnOperators as ColumnOperators
 from .operators import custom_op as custom_op
 from .operators import OperatorClass as OperatorClass
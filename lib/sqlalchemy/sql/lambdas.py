@@ -18,6 +18,7 @@ from types import CodeType
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Generic
 from typing import List
 from typing import Literal
 from typing import MutableMapping
@@ -46,6 +47,7 @@ from .. import inspection
 from .. import util
 
 if TYPE_CHECKING:
+    from .cache_key import CacheKey
     from .elements import BindParameter
     from .elements import ClauseElement
     from .roles import SQLRole
@@ -68,6 +70,8 @@ _StmtLambdaType = Callable[[], Any]
 _E = TypeVar("_E", bound=Executable)
 _StmtLambdaElementType = Callable[[_E], Any]
 
+_StmtTemplateFnType = Callable[[], _E]
+
 
 class LambdaOptions(Options):
     enable_tracking = True
@@ -151,6 +155,48 @@ def lambda_stmt(
     )
 
 
+def statement_template(fn: _StmtTemplateFnType[_E]) -> StatementTemplate[_E]:
+    """Decorate a function that produces a SQL statement as a
+    :class:`_sql.StatementTemplate`.
+
+    The decorated function accepts no arguments, and returns an executable
+    statement which refers to the values that vary per execution using named
+    :func:`_sql.bindparam` constructs.  The function is invoked only once
+    per process, and the cache key of the statement it returns is generated
+    only once as well; subsequent invocations of the template only apply new
+    values for the bound parameters::
+
+        from sqlalchemy import bindparam
+        from sqlalchemy import select
+        from sqlalchemy import statement_template
+
+
+        @statement_template
+        def user_by_name():
+            return select(user_table).where(
+                user_table.c.name == bindparam("name")
+            )
+
+
+        result = connection.execute(user_by_name(name="spongebob"))
+
+    Compared to :func:`_sql.lambda_stmt`, no analysis of the Python code
+    or closure variables of the function takes place; the statement returned
+    by the function must be the same every time, with all varying values
+    expressed as named bound parameters.
+
+    .. versionadded:: 2.1
+
+    .. seealso::
+
+        :ref:`engine_statement_templates`
+
+        :func:`_sql.lambda_stmt`
+
+    """
+    return StatementTemplate(fn)
+
+
 class LambdaElement(elements.ClauseElement):
     """A SQL construct where the state is stored as an un-invoked lambda.
 
@@ -721,6 +767,106 @@ class LinkedLambdaElement(StatementLambdaElement):
         return fn(self.parent_lambda._resolved)
 
 
+class StatementTemplate(Generic[_E]):
+    """A statement that is constructed, and whose cache key is generated,
+    only once, and is then invoked with new bound parameter values.
+
+    The :class:`_sql.StatementTemplate` is constructed using the
+    :func:`_sql.statement_template` decorator.   Calling the template
+    with keyword arguments returns a copy of the statement with the given
+    values applied to the named bound parameters, in the same way as
+    :meth:`.ExecutableStatement.params`, however the copy is assigned the
+    cache key of the original statement up front, so that no traversal of
+    the statement takes place when it is executed.
+
+    .. versionadded:: 2.1
+
+    """
+
+    __slots__ = ("fn", "_statement", "_cache_key", "__weakref__")
+
+    _generation_mutex = threading.Lock()
+
+    _statement: Optional[_E]
+    _cache_key: Optional[CacheKey]
+
+    def __init__(self, fn: _StmtTemplateFnType[_E]):
+        self.fn = fn
+        self._statement = None
+        self._cache_key = None
+
+    def __repr__(self) -> str:
+        return "%s(%r)" % (self.__class__.__name__, self.fn)
+
+    @property
+    def statement(self) -> _E:
+        """The statement produced by the template function, without any
+        parameter values applied.
+
+        """
+        statement = self._statement
+        if statement is None:
+            statement = self._generate()
+        return statement
+
+    def _generate(self) -> _E:
+        with self._generation_mutex:
+            # check for other thread already created the statement
+            if self._statement is not None:
+                return self._statement
+
+            statement = coercions.expect(roles.StatementRole, self.fn())
+            if isinstance(statement, ExecutableStatement):
+                self._cache_key = cast(
+                    _cache_key.HasCacheKey, statement
+                )._generate_cache_key()
+            self._statement = statement
+            return statement  # type: ignore[no-any-return]
+
+    def __call__(self, **params: Any) -> _E:
+        """Return the statement with the given bound parameter values
+        applied.
+
+        """
+        statement = self._statement
+        if statement is None:
+            statement = self._generate()
+
+        if not params:
+            return statement
+
+        # same as ExecutableStatement.params(), which is not available
+        # on DML constructs under that name
+        statement = statement._generate()  # type: ignore[attr-defined]
+        statement._params = statement._params | params
+
+        cache_key = self._cache_key
+        if cache_key is None:
+            # statement can't be cached; the parameters are still applied
+            # at compile time, there's just no key to memoize
+            return statement  # type: ignore[no-any-return]
+
+        # the parameters only take part in the "params" portion of the
+        # cache key, so the key tuple and the extracted bound parameters
+        # of the original statement are used as is
+        statement._set_memoized_attribute(
+            "_generate_cache_key",
+            _memoized_cache_key(
+                cache_key._replace(
+                    params=util.EMPTY_DICT.merge_with(cache_key.params, params)
+                )
+            ),
+        )
+        return statement  # type: ignore[no-any-return]
+
+
+def _memoized_cache_key(cache_key: CacheKey) -> Callable[[], CacheKey]:
+    def _generate_cache_key() -> CacheKey:
+        return cache_key
+
+    return _generate_cache_key
+
+
 class AnalyzedCode:
     __slots__ = (
         "track_closure_variables",
@@ -36,6 +36,7 @@ from ._collections import Properties as Properties
 from ._collections import ReadOnlyContainer as ReadOnlyContainer
 from ._collections import ReadOnlyProperties as ReadOnlyProperties
 from ._collections import ScopedRegistry as ScopedRegistry
+from ._collections import SegmentedLRUCache as SegmentedLRUCache
 from ._collections import sort_dictionary as sort_dictionary
 from ._collections import ThreadLocalRegistry as ThreadLocalRegistry
 from ._collections import to_column_set as to_column_set
@@ -10,6 +10,7 @@
 
 from __future__ import annotations
 
+import collections
 import operator
 import threading
 import types
@@ -555,6 +556,213 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
             self._mutex.release()
 
 
+_NOT_FOUND: Any = object()
+
+
+class SegmentedLRUCache(typing.MutableMapping[_KT, _VT]):
+    """Dictionary with removal of least recently used items that maintains
+    its size with constant-time operations, optionally bounded by a total
+    "weight" of its values in addition to the number of items.
+
+    Items are first placed in a "probationary" segment, and are moved into
+    a "protected" segment when accessed a second time.  Items are evicted
+    from the least recently used end of the probationary segment first,
+    and items pushed out of a full protected segment are placed back into
+    the probationary segment, so that a burst of items that are used only
+    once doesn't displace items that are used repeatedly.
+
+    As is the case with :class:`.LRUCache`, the number of items may grow
+    past ``capacity`` by ``threshold`` before items are evicted, at which
+    point the cache is pruned back down to ``capacity`` in one step.  The
+    weight of the cache never exceeds ``max_weight``; when that limit would
+    be passed, the probationary segment is pruned so that the total is
+    ``max_weight / (1 + threshold)``, and items in the protected segment are
+    evicted only if the limit is still exceeded.  The item being set is
+    not evicted by this pruning; an item that alone weighs more than
+    ``max_weight / (1 + threshold)`` isn't stored at all.
+    Unlike :class:`.LRUCache`, pruning pops items from the least recently
+    used end of each segment rather than sorting the whole cache.  The
+    ``size_alert`` callable is invoked after pruning, outside of the
+    cache's mutex.   As is the case with :class:`.LRUCache`, get() or []
+    should be used rather than an "in" check.
+
+    """
+
+    __slots__ = (
+        "capacity",
+        "threshold",
+        "max_weight",
+        "weigher",
+        "size_alert",
+        "_protected_capacity",
+        "_probation",
+        "_protected",
+        "_weight",
+        "_mutex",
+    )
+
+    capacity: int
+    threshold: float
+    max_weight: Optional[int]
+    weigher: Optional[Callable[[_VT], int]]
+    size_alert: Optional[Callable[[SegmentedLRUCache[_KT, _VT], int], None]]
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[_VT], int]] = None,
+        protected_ratio: float = 0.8,
+        size_alert: Optional[Callable[..., None]] = None,
+        threshold: float = 0.5,
+    ):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.size_alert = size_alert
+        self._protected_capacity = int(capacity * protected_ratio)
+        self._probation: collections.OrderedDict[_KT, Tuple[_VT, int]] = (
+            collections.OrderedDict()
+        )
+        self._protected: collections.OrderedDict[_KT, Tuple[_VT, int]] = (
+            collections.OrderedDict()
+        )
+        self._weight = 0
+        self._mutex = threading.Lock()
+
+    @property
+    def weight(self) -> int:
+        """total weight of all items currently in the cache."""
+        return self._weight
+
+    @overload
+    def get(self, key: _KT) -> Optional[_VT]: ...
+
+    @overload
+    def get(self, key: _KT, default: Union[_VT, _T]) -> Union[_VT, _T]: ...
+
+    def get(
+        self, key: _KT, default: Optional[Union[_VT, _T]] = None
+    ) -> Optional[Union[_VT, _T]]:
+        protected = True
+        item = self._protected.get(key)
+        if item is None:
+            protected = False
+            item = self._probation.get(key)
+            if item is None:
+                return default
+
+        # reordering of the segments is skipped if another thread is
+        # modifying the cache, in which case the item retains its current
+        # position until it's next accessed, rather than the caller
+        # waiting on the mutex
+        if self._mutex.acquire(False):
+            try:
+                if protected:
+                    if key in self._protected:
+                        self._protected.move_to_end(key)
+                else:
+                    self._promote(key)
+            finally:
+                self._mutex.release()
+        return item[0]
+
+    def __getitem__(self, key: _KT) -> _VT:
+        item = self.get(key, _NOT_FOUND)
+        if item is _NOT_FOUND:
+            raise KeyError(key)
+        return cast("_VT", item)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._protected or key in self._probation
+
+    def __iter__(self) -> Iterator[_KT]:
+        return iter(list(self._probation) + list(self._protected))
+
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        weight = self.weigher(value) if self.weigher is not None else 1
+        # an item which would take up most of the cache on its own isn't
+        # stored, rather than evicting everything else to make room for it
+        too_heavy = (
+            self.max_weight is not None
+            and weight > self.max_weight / (1 + self.threshold)
+        )
+        with self._mutex:
+            self._discard(key)
+            if too_heavy:
+                return
+            self._probation[key] = (value, weight)
+            self._weight += weight
+            num_evicted = self._manage_size()
+
+        if num_evicted and self.size_alert is not None:
+            self.size_alert(self, num_evicted)
+
+    def __delitem__(self, key: _KT) -> None:
+        with self._mutex:
+            if not self._discard(key):
+                raise KeyError(key)
+
+    def clear(self) -> None:
+        with self._mutex:
+            self._probation.clear()
+            self._protected.clear()
+            self._weight = 0
+
+    def _discard(self, key: _KT) -> bool:
+        item = self._protected.pop(key, None)
+        if item is None:
+            item = self._probation.pop(key, None)
+            if item is None:
+                return False
+        self._weight -= item[1]
+        return True
+
+    def _promote(self, key: _KT) -> None:
+        item = self._probation.pop(key, None)
+        if item is None:
+            return
+        protected = self._protected
+        protected[key] = item
+        while len(protected) > self._protected_capacity:
+            demoted_key, demoted = protected.popitem(last=False)
+            self._probation[demoted_key] = demoted
+
+    def _manage_size(self) -> int:
+        probation = self._probation
+        protected = self._protected
+        num_evicted = 0
+
+        if len(self) > self.capacity + self.capacity * self.threshold:
+            while len(self) > self.capacity:
+                segment = probation or protected
+                _, (_, weight) = segment.popitem(last=False)
+                self._weight -= weight
+                num_evicted += 1
+
+        max_weight = self.max_weight
+        if max_weight is not None and self._weight > max_weight:
+            target_weight = max_weight / (1 + self.threshold)
+
+            # the item just set is at the most recently used end of the
+            # probationary segment, and is retained
+            while self._weight > target_weight and len(probation) > 1:
+                _, (_, weight) = probation.popitem(last=False)
+                self._weight -= weight
+                num_evicted += 1
+
+            while self._weight > max_weight and protected:
+                _, (_, weight) = protected.popitem(last=False)
+                self._weight -= weight
+                num_evicted += 1
+
+        return num_evicted
+
+
 class _CreateFuncType(Protocol[_T_co]):
     def __call__(self) -> _T_co: ...
 
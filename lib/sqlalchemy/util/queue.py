@@ -23,19 +23,24 @@ from __future__ import annotations
 
 import asyncio
 from collections import deque
+import heapq
+import itertools
 import threading
 from time import time as _time
 from typing import Any
+from typing import cast
 from typing import Deque
 from typing import Generic
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 
 from .concurrency import await_
 from .langhelpers import memoized_property
 
 _T = TypeVar("_T", bound=Any)
-__all__ = ["Empty", "Full", "Queue"]
+__all__ = ["Empty", "Full", "Queue", "ConcurrentQueue", "FairQueue"]
 
 
 class Empty(Exception):
@@ -79,6 +84,12 @@ class QueueCommon(Generic[_T]):
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
         raise NotImplementedError()
 
+    def snapshot(self) -> List[_T]:
+        raise NotImplementedError()
+
+    def remove(self, item: _T) -> bool:
+        raise NotImplementedError()
+
 
 class Queue(QueueCommon[_T]):
     queue: Deque[_T]
@@ -209,6 +220,28 @@ class Queue(QueueCommon[_T]):
 
         return self.get(False)
 
+    def snapshot(self) -> List[_T]:
+        """Return a list of the items currently in the queue, without
+        removing them."""
+
+        with self.mutex:
+            return list(self.queue)
+
+    def remove(self, item: _T) -> bool:
+        """Remove the given item from the queue without blocking.
+
+        Returns False if the item is no longer present, such as if it
+        was received by a call to ``get()``.
+
+        """
+        with self.mutex:
+            try:
+                self.queue.remove(item)
+            except ValueError:
+                return False
+            self.not_full.notify()
+            return True
+
     def _init(self, maxsize: int) -> None:
         self.maxsize = maxsize
         self.queue = deque()
@@ -234,6 +267,203 @@ class Queue(QueueCommon[_T]):
             return self.queue.popleft()
 
 
+class _Waiter(Generic[_T]):
+    __slots__ = ("cond", "item", "done")
+
+    item: Optional[_T]
+
+    def __init__(self, mutex: threading.RLock):
+        self.cond = threading.Condition(mutex)
+        self.item = None
+        self.done = False
+
+
+class FairQueue(Queue[_T]):
+    """A :class:`.Queue` which hands items to waiting ``get()`` calls in
+    order of priority, then in the order in which they began waiting.
+
+    Items passed to ``put()`` while threads are waiting are handed directly
+    to the first waiter, so that a thread calling ``get()`` later can't
+    receive an item ahead of one that's already waiting.  The ``priority``
+    argument of ``get()`` allows a waiter to be served ahead of those with
+    a lower priority.
+
+    """
+
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False):
+        super().__init__(maxsize, use_lifo)
+        self._waiters: List[Tuple[int, int, _Waiter[_T]]] = []
+        self._counter = itertools.count()
+
+    def put(
+        self, item: _T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        # the check for waiters and the put of the item take place under
+        # the same mutex, so that a get() can't begin waiting in between
+        # and miss the item
+        with self.mutex:
+            if self._waiters:
+                waiter = heapq.heappop(self._waiters)[2]
+                waiter.item = item
+                waiter.done = True
+                waiter.cond.notify()
+            else:
+                super().put(item, block, timeout)
+
+    def get(
+        self,
+        block: bool = True,
+        timeout: Optional[float] = None,
+        priority: int = 0,
+    ) -> _T:
+        with self.mutex:
+            if not self._waiters and not self._empty():
+                item = self._get()
+                self.not_full.notify()
+                return item
+            if not block:
+                raise Empty
+            if timeout is not None:
+                if timeout < 0:
+                    raise ValueError("'timeout' must be a positive number")
+                endtime = _time() + timeout
+
+            waiter: _Waiter[_T] = _Waiter(self.mutex)
+            entry = (-priority, next(self._counter), waiter)
+            heapq.heappush(self._waiters, entry)
+            while not waiter.done:
+                if timeout is None:
+                    waiter.cond.wait()
+                else:
+                    remaining = endtime - _time()
+                    if remaining <= 0.0:
+                        # not yet handed an item by put(), so still in
+                        # the heap; removed so that it doesn't prevent
+                        # later calls from receiving items directly
+                        self._waiters.remove(entry)
+                        heapq.heapify(self._waiters)
+                        raise Empty
+                    waiter.cond.wait(remaining)
+            # set by put() along with done
+            return cast(_T, waiter.item)
+
+
+class ConcurrentQueue(QueueCommon[_T]):
+    """A queue where ``get()`` and ``put()`` don't acquire a lock unless a
+    ``get()`` has to wait for an item.
+
+    Items are held in a ``collections.deque``, whose ``append()`` and
+    ``pop()`` methods are thread safe without an additional lock.  Threads
+    that need to wait register themselves under a mutex, which ``put()``
+    then only acquires when waiters are present.  Waiting threads are not
+    guaranteed to receive items ahead of threads that call ``get()``
+    later.
+
+    ``put()`` never blocks; the ``block`` and ``timeout`` arguments are
+    accepted for compatibility, and ``Full`` is raised if the queue is
+    full.
+
+    """
+
+    queue: Deque[_T]
+
+    def __init__(self, maxsize: int = 0, use_lifo: bool = False):
+        self.maxsize = maxsize
+        self.use_lifo = use_lifo
+        self.queue = deque()
+        self._get_item = self.queue.pop if use_lifo else self.queue.popleft
+        # reentrant for the same reason as that of Queue
+        self.mutex = threading.RLock()
+        self.not_empty = threading.Condition(self.mutex)
+        self._waiters = 0
+
+    def qsize(self) -> int:
+        return len(self.queue)
+
+    def empty(self) -> bool:
+        return not self.queue
+
+    def full(self) -> bool:
+        return self.maxsize > 0 and len(self.queue) >= self.maxsize
+
+    def put(
+        self, item: _T, block: bool = True, timeout: Optional[float] = None
+    ) -> None:
+        queue = self.queue
+        maxsize = self.maxsize
+        if maxsize > 0:
+            if len(queue) >= maxsize:
+                raise Full
+            queue.append(item)
+
+            # a concurrent put() may have passed the same check; if the
+            # queue is now over size, take back our item unless a get()
+            # already received it
+            if len(queue) > maxsize:
+                try:
+                    queue.remove(item)
+                except ValueError:
+                    pass
+                else:
+                    raise Full
+        else:
+            queue.append(item)
+
+        # waiters increment this count before checking the queue a final
+        # time, so either the waiter sees the item appended above, or the
+        # count is seen here
+        if self._waiters:
+            with self.not_empty:
+                self.not_empty.notify()
+
+    def put_nowait(self, item: _T) -> None:
+        return self.put(item, False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
+        try:
+            return self._get_item()
+        except IndexError:
+            pass
+
+        if not block:
+            raise Empty
+        if timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a positive number")
+            endtime = _time() + timeout
+
+        with self.not_empty:
+            self._waiters += 1
+            try:
+                while True:
+                    try:
+                        return self._get_item()
+                    except IndexError:
+                        pass
+                    if timeout is None:
+                        self.not_empty.wait()
+                    else:
+                        remaining = endtime - _time()
+                        if remaining <= 0.0:
+                            raise Empty
+                        self.not_empty.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+    def get_nowait(self) -> _T:
+        return self.get(False)
+
+    def snapshot(self) -> List[_T]:
+        return list(self.queue.copy())
+
+    def remove(self, item: _T) -> bool:
+        try:
+            self.queue.remove(item)
+        except ValueError:
+            return False
+        return True
+
+
 class AsyncAdaptedQueue(QueueCommon[_T]):
     def __init__(self, maxsize: int = 0, use_lifo: bool = False):
         self.use_lifo = use_lifo
@@ -302,3 +532,31 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
                 return await_(self._queue.get())
         except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
             raise Empty() from err
+
+    def _drain(self) -> List[_T]:
+        # items in the order in which they'd be received by get();
+        # doesn't yield to the event loop, so no other task can access
+        # the queue before _refill() is called
+        queue = self._queue
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    def _refill(self, items: List[_T]) -> None:
+        queue = self._queue
+        for item in reversed(items) if self.use_lifo else items:
+            queue.put_nowait(item)
+
+    def snapshot(self) -> List[_T]:
+        items = self._drain()
+        self._refill(items)
+        # in the order that they're stored, as with the other queues
+        return items[::-1] if self.use_lifo else items
+
+    def remove(self, item: _T) -> bool:
+        items = self._drain()
+        try:
+            items.remove(item)
+        except ValueError:
+            return False
+        finally:
+            self._refill(items)
+        return True
@@ -317,6 +317,41 @@ class ResultTest(fixtures.TestBase):
 
         return res
 
+    @testing.combinations((1,), (4,), (10,), argnames="num_processors")
+    @testing.variation("filtered", [True, False])
+    def test_processors_many_rows(self, num_processors, filtered):
+        """processors are applied per row or column-wise depending on
+        how many columns have a processor; the outcome is the same."""
+
+        keys = ["c%d" % i for i in range(10)]
+        processors = [str] * num_processors + [None] * (10 - num_processors)
+        data = [tuple(range(i, i + 10)) for i in range(25)]
+
+        def go():
+            return result.IteratorResult(
+                result.SimpleResultMetaData(keys, _processors=processors),
+                iter(data),
+            )
+
+        expected = [
+            tuple(str(v) if processors[i] else v for i, v in enumerate(row))
+            for row in data
+        ]
+        if filtered:
+            cols = (9, 0, 5)
+            expected = [tuple(row[i] for i in cols) for row in expected]
+
+        def make():
+            res = go()
+            return res.columns(*cols) if filtered else res
+
+        eq_(make().all(), expected)
+        eq_([tuple(r) for r in make().fetchmany(7)], expected[0:7])
+        eq_(
+            [row for part in make().partitions(10) for row in part],
+            expected,
+        )
+
     def test_close_attributes(self):
         """test #8710"""
         r1 = self._fixture()
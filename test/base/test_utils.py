@@ -1577,6 +1577,195 @@ class LRUTest(fixtures.TestBase):
         assert lru[25] is i2
 
 
+class SegmentedLRUTest(fixtures.TestBase):
+    def test_capacity(self):
+        canary = mock.Mock()
+        lru = util.SegmentedLRUCache(10, size_alert=canary)
+
+        for id_ in range(1, 16):
+            lru[id_] = str(id_)
+
+        # grows past capacity up to the threshold
+        eq_(len(lru), 15)
+        eq_(canary.mock_calls, [])
+
+        lru[16] = "16"
+
+        # then is pruned back to capacity in one step
+        eq_(len(lru), 10)
+        for id_ in range(1, 7):
+            assert id_ not in lru
+        for id_ in range(7, 17):
+            eq_(lru[id_], str(id_))
+
+        eq_(canary.mock_calls, [mock.call(lru, 6)])
+
+    def test_capacity_no_threshold(self):
+        canary = mock.Mock()
+        lru = util.SegmentedLRUCache(10, size_alert=canary, threshold=0)
+
+        for id_ in range(1, 16):
+            lru[id_] = str(id_)
+
+        eq_(len(lru), 10)
+        for id_ in range(6, 16):
+            eq_(lru[id_], str(id_))
+
+        eq_(canary.mock_calls, [mock.call(lru, 1)] * 5)
+
+    def test_size_alert_outside_mutex(self):
+        def size_alert(cache, num_evicted):
+            # would deadlock if called while the mutex is held
+            del cache[20]
+            canary(num_evicted)
+
+        canary = mock.Mock()
+        lru = util.SegmentedLRUCache(4, size_alert=size_alert)
+        for id_ in range(15, 22):
+            lru[id_] = str(id_)
+
+        eq_(canary.mock_calls, [mock.call(3)])
+        eq_(set(lru), {18, 19, 21})
+
+    def test_protected_survives_scan(self):
+        lru = util.SegmentedLRUCache(10, protected_ratio=0.5, threshold=0)
+
+        for id_ in range(1, 6):
+            lru[id_] = str(id_)
+        for id_ in range(1, 6):
+            # second access promotes to protected segment
+            eq_(lru.get(id_), str(id_))
+
+        # a long run of items used only once
+        for id_ in range(100, 150):
+            lru[id_] = str(id_)
+
+        eq_(len(lru), 10)
+        for id_ in range(1, 6):
+            eq_(lru.get(id_), str(id_))
+        for id_ in range(145, 150):
+            assert id_ in lru
+        assert 144 not in lru
+
+    def test_demote_from_protected(self):
+        lru = util.SegmentedLRUCache(4, protected_ratio=0.5, threshold=0)
+        for id_ in range(1, 5):
+            lru[id_] = str(id_)
+        lru[1]
+        lru[2]
+        lru[3]
+
+        # 1 was pushed back into probation, and is evicted before 2 and 3
+        lru[5] = "5"
+        lru[6] = "6"
+        eq_(set(lru), {2, 3, 5, 6})
+
+    def test_weight(self):
+        canary = mock.Mock()
+        lru = util.SegmentedLRUCache(
+            100, max_weight=20, weigher=len, size_alert=canary, threshold=0
+        )
+        lru["a"] = "x" * 5
+        lru["b"] = "x" * 5
+        lru["c"] = "x" * 5
+        eq_(lru.weight, 15)
+
+        lru["d"] = "x" * 12
+        eq_(set(lru), {"c", "d"})
+        eq_(lru.weight, 17)
+        eq_(canary.mock_calls, [mock.call(lru, 2)])
+
+        # replace existing item
+        lru["c"] = "x"
+        eq_(lru.weight, 13)
+
+        # an item that can't fit at all isn't stored
+        lru["e"] = "x" * 30
+        eq_(set(lru), {"c", "d"})
+        eq_(lru.weight, 13)
+        eq_(canary.mock_calls, [mock.call(lru, 2)])
+
+    def test_weight_threshold(self):
+        canary = mock.Mock()
+        lru = util.SegmentedLRUCache(
+            100, max_weight=30, weigher=len, size_alert=canary
+        )
+        for key in "abcdef":
+            lru[key] = "x" * 5
+        eq_(lru.weight, 30)
+        eq_(canary.mock_calls, [])
+
+        # weight is pruned to 30 / 1.5 in one step
+        lru["g"] = "x" * 5
+        eq_(set(lru), {"d", "e", "f", "g"})
+        eq_(lru.weight, 20)
+        eq_(canary.mock_calls, [mock.call(lru, 3)])
+
+    def test_weight_large_item(self):
+        canary = mock.Mock()
+        lru = util.SegmentedLRUCache(
+            100, max_weight=30, weigher=len, size_alert=canary
+        )
+        lru["a"] = "x" * 5
+        lru["b"] = "x" * 5
+        lru["a"]
+        lru["b"]
+        lru["c"] = "x" * 5
+
+        # the probationary segment is pruned, but not the item being set;
+        # the protected segment is left alone as the result is within
+        # max_weight
+        lru["d"] = "x" * 19
+        eq_(set(lru), {"a", "b", "d"})
+        eq_(lru.weight, 29)
+        eq_(canary.mock_calls, [mock.call(lru, 1)])
+
+        # heavier than max_weight / (1 + threshold); not stored, and
+        # nothing else is evicted
+        lru["e"] = "x" * 21
+        eq_(set(lru), {"a", "b", "d"})
+        eq_(lru.weight, 29)
+        eq_(canary.mock_calls, [mock.call(lru, 1)])
+
+        # an existing value for the key is removed
+        lru["d"] = "x" * 21
+        eq_(set(lru), {"a", "b"})
+        eq_(lru.weight, 10)
+
+    def test_weight_evicts_protected_past_max_weight(self):
+        lru = util.SegmentedLRUCache(100, max_weight=30, weigher=len)
+        for key in "abc":
+            lru[key] = "x" * 8
+            lru[key]
+
+        lru["d"] = "x" * 18
+        eq_(set(lru), {"c", "d"})
+        eq_(lru.weight, 26)
+
+    def test_mapping_api(self):
+        lru = util.SegmentedLRUCache(10)
+        lru["a"] = 1
+        lru["b"] = 2
+        lru["b"]
+
+        eq_(lru["a"], 1)
+        eq_(lru.get("c"), None)
+        eq_(lru.get("c", 5), 5)
+        assert_raises(KeyError, lambda: lru["c"])
+
+        del lru["a"]
+        assert "a" not in lru
+        assert_raises(KeyError, lru.__delitem__, "a")
+
+        del lru["b"]
+        eq_(len(lru), 0)
+
+        lru["a"] = 1
+        lru.clear()
+        eq_(len(lru), 0)
+        eq_(lru.weight, 0)
+
+
 class ImmutableSubclass(str):
     pass
 
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 from sqlalchemy import Column
 from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import Numeric
@@ -654,6 +655,32 @@ class FastExecutemanyTest(fixtures.TestBase):
 
             conn.execute(t.insert(), {"id": 200, "data": "data_200"})
 
+    def test_bulk_load(self, metadata):
+        t = Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        t.create(testing.db)
+
+        eng = engines.testing_engine()
+        canary = mock.Mock()
+
+        @event.listens_for(eng, "after_cursor_execute")
+        def after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            canary(executemany, cursor.fast_executemany)
+
+        with eng.begin() as conn:
+            conn.bulk_load(
+                t, [{"id": i, "data": "data_%d" % i} for i in range(100)]
+            )
+            eq_(conn.scalar(select(func.count()).select_from(t)), 100)
+
+        eq_(canary.mock_calls[0], mock.call(True, True))
+
     @testing.variation("add_event", [True, False])
     @testing.variation("setinputsizes", [True, False])
     @testing.variation("fastexecutemany", [True, False])
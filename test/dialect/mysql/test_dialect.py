@@ -1,14 +1,19 @@
 import datetime
+import decimal
+import os
 
 from sqlalchemy import bindparam
 from sqlalchemy import Column
+from sqlalchemy import create_engine
 from sqlalchemy import DateTime
 from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import func
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import Numeric
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy.dialects import mysql
@@ -255,12 +260,17 @@ class BackendDialectTest(
                 [
                     "SHOW VARIABLES LIKE 'sql_mode'",
                     "SHOW VARIABLES LIKE 'lower_case_table_names'",
+                    "SHOW VARIABLES LIKE 'max_allowed_packet'",
                 ],
             )
         else:
             eq_(
                 fetches,
-                ["SELECT @@sql_mode", "SELECT @@lower_case_table_names"],
+                [
+                    "SELECT @@sql_mode",
+                    "SELECT @@lower_case_table_names",
+                    "SELECT @@max_allowed_packet",
+                ],
             )
 
     def test_autocommit_isolation_level(self):
@@ -798,3 +808,108 @@ class ExecutionTest(fixtures.TestBase):
     def test_sysdate(self, connection):
         d = connection.execute(func.sysdate()).scalar()
         assert isinstance(d, datetime.datetime)
+
+
+class LoadDataTest(fixtures.TestBase):
+    """test bulk_load using LOAD DATA LOCAL INFILE for mysqlclient /
+    pymysql, against a mock DBAPI."""
+
+    @testing.fixture
+    def table(self):
+        return Table(
+            "some%table",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("some data", String(50), key="data"),
+            Column("amount", Numeric(10, 2)),
+            Column("created", DateTime),
+            Column("counter", Integer, default=5),
+        )
+
+    def _engine(self, **kw):
+        dbapi = mock.Mock(paramstyle="format")
+        dbapi.connect.return_value.cursor.return_value.description = None
+        return create_engine(
+            "mysql+pymysql://", module=dbapi, _initialize=False, **kw
+        )
+
+    def test_load_data(self, table):
+        eng = self._engine(use_load_data_local_infile=True)
+
+        loaded = []
+
+        def execute(statement, parameters):
+            with open(parameters[0], "rb") as file_:
+                loaded.append((statement, parameters[0], file_.read()))
+
+        with eng.connect() as conn:
+            cursor = conn.connection.dbapi_connection.cursor()
+            cursor.execute.side_effect = execute
+
+            conn.bulk_load(
+                table,
+                [
+                    {
+                        "id": 1,
+                        "data": "tab\there",
+                        "amount": decimal.Decimal("1.50"),
+                        "created": datetime.datetime(2025, 3, 4, 12, 30),
+                    },
+                    {
+                        "id": 2,
+                        "data": None,
+                        "amount": None,
+                        "created": None,
+                    },
+                ],
+            )
+
+        eq_(len(loaded), 1)
+        statement, file_name, data = loaded[0]
+        eq_(
+            statement,
+            "LOAD DATA LOCAL INFILE %s INTO TABLE `some%%table` "
+            "CHARACTER SET utf8mb4 (id, `some data`, amount, created, "
+            "counter)",
+        )
+        eq_(
+            data,
+            b"1\ttab\\there\t1.50\t2025-03-04 12:30:00\t5\n"
+            b"2\t\\N\t\\N\t\\N\t5\n",
+        )
+        is_(os.path.exists(file_name), False)
+        eq_(cursor.executemany.mock_calls, [])
+
+    def test_not_enabled(self, table):
+        eng = self._engine()
+
+        with eng.connect() as conn:
+            cursor = conn.connection.dbapi_connection.cursor()
+
+            conn.bulk_load(
+                table,
+                [
+                    {"id": 1, "data": "d1", "amount": None, "created": None},
+                    {"id": 2, "data": "d2", "amount": None, "created": None},
+                ],
+            )
+
+        eq_(cursor.execute.mock_calls, [])
+        eq_(len(cursor.executemany.mock_calls), 1)
+
+    @testing.combinations(
+        (None, b"\\N"),
+        ("a\tb\nc\\d", b"a\\tb\\nc\\\\d"),
+        (b"\x00\r", b"\\0\\r"),
+        ("réel", "réel".encode("utf-8")),
+        (True, b"1"),
+        (12, b"12"),
+        (datetime.date(2025, 1, 2), b"2025-01-02"),
+        (datetime.timedelta(hours=26, seconds=5), b"26:00:05.000000"),
+        (
+            -datetime.timedelta(minutes=1, microseconds=5),
+            b"-0:01:00.000005",
+        ),
+    )
+    def test_load_data_field(self, value, expected):
+        eq_(mysqldb._load_data_field(value), expected)
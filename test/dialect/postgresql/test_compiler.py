@@ -2196,6 +2196,25 @@ class CompileTest(fixtures.TestBase, AssertsCompiledSQL):
             checkparams={"param_1": 5},
         )
 
+    def test_in_as_array(self):
+        c = column("x", Integer)
+
+        self.assert_compile(
+            select(c).where(
+                c.comparator.operate(
+                    operators.in_op, bindparam("keys"), in_as_array=True
+                )
+            ),
+            "SELECT x WHERE x = ANY (%(keys)s::INTEGER[])",
+            checkparams={"keys": [1, 2, 3]},
+            params={"keys": [1, 2, 3]},
+        )
+
+        self.assert_compile(
+            select(c).where(c.in_(bindparam("keys"))),
+            "SELECT x WHERE x IN (__[POSTCOMPILE_keys])",
+        )
+
     def test_array_deprecated_any_all(self):
         c = Column("x", postgresql.ARRAY(Integer))
 
@@ -4346,6 +4365,103 @@ class InsertOnConflictTest(
             )
 
 
+class InsertCopyTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = postgresql.dialect()
+
+    @testing.fixture
+    def table(self, metadata):
+        return Table(
+            "mytable",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50)),
+            Column("counter", Integer, default=5),
+            Column("created", Date, server_default=func.current_date()),
+            schema="myschema",
+        )
+
+    def _compile(self, stmt, dialect=None, keys=("id", "name")):
+        return stmt.compile(
+            dialect=dialect or self.__dialect__,
+            column_keys=list(keys),
+            for_executemany=True,
+        )
+
+    def test_copy(self, table):
+        stmt = insert(table).with_dialect_options(postgresql_copy=True)
+        compiled = self._compile(stmt)
+
+        copy_from = compiled._postgresql_copy
+        eq_(
+            copy_from.statement,
+            "COPY myschema.mytable (id, name, counter) FROM STDIN",
+        )
+        is_(copy_from.table, table)
+        eq_(copy_from.column_names, ["id", "name", "counter"])
+        eq_(compiled._bulk_load.bind_names, ["id", "name", "counter"])
+
+        # the INSERT is still rendered, for use with a single set of
+        # parameters
+        eq_(
+            compiled.string,
+            "INSERT INTO myschema.mytable (id, name, counter) VALUES "
+            "(%(id)s::INTEGER, %(name)s::VARCHAR, %(counter)s::INTEGER)",
+        )
+
+    def test_copy_quoted_names(self, metadata):
+        t = Table(
+            "My Table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("some name", String(50), key="name"),
+        )
+        stmt = insert(t).with_dialect_options(postgresql_copy=True)
+        compiled = self._compile(stmt)
+        copy_from = compiled._postgresql_copy
+
+        eq_(
+            copy_from.statement,
+            'COPY "My Table" (id, "some name") FROM STDIN',
+        )
+        eq_(copy_from.column_names, ["id", "some name"])
+        eq_(compiled._bulk_load.bind_names, ["id", "name"])
+
+    def test_no_copy_single_execute(self, table):
+        stmt = insert(table).with_dialect_options(postgresql_copy=True)
+        compiled = stmt.compile(
+            dialect=self.__dialect__, column_keys=["id", "name"]
+        )
+        is_(compiled._postgresql_copy, None)
+
+    def test_no_copy_by_default(self, table):
+        is_(self._compile(insert(table))._postgresql_copy, None)
+
+    @testing.combinations(
+        (lambda stmt, t: stmt.returning(t.c.id), "includes RETURNING"),
+        (
+            lambda stmt, t: stmt.on_conflict_do_nothing(),
+            "ON CONFLICT",
+        ),
+        (
+            lambda stmt, t: stmt.from_select(
+                ["id", "name"], select(t.c.id, t.c.name)
+            ),
+            "INSERT..SELECT",
+        ),
+        (
+            lambda stmt, t: stmt.values(name=func.lower("Name")),
+            "column mytable.name, which receives a SQL expression",
+        ),
+        argnames="fn, message",
+    )
+    def test_copy_not_supported(self, table, fn, message):
+        stmt = fn(
+            insert(table).with_dialect_options(postgresql_copy=True), table
+        )
+        with expect_raises_message(exc.CompileError, message):
+            self._compile(stmt)
+
+
 class DistinctOnTest(
     fixtures.MappedTest,
     AssertsCompiledSQL,
@@ -15,11 +15,13 @@ from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import extract
 from sqlalchemy import func
+from sqlalchemy import insert
 from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import literal
 from sqlalchemy import MetaData
 from sqlalchemy import Numeric
+from sqlalchemy import orm
 from sqlalchemy import schema
 from sqlalchemy import select
 from sqlalchemy import Sequence
@@ -61,6 +63,7 @@ from sqlalchemy.testing.assertions import expect_raises
 from sqlalchemy.testing.assertions import in_
 from sqlalchemy.testing.assertions import ne_
 from sqlalchemy.testing.assertions import not_in
+from sqlalchemy.testing.entities import ComparableEntity
 
 
 class DialectTest(fixtures.TestBase):
@@ -942,6 +945,118 @@ class ExecutemanyFlagOptionsTest(fixtures.TablesTest):
             )
 
 
+class CopyInsertTest(fixtures.TablesTest):
+    __only_on__ = ("postgresql+psycopg", "postgresql+asyncpg")
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", JSONB),
+            Column("z", Integer, server_default="5"),
+            Column("q", Integer, default=10),
+        )
+
+    @testing.fixture
+    def statements(self, connection):
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            statements.append(statement)
+
+        return statements
+
+    def test_copy(self, connection, statements):
+        data = self.tables.data
+
+        result = connection.execute(
+            data.insert().with_dialect_options(postgresql_copy=True),
+            [
+                {"id": 1, "x": "x1", "y": {"a": 1}},
+                {"id": 2, "x": None, "y": None},
+                {"id": 3, "x": "x3", "y": [1, 2]},
+            ],
+        )
+        eq_(result.rowcount, 3)
+        eq_(statements, ["COPY data (id, x, y, q) FROM STDIN"])
+
+        eq_(
+            connection.execute(select(data).order_by(data.c.id)).all(),
+            [
+                (1, "x1", {"a": 1}, 5, 10),
+                (2, None, None, 5, 10),
+                (3, "x3", [1, 2], 5, 10),
+            ],
+        )
+
+    def test_single_row_uses_insert(self, connection, statements):
+        data = self.tables.data
+
+        connection.execute(
+            data.insert().with_dialect_options(postgresql_copy=True),
+            [{"id": 1, "x": "x1"}],
+        )
+        eq_(len(statements), 1)
+        assert statements[0].startswith("INSERT INTO data")
+
+    @testing.only_if(lambda c: c.db.dialect.supports_pipeline)
+    def test_pipeline_uses_insert(self, connection, statements):
+        data = self.tables.data
+
+        with connection.pipeline():
+            connection.execute(
+                data.insert().with_dialect_options(postgresql_copy=True),
+                [{"id": 1, "x": "x1"}, {"id": 2, "x": "x2"}],
+            )
+        eq_(len(statements), 1)
+        assert statements[0].startswith("INSERT INTO data")
+
+        eq_(
+            connection.execute(
+                select(data.c.id, data.c.x).order_by(data.c.id)
+            ).all(),
+            [(1, "x1"), (2, "x2")],
+        )
+
+    def test_copy_error(self, connection):
+        data = self.tables.data
+
+        with expect_raises(exc.IntegrityError):
+            connection.execute(
+                data.insert().with_dialect_options(postgresql_copy=True),
+                [{"id": 1, "x": "x1"}, {"id": 1, "x": "x2"}],
+            )
+
+    def test_orm_bulk_insert(self, connection, statements):
+        data = self.tables.data
+
+        class Data(ComparableEntity):
+            pass
+
+        registry = orm.registry()
+        registry.map_imperatively(Data, data)
+        try:
+            with orm.Session(connection) as session:
+                session.execute(
+                    insert(Data).with_dialect_options(postgresql_copy=True),
+                    [{"id": 1, "x": "x1"}, {"id": 2, "x": "x2"}],
+                )
+                eq_(statements, ["COPY data (id, x, q) FROM STDIN"])
+                eq_(
+                    session.scalars(select(Data).order_by(Data.id)).all(),
+                    [Data(id=1, x="x1", z=5), Data(id=2, x="x2", z=5)],
+                )
+        finally:
+            registry.dispose()
+
+
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
 ):
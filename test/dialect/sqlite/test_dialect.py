@@ -796,6 +796,25 @@ class InsertTest(fixtures.TestBase, AssertsExecutionResults):
             [(None, 123), (456, None)],
         )
 
+    def test_bulk_load_autocommit(self, metadata):
+        """in autocommit mode, the rows are loaded within a single
+        transaction"""
+
+        t = Table("t", metadata, Column("id", Integer, primary_key=True))
+        metadata.create_all(testing.db)
+
+        with testing.db.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            with expect_raises(exc.IntegrityError):
+                conn.bulk_load(t, [{"id": 1}, {"id": 2}, {"id": 1}])
+            eq_(conn.scalar(select(func.count()).select_from(t)), 0)
+
+            conn.bulk_load(t, [{"id": 1}, {"id": 2}])
+
+        with testing.db.connect() as conn:
+            eq_(conn.scalar(select(func.count()).select_from(t)), 2)
+
 
 def full_text_search_missing():
     """Test if full text search is not implemented and return False if
@@ -32,8 +32,10 @@ from sqlalchemy import util
 from sqlalchemy import VARCHAR
 from sqlalchemy.connectors.asyncio import AsyncAdapt_dbapi_module
 from sqlalchemy.engine import BindTyping
+from sqlalchemy.engine import CompiledCacheStatistics
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.engine.interfaces import ExecuteStyle
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.pool import NullPool
@@ -47,9 +49,11 @@ from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_none
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import ne_
@@ -947,6 +951,147 @@ class ExecuteDriverTest(fixtures.TablesTest):
         )
 
 
+class PipelineTest(fixtures.TablesTest):
+    __only_on__ = "sqlite"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.users.insert(),
+            [{"user_id": i, "user_name": "u%d" % i} for i in range(1, 5)],
+        )
+
+    @testing.fixture
+    def pipeline_engine(self):
+        """the testing engine, with its dialect claiming pipeline support;
+        statements still execute right away on the sqlite DBAPI, so only
+        the points at which the pipeline is synced are observable."""
+
+        eng = testing.db
+        pipeline = Mock(name="pipeline")
+        with (
+            patch.object(eng.dialect, "supports_pipeline", True),
+            patch.object(
+                eng.dialect,
+                "do_pipeline",
+                Mock(side_effect=lambda dbapi_conn: nullcontext(pipeline)),
+            ),
+            patch.object(eng.dialect, "do_pipeline_sync", Mock()),
+        ):
+            yield eng
+
+    def test_not_supported(self):
+        users = self.tables.users
+
+        with patch.object(testing.db.dialect, "do_pipeline") as do_pipeline:
+            with testing.db.begin() as conn:
+                with conn.pipeline() as pipelined:
+                    is_(pipelined, conn)
+                    result = conn.execute(users.update().values(user_name="x"))
+                    eq_(result.rowcount, 4)
+                    is_(conn._pipeline, None)
+
+        eq_(do_pipeline.mock_calls, [])
+
+    def test_dml_deferred(self, pipeline_engine):
+        users = self.tables.users
+        dialect = pipeline_engine.dialect
+
+        with pipeline_engine.begin() as conn:
+            with conn.pipeline():
+                r1 = conn.execute(
+                    users.update()
+                    .where(users.c.user_id > 2)
+                    .values(user_name="x")
+                )
+                r2 = conn.execute(users.delete().where(users.c.user_id == 1))
+                eq_(dialect.do_pipeline_sync.call_count, 0)
+                is_false(r1.returns_rows)
+
+                # accessing rowcount receives all pending results
+                eq_(r1.rowcount, 2)
+                eq_(dialect.do_pipeline_sync.call_count, 1)
+                eq_(r2.rowcount, 1)
+                eq_(dialect.do_pipeline_sync.call_count, 1)
+
+                r3 = conn.execute(
+                    users.insert(), {"user_id": 5, "user_name": "u5"}
+                )
+            eq_(dialect.do_pipeline_sync.call_count, 2)
+            eq_(r3.rowcount, 1)
+            is_(conn._pipeline, None)
+
+            eq_(
+                conn.execute(
+                    select(users.c.user_name).order_by(users.c.user_id)
+                ).all(),
+                [("u2",), ("x",), ("x",), ("u5",)],
+            )
+
+    def test_rows_sync(self, pipeline_engine):
+        users = self.tables.users
+        dialect = pipeline_engine.dialect
+
+        with pipeline_engine.begin() as conn:
+            with conn.pipeline():
+                r1 = conn.execute(
+                    users.update()
+                    .where(users.c.user_id == 1)
+                    .values(user_name="x")
+                )
+                eq_(dialect.do_pipeline_sync.call_count, 0)
+
+                # a statement that returns rows receives its own result
+                # and any pending ones
+                eq_(
+                    conn.scalar(
+                        select(users.c.user_name).where(users.c.user_id == 1)
+                    ),
+                    "x",
+                )
+                eq_(dialect.do_pipeline_sync.call_count, 1)
+                eq_(r1.rowcount, 1)
+                eq_(dialect.do_pipeline_sync.call_count, 1)
+
+    def test_nested(self, pipeline_engine):
+        dialect = pipeline_engine.dialect
+
+        with pipeline_engine.connect() as conn:
+            with conn.pipeline():
+                with conn.pipeline():
+                    pass
+                eq_(dialect.do_pipeline_sync.call_count, 0)
+            eq_(dialect.do_pipeline.call_count, 1)
+            eq_(dialect.do_pipeline_sync.call_count, 1)
+
+    def test_sync_error(self, pipeline_engine):
+        users = self.tables.users
+        dialect = pipeline_engine.dialect
+        dialect.do_pipeline_sync.side_effect = dialect.dbapi.IntegrityError(
+            "duplicate key"
+        )
+
+        with pipeline_engine.connect() as conn:
+            with expect_raises_message(
+                tsa.exc.IntegrityError, "duplicate key"
+            ):
+                with conn.pipeline():
+                    conn.execute(
+                        users.insert(), {"user_id": 6, "user_name": "u6"}
+                    )
+            is_(conn._pipeline, None)
+
+
 class CompiledCacheTest(fixtures.TestBase):
     __sparse_driver_backend__ = True
 
@@ -1118,6 +1263,324 @@ class CompiledCacheTest(fixtures.TestBase):
         )
         eq_(conn.scalar(stmt), 1)
 
+    @testing.variation("use_callable", [True, False])
+    def test_query_cache_warmup(self, metadata, testing_engine, use_callable):
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+
+        ins = users.insert()
+        sel = select(users).where(users.c.user_id == bindparam("uid"))
+        warmup = [
+            (sel, {"uid": None}),
+            (ins, {"user_id": None, "user_name": None}),
+        ]
+
+        eng = testing_engine(
+            options={
+                "query_cache_warmup": (
+                    (lambda: warmup) if use_callable else warmup
+                )
+            }
+        )
+
+        eq_(len(eng._compiled_cache), 0)
+
+        with eng.begin() as conn:
+            eq_(len(eng._compiled_cache), 2)
+            metadata.create_all(conn)
+
+            with (
+                patch.object(
+                    ins, "_compiler", Mock(side_effect=ins._compiler)
+                ) as ins_compile,
+                patch.object(
+                    sel, "_compiler", Mock(side_effect=sel._compiler)
+                ) as sel_compile,
+            ):
+                conn.execute(ins, {"user_id": 1, "user_name": "u1"})
+                eq_(conn.execute(sel, {"uid": 1}).all(), [(1, "u1")])
+
+        eq_(ins_compile.call_count, 0)
+        eq_(sel_compile.call_count, 0)
+
+    def test_query_cache_warmup_executemany_key(self, metadata):
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True),
+            Column("user_name", VARCHAR(20)),
+        )
+        ins = users.insert()
+
+        eng = engines.testing_engine(
+            options={
+                "query_cache_warmup": [
+                    (ins, [{"user_name": None}, {"user_name": None}])
+                ]
+            }
+        )
+        with eng.connect():
+            pass
+
+        eq_(
+            [(key[2], key[4]) for key in eng._compiled_cache],
+            [(("user_name",), True)],
+        )
+
+    def test_query_cache_warmup_compile_error(self, metadata):
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True),
+            Column("user_name", VARCHAR(20)),
+        )
+
+        # "nonexistent" is not a column, raises CompileError
+        bad = users.update().values(nonexistent="x")
+        sel = select(users)
+
+        eng = engines.testing_engine(
+            options={"query_cache_warmup": [bad, sel]}
+        )
+        with expect_warnings(
+            "Could not compile statement .* for the compiled cache: "
+            "Unconsumed column names: nonexistent"
+        ):
+            with eng.connect() as conn:
+                # the remaining statement was still cached
+                eq_(len(eng._compiled_cache), 1)
+                metadata.create_all(conn)
+
+                with patch.object(
+                    sel, "_compiler", Mock(side_effect=sel._compiler)
+                ) as sel_compile:
+                    conn.execute(sel)
+                eq_(sel_compile.call_count, 0)
+
+    def test_query_cache_warmup_callable_error(self, metadata):
+        def warmup():
+            raise ValueError("no statements")
+
+        eng = engines.testing_engine(options={"query_cache_warmup": warmup})
+        with expect_warnings(
+            "Could not generate statements for query_cache_warmup: "
+            "no statements"
+        ):
+            with eng.connect() as conn:
+                eq_(conn.scalar(select(1)), 1)
+
+    def test_warm_compiled_cache(self, metadata, testing_engine):
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+        eng = testing_engine()
+
+        ins = users.insert()
+        sel = select(users.c.user_name)
+
+        eng.warm_compiled_cache(
+            [sel, (ins, [{"user_id": None}, {"user_id": None}])]
+        )
+        eq_(len(eng._compiled_cache), 2)
+
+        # structures otherwise created upon first execution are created
+        # up front; result metadata needs cursor.description
+        for compiled in eng._compiled_cache.values():
+            assert "_bind_processors" in compiled.__dict__
+            is_none(compiled._cached_metadata)
+            if compiled.isinsert:
+                assert (
+                    "_inserted_primary_key_from_lastrowid_getter"
+                    in compiled.__dict__
+                )
+
+        # pool is replaced, compiled cache is retained
+        eng.dispose()
+        eq_(len(eng._compiled_cache), 2)
+
+        metadata.create_all(eng)
+
+        with (
+            patch.object(
+                ins, "_compiler", Mock(side_effect=ins._compiler)
+            ) as ins_compile,
+            patch.object(
+                sel, "_compiler", Mock(side_effect=sel._compiler)
+            ) as sel_compile,
+        ):
+            with eng.begin() as conn:
+                conn.execute(ins, [{"user_id": 1}, {"user_id": 2}])
+                eq_(conn.execute(sel).all(), [(None,), (None,)])
+
+        eq_(ins_compile.call_count, 0)
+        eq_(sel_compile.call_count, 0)
+
+    def test_query_cache_warmup_no_cache(self, metadata):
+        users = Table("users", metadata, Column("user_id", INT))
+
+        eng = engines.testing_engine(
+            options={
+                "query_cache_size": 0,
+                "query_cache_warmup": [select(users)],
+            }
+        )
+        with eng.connect():
+            pass
+        is_(eng._compiled_cache, None)
+
+    def test_cache_pruned_log(self, testing_engine):
+        eng = testing_engine(options={"query_cache_size": 2})
+
+        with patch.object(eng, "logger") as logger:
+            for i in range(4):
+                eng._compiled_cache[i] = i
+
+        eq_(
+            logger.info.mock_calls,
+            [
+                call(
+                    "Compiled cache size pruning from %d items to %d.  "
+                    "Increase cache size to reduce the frequency of "
+                    "pruning.",
+                    4,
+                    2,
+                )
+            ],
+        )
+
+    def test_cache_stats(self, metadata, testing_engine):
+        users = Table(
+            "users",
+            metadata,
+            Column("user_id", INT),
+            Column("user_name", VARCHAR(20)),
+        )
+        eng = testing_engine(
+            options={"query_cache_size": 2, "query_cache_stats": True}
+        )
+        metadata.create_all(eng)
+
+        stats = eng.compiled_cache_stats
+        stats.reset()
+
+        canary = Mock()
+        event.listen(eng, "compiled_cache_pruned", canary)
+
+        multi_ins = users.insert().values(
+            [
+                {"user_id": 1, "user_name": "u1"},
+                {"user_id": 2, "user_name": "u2"},
+            ]
+        )
+        with eng.begin() as conn:
+            conn.execute(multi_ins)
+            conn.execute(multi_ins)
+
+            for stmt in [
+                select(users),
+                select(users.c.user_id),
+                select(users.c.user_name),
+                select(users).order_by(users.c.user_id),
+            ]:
+                conn.execute(stmt)
+                conn.execute(stmt)
+
+        eq_(stats.no_key, 2)
+        eq_(stats.misses, 4)
+        eq_(stats.hits, 4)
+        eq_(stats.caching_disabled, 0)
+        eq_(stats.evictions, 2)
+        eq_(canary.mock_calls, [call(eng, 2)])
+        eq_(sum(stats.compile_time_histogram), 6)
+        is_true(stats.compile_time > 0)
+
+        eq_(
+            stats.no_key_statements,
+            [(multi_ins.compile(eng).string, 2)],
+        )
+        # one entry per distinct SQL string
+        eq_(len(stats.most_expensive), 5)
+
+        stats.reset()
+        eq_(
+            (stats.hits, stats.misses, stats.no_key, stats.evictions),
+            (0, 0, 0, 0),
+        )
+        eq_(stats.most_expensive, [])
+
+        with eng.connect().execution_options(compiled_cache=None) as conn:
+            conn.execute(select(users))
+        eq_(stats.caching_disabled, 1)
+
+    def test_cache_stats_tracked_statements(self):
+        stats = CompiledCacheStatistics(max_tracked_statements=2)
+
+        def record(cache_hit, sql, elapsed=0.001):
+            stats._record(cache_hit, Mock(string=sql), elapsed)
+
+        # a statement compiled repeatedly occupies one entry, with its
+        # longest compile time
+        for elapsed in (0.5, 0.7, 0.6):
+            record(CacheStats.NO_CACHE_KEY, "slow", elapsed)
+        record(CacheStats.CACHE_MISS, "a", 0.1)
+        record(CacheStats.CACHE_MISS, "b", 0.2)
+        eq_(stats.most_expensive, [(0.7, "slow"), (0.2, "b")])
+
+        # a frequent statement first seen once all slots are taken
+        # replaces the least frequent one
+        record(CacheStats.NO_CACHE_KEY, "rare")
+        for i in range(5):
+            record(CacheStats.NO_CACHE_KEY, "frequent")
+        eq_(stats.no_key_statements[0], ("frequent", 6))
+        eq_(
+            [sql for sql, count in stats.no_key_statements],
+            ["frequent", "slow"],
+        )
+
+    def test_cache_max_bytes(self, metadata, testing_engine):
+        t = Table("t", metadata, *[Column(f"c{i}", INT) for i in range(20)])
+        eng = testing_engine(
+            options={
+                "query_cache_max_bytes": 100000,
+                "query_cache_stats": True,
+            }
+        )
+        is_true(isinstance(eng._compiled_cache, util.SegmentedLRUCache))
+        metadata.create_all(eng)
+
+        stats = eng.compiled_cache_stats
+        stats.reset()
+        with eng.connect() as conn:
+            for i in range(1, 21):
+                conn.execute(select(*t.c[0:i]))
+
+        cache = eng._compiled_cache
+        is_true(0 < cache.weight <= 100000)
+        is_true(0 < len(cache) < 20)
+        eq_(stats.evictions, 20 - len(cache))
+
+        # most recent statements are retained
+        with eng.connect() as conn:
+            conn.execute(select(*t.c[0:20]))
+        eq_(stats.hits, 1)
+
+    def test_cache_stats_off_by_default(self, testing_engine):
+        eng = testing_engine()
+        is_(eng.compiled_cache_stats, None)
+        is_(eng.execution_options(foo="bar").compiled_cache_stats, None)
+
+    def test_cache_stats_option_engine(self, testing_engine):
+        eng = testing_engine(options={"query_cache_stats": True})
+        opt_eng = eng.execution_options(foo="bar")
+        is_(opt_eng.compiled_cache_stats, eng.compiled_cache_stats)
+
 
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
@@ -1115,6 +1115,14 @@ class CreatePoolTest(fixtures.TestBase):
             reset_on_return=True,
             pre_ping=True,
             use_lifo=True,
+            min_idle=2,
+            maintenance_interval=30,
+            pre_ping_interval=5,
+            metrics=None,
+            fair_waiters=True,
+            replica_failure_threshold=4,
+            replica_retry_interval=10,
+            replica_isolation_levels=["SERIALIZABLE"],
             foo=99,
         )
         mock_create.assert_called_once_with(
@@ -1126,6 +1134,14 @@ class CreatePoolTest(fixtures.TestBase):
             pool_reset_on_return=True,
             pool_pre_ping=True,
             pool_use_lifo=True,
+            pool_min_idle=2,
+            pool_maintenance_interval=30,
+            pool_pre_ping_interval=5,
+            pool_metrics=None,
+            pool_fair_waiters=True,
+            pool_replica_failure_threshold=4,
+            pool_replica_retry_interval=10,
+            pool_replica_isolation_levels=["SERIALIZABLE"],
             foo=99,
             _initialize=False,
         )
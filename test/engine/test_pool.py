@@ -1,5 +1,8 @@
+import asyncio
 import collections
+import functools
 import random
+import sys
 import threading
 import time
 from unittest.mock import ANY
@@ -26,6 +29,7 @@ from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_none
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_not_none
@@ -35,6 +39,8 @@ from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import lazy_gc
+from sqlalchemy.util import queue as sqla_queue
+from sqlalchemy.util.concurrency import greenlet_spawn
 
 join_timeout = 10
 
@@ -71,6 +77,8 @@ def MockDBAPI():  # noqa
 
 
 class PoolTestBase(fixtures.TestBase):
+    _queuepool_cls = pool.QueuePool
+
     def setup_test(self):
         self._teardown_conns = []
 
@@ -92,7 +100,7 @@ class PoolTestBase(fixtures.TestBase):
         dbapi = MockDBAPI()
         _is_asyncio = kw.pop("_is_asyncio", False)
         _has_terminate = kw.pop("_has_terminate", False)
-        p = pool.QueuePool(creator=lambda: dbapi.connect("foo.db"), **kw)
+        p = self._queuepool_cls(creator=lambda: dbapi.connect("foo.db"), **kw)
         if _is_asyncio:
             p._is_asyncio = True
             p._dialect = _AsyncConnDialect()
@@ -253,7 +261,16 @@ class PoolTest(PoolTestBase):
     @testing.combinations(
         (
             pool.QueuePool,
-            dict(pool_size=8, max_overflow=10, timeout=25, use_lifo=True),
+            dict(
+                pool_size=8,
+                max_overflow=10,
+                timeout=25,
+                use_lifo=True,
+                fair_waiters=True,
+                min_idle=3,
+                pre_ping_interval=5,
+                metrics=pool.PoolMetrics(),
+            ),
         ),
         (pool.QueuePool, {}),
         (pool.NullPool, {}),
@@ -1137,7 +1154,7 @@ class QueuePoolTest(PoolTestBase):
         # timeout again within the mutex, and if so, unlocking and throwing
         # them back to the start of do_get()
         dbapi = MockDBAPI()
-        p = pool.QueuePool(
+        p = self._queuepool_cls(
             creator=lambda: dbapi.connect(delay=0.05),
             pool_size=2,
             max_overflow=1,
@@ -1184,7 +1201,7 @@ class QueuePoolTest(PoolTestBase):
             with mutex:
                 return dbapi.connect()
 
-        p = pool.QueuePool(
+        p = self._queuepool_cls(
             creator=creator, pool_size=3, timeout=2, max_overflow=max_overflow
         )
         reaper.add_pool(p)
@@ -1224,7 +1241,7 @@ class QueuePoolTest(PoolTestBase):
         def create():
             return creator()
 
-        p = pool.QueuePool(creator=create, pool_size=2, max_overflow=3)
+        p = self._queuepool_cls(creator=create, pool_size=2, max_overflow=3)
         c1 = self._with_teardown(p.connect())  # noqa
         c2 = self._with_teardown(p.connect())  # noqa
         c3 = self._with_teardown(p.connect())  # noqa
@@ -1267,7 +1284,7 @@ class QueuePoolTest(PoolTestBase):
             time.sleep(1)
             conn.close()
 
-        p = pool.QueuePool(creator=create, pool_size=2, max_overflow=3)
+        p = self._queuepool_cls(creator=create, pool_size=2, max_overflow=3)
 
         threads = [
             threading.Thread(target=run_test, args=("success_one", p, False)),
@@ -1312,7 +1329,7 @@ class QueuePoolTest(PoolTestBase):
         success = []
         for timeout in (None, 30):
             for max_overflow in (0, -1, 3):
-                p = pool.QueuePool(
+                p = self._queuepool_cls(
                     creator=creator,
                     pool_size=2,
                     timeout=timeout,
@@ -1367,7 +1384,7 @@ class QueuePoolTest(PoolTestBase):
         def creator():
             return dbapi.connect()
 
-        p = pool.QueuePool(creator=creator, pool_size=1, max_overflow=0)
+        p = self._queuepool_cls(creator=creator, pool_size=1, max_overflow=0)
 
         conn = p.connect()
         conn.close()
@@ -1400,7 +1417,7 @@ class QueuePoolTest(PoolTestBase):
             canary.append(1)
             return dbapi.connect()
 
-        p1 = pool.QueuePool(
+        p1 = self._queuepool_cls(
             creator=creator, pool_size=1, timeout=None, max_overflow=0
         )
 
@@ -1432,7 +1449,7 @@ class QueuePoolTest(PoolTestBase):
     def test_dispose_closes_pooled(self):
         dbapi = MockDBAPI()
 
-        p = pool.QueuePool(
+        p = self._queuepool_cls(
             creator=dbapi.connect, pool_size=2, timeout=None, max_overflow=0
         )
         c1 = p.connect()
@@ -1973,7 +1990,7 @@ class QueuePoolTest(PoolTestBase):
         def creator():
             return connections.pop(0)
 
-        p = pool.QueuePool(creator, use_lifo=True)
+        p = self._queuepool_cls(creator, use_lifo=True)
 
         pc1 = p.connect()
         pc2 = p.connect()
@@ -2012,7 +2029,7 @@ class QueuePoolTest(PoolTestBase):
         def creator():
             return connections.pop(0)
 
-        p = pool.QueuePool(creator)
+        p = self._queuepool_cls(creator)
 
         pc1 = p.connect()
         pc2 = p.connect()
@@ -2044,6 +2061,796 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class ConcurrentQueuePoolTest(QueuePoolTest):
+    _queuepool_cls = pool.ConcurrentQueuePool
+
+    def test_queue_class(self):
+        p = self._queuepool_fixture()
+        is_true(isinstance(p._pool, sqla_queue.ConcurrentQueue))
+
+    def test_put_full(self):
+        q = sqla_queue.ConcurrentQueue(2)
+        q.put(1, False)
+        q.put(2, False)
+        assert_raises(sqla_queue.Full, q.put, 3, False)
+        eq_(q.qsize(), 2)
+        eq_(q.get(False), 1)
+
+    def test_lifo(self):
+        q = sqla_queue.ConcurrentQueue(3, use_lifo=True)
+        for i in range(3):
+            q.put(i, False)
+        eq_([q.get(False) for i in range(3)], [2, 1, 0])
+        assert_raises(sqla_queue.Empty, q.get, False)
+
+    def test_get_timeout(self):
+        q = sqla_queue.ConcurrentQueue(1)
+        now = time.time()
+        assert_raises(sqla_queue.Empty, q.get, True, 0.1)
+        assert time.time() - now >= 0.1
+
+    def test_waiter_notified(self):
+        q = sqla_queue.ConcurrentQueue(1)
+        results = []
+
+        def waiter():
+            results.append(q.get(True, join_timeout))
+
+        th = threading.Thread(target=waiter)
+        th.start()
+        while not q._waiters:
+            time.sleep(0.01)
+        q.put("x", False)
+        th.join(join_timeout)
+        eq_(results, ["x"])
+        eq_(q._waiters, 0)
+
+    @testing.requires.timing_intensive
+    def test_many_threads_limit(self):
+        p = self._queuepool_fixture(pool_size=5, max_overflow=3, timeout=10)
+        peak = []
+        lock = threading.Lock()
+
+        def go():
+            for i in range(50):
+                c = p.connect()
+                with lock:
+                    peak.append(p.checkedout())
+                c.close()
+
+        threads = [threading.Thread(target=go) for i in range(20)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join(join_timeout)
+
+        assert max(peak) <= 8
+        eq_(p.checkedout(), 0)
+        assert p.checkedin() <= 5
+
+
+class FairWaitersQueuePoolTest(QueuePoolTest):
+    _queuepool_cls = functools.partial(pool.QueuePool, fair_waiters=True)
+
+    def test_queue_class(self):
+        p = self._queuepool_fixture()
+        is_true(isinstance(p._pool, sqla_queue.FairQueue))
+
+    def _waiter_fixture(self, q, results, name, priority=0):
+        def waiter():
+            try:
+                results.append((name, q.get(True, join_timeout, priority)))
+            except sqla_queue.Empty:
+                results.append((name, "timeout"))
+
+        waiting = len(q._waiters)
+        th = threading.Thread(target=waiter)
+        th.start()
+        while len(q._waiters) == waiting:
+            time.sleep(0.01)
+        return th
+
+    def _assert_handoff_order(self, q, results, threads, expected):
+        for i in range(len(threads)):
+            q.put(i, False)
+            # wait for the waiter to receive the item before putting the
+            # next one, so that the order of receipt is observable
+            while len(results) == i:
+                time.sleep(0.01)
+        for th in threads:
+            th.join(join_timeout)
+        eq_(results, expected)
+
+    def test_waiters_fifo(self):
+        q = sqla_queue.FairQueue(3)
+        results = []
+        threads = [self._waiter_fixture(q, results, name) for name in "abc"]
+
+        self._assert_handoff_order(
+            q, results, threads, [("a", 0), ("b", 1), ("c", 2)]
+        )
+        is_true(q.empty())
+
+    def test_waiters_priority(self):
+        q = sqla_queue.FairQueue(3)
+        results = []
+        threads = [
+            self._waiter_fixture(q, results, name, priority=priority)
+            for name, priority in (("a", 0), ("b", 5), ("c", 0), ("d", 10))
+        ]
+
+        self._assert_handoff_order(
+            q, results, threads, [("d", 0), ("b", 1), ("a", 2), ("c", 3)]
+        )
+
+    def test_no_barging(self):
+        q = sqla_queue.FairQueue(3)
+        results = []
+        th = self._waiter_fixture(q, results, "a")
+
+        q.put("x", False)
+
+        # the waiter already has the item, even if it hasn't yet woken up
+        assert_raises(sqla_queue.Empty, q.get, False)
+        th.join(join_timeout)
+        eq_(results, [("a", "x")])
+
+    def test_timed_out_waiter_removed(self):
+        q = sqla_queue.FairQueue(3)
+        assert_raises(sqla_queue.Empty, q.get, True, 0.05)
+        eq_(q._waiters, [])
+
+        q.put("x", False)
+        eq_(q.get(False), "x")
+
+    def test_timed_out_waiter_removed_from_middle(self):
+        q = sqla_queue.FairQueue(3)
+        results = []
+        th1 = self._waiter_fixture(q, results, "a")
+
+        assert_raises(sqla_queue.Empty, q.get, True, 0.05, 5)
+        eq_(len(q._waiters), 1)
+
+        th2 = self._waiter_fixture(q, results, "b")
+        self._assert_handoff_order(
+            q, results, [th1, th2], [("a", 0), ("b", 1)]
+        )
+        eq_(q._waiters, [])
+
+    def test_concurrent_get_put(self):
+        """test that an item put while another thread begins waiting
+        is not missed by that waiter."""
+
+        q = sqla_queue.FairQueue(1)
+        q.put(1)
+        timeouts = []
+
+        def worker():
+            for i in range(5000):
+                try:
+                    item = q.get(True, join_timeout)
+                except sqla_queue.Empty:
+                    timeouts.append(i)
+                    return
+                q.put(item)
+
+        # switch threads often, so that a put() is likely to coincide
+        # with a get() that's about to wait
+        switchinterval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker) for i in range(8)]
+            for th in threads:
+                th.start()
+            for th in threads:
+                th.join(join_timeout * 2)
+        finally:
+            sys.setswitchinterval(switchinterval)
+
+        eq_(timeouts, [])
+        eq_(q._waiters, [])
+        eq_(q.get(False), 1)
+
+    def test_checkout_priority(self):
+        dbapi = MockDBAPI()
+        p = self._queuepool_cls(
+            creator=lambda: dbapi.connect("foo.db"),
+            pool_size=1,
+            max_overflow=0,
+        )
+        c1 = p.connect()
+        results = []
+
+        def checkout(priority):
+            c = p._connect_w_options({"checkout_priority": priority})
+            results.append(priority)
+            c.close()
+
+        threads = []
+        for priority in (1, 5):
+            th = threading.Thread(target=checkout, args=(priority,))
+            th.start()
+            threads.append(th)
+            while len(p._pool._waiters) < len(threads):
+                time.sleep(0.01)
+
+        c1.close()
+        for th in threads:
+            th.join(join_timeout)
+        eq_(results, [5, 1])
+
+    def test_engine_checkout_priority(self):
+        e = create_engine(
+            "sqlite://", poolclass=pool.QueuePool, pool_fair_waiters=True
+        )
+        is_true(e.pool._fair_waiters)
+
+        with patch.object(
+            e.pool, "_do_get_w_priority", wraps=e.pool._do_get_w_priority
+        ) as do_get_w_priority:
+            with e.connect():
+                pass
+            eq_(do_get_w_priority.mock_calls, [])
+
+            with e.execution_options(checkout_priority=5).connect():
+                pass
+            eq_(do_get_w_priority.mock_calls, [call(5)])
+
+    def test_async_checkout_priority_ignored(self):
+        dbapi = MockDBAPI()
+        p = pool.AsyncAdaptedQueuePool(
+            creator=lambda: dbapi.connect("foo.db"), pool_size=1
+        )
+        c1 = p._connect_w_options({"checkout_priority": 5})
+        dbapi_connection = c1.dbapi_connection
+        c1.close()
+        c2 = p._connect_w_options({"checkout_priority": 5})
+        is_(c2.dbapi_connection, dbapi_connection)
+        c2.close()
+        eq_(dbapi.connect.call_count, 1)
+
+    @testing.combinations(pool.AsyncAdaptedQueuePool, pool.ConcurrentQueuePool)
+    def test_not_supported(self, cls):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            f"{cls.__name__} does not support fair_waiters",
+        ):
+            cls(creator=lambda: None, fair_waiters=True)
+
+
+class PoolMaintenanceTest(PoolTestBase):
+    def _wait_for(self, fn):
+        deadline = time.time() + join_timeout
+        while not fn():
+            if time.time() > deadline:
+                assert False, "condition not reached"
+            time.sleep(0.01)
+
+    def test_min_idle(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=5, min_idle=3)
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 3)
+        eq_(dbapi.connect.call_count, 3)
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 3)
+        eq_(dbapi.connect.call_count, 3)
+
+        c1 = p.connect()
+        eq_(dbapi.connect.call_count, 3)
+        c1.close()
+
+    def test_min_idle_limited_by_pool_size(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=5, min_idle=3
+        )
+        c1, c2 = p.connect(), p.connect()
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 1)
+        eq_(p.checkedout(), 2)
+        eq_(dbapi.connect.call_count, 3)
+
+        c1.close()
+        c2.close()
+        eq_(p.checkedin(), 3)
+
+    def test_min_idle_unlimited_pool_size(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=0, min_idle=2)
+
+        p._run_maintenance()
+        eq_(p.checkedin(), 2)
+        eq_(dbapi.connect.call_count, 2)
+
+    def test_recycle_ahead_of_checkout(self):
+        with patch("sqlalchemy.pool.base.time.time") as mock_time:
+            mock_time.return_value = 10000
+
+            dbapi, p = self._queuepool_dbapi_fixture(
+                pool_size=1, max_overflow=0, recycle=30
+            )
+            p._maintenance_interval = 10
+            c1 = p.connect()
+            dbapi_con = c1.dbapi_connection
+            c1.close()
+
+            mock_time.return_value = 10015
+            p._run_maintenance()
+            eq_(dbapi.connect.call_count, 1)
+
+            # within the maintenance interval of the recycle time
+            mock_time.return_value = 10025
+            p._run_maintenance()
+            eq_(dbapi.connect.call_count, 2)
+            eq_(dbapi_con.close.mock_calls, [call()])
+
+            c2 = p.connect()
+            is_not(c2.dbapi_connection, dbapi_con)
+            eq_(dbapi.connect.call_count, 2)
+            c2.close()
+
+    def test_reconnect_invalidated(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+        eq_(dbapi.connect.call_count, 1)
+
+        p._run_maintenance()
+        eq_(dbapi.connect.call_count, 2)
+
+        c2 = p.connect()
+        eq_(dbapi.connect.call_count, 2)
+        c2.close()
+
+    @testing.combinations(True, False, argnames="ping_ok")
+    def test_ping_idle(self, ping_ok):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=1, max_overflow=0, pre_ping=True
+        )
+        p._dialect = Mock(_do_ping_w_event=Mock(return_value=ping_ok))
+
+        c1 = p.connect()
+        dbapi_con = c1.dbapi_connection
+        c1.close()
+
+        p._run_maintenance()
+        eq_(p._dialect._do_ping_w_event.mock_calls, [call(dbapi_con)])
+
+        c2 = p.connect()
+        if ping_ok:
+            is_(c2.dbapi_connection, dbapi_con)
+            eq_(dbapi.connect.call_count, 1)
+        else:
+            is_not(c2.dbapi_connection, dbapi_con)
+            eq_(dbapi.connect.call_count, 2)
+        c2.close()
+
+    @testing.combinations(
+        sqla_queue.Queue,
+        sqla_queue.FairQueue,
+        sqla_queue.ConcurrentQueue,
+        sqla_queue.AsyncAdaptedQueue,
+        argnames="queue_cls",
+    )
+    @testing.variation("use_lifo", [True, False])
+    def test_queue_snapshot_remove(self, queue_cls, use_lifo):
+        q = queue_cls(5, use_lifo=bool(use_lifo))
+        for i in range(1, 5):
+            q.put(i, False)
+
+        eq_(q.snapshot(), [1, 2, 3, 4])
+        is_true(q.remove(2))
+        is_false(q.remove(2))
+        is_false(q.remove(10))
+        eq_(q.snapshot(), [1, 3, 4])
+
+        # order of get() is not affected
+        eq_(
+            [q.get(False) for _ in range(3)],
+            [4, 3, 1] if use_lifo else [1, 3, 4],
+        )
+
+    @testing.variation("use_lifo", [True, False])
+    def test_maintain_one_record_at_a_time(self, use_lifo):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, pre_ping=True, use_lifo=bool(use_lifo)
+        )
+
+        def ping(dbapi_con):
+            # the other records remain available while one is pinged
+            eq_(p.checkedin(), 2)
+            return True
+
+        p._dialect = Mock(_do_ping_w_event=Mock(side_effect=ping))
+
+        conns = [p.connect() for _ in range(3)]
+        dbapi_cons = {c.dbapi_connection for c in conns}
+        for c in conns:
+            c.close()
+
+        p._run_maintenance()
+        eq_(
+            {c.args[0] for c in p._dialect._do_ping_w_event.mock_calls},
+            dbapi_cons,
+        )
+        eq_(p.checkedin(), 3)
+
+    def test_maintenance_skips_checked_out(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=3, max_overflow=0, pre_ping=True
+        )
+        checked_out = []
+
+        def ping(dbapi_con):
+            if not checked_out:
+                checked_out.append(None)
+                checked_out[0] = p.connect()
+            return True
+
+        p._dialect = Mock(_do_ping_w_event=Mock(side_effect=ping))
+
+        conns = [p.connect() for _ in range(3)]
+        for c in conns:
+            c.close()
+
+        p._run_maintenance()
+
+        # the record checked out while the first was pinged is pinged
+        # by that checkout, and is skipped by maintenance
+        pinged = [c.args[0] for c in p._dialect._do_ping_w_event.mock_calls]
+        eq_(len(pinged), 3)
+        eq_(len(set(pinged)), 3)
+        eq_(p.checkedin(), 2)
+        checked_out[0].close()
+        eq_(p.checkedin(), 3)
+
+    def test_ping_marks_verified(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=1, max_overflow=0, pre_ping=True, pre_ping_interval=30
+        )
+        p._dialect = Mock(_do_ping_w_event=Mock(return_value=True))
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.close()
+        rec._verified_time = 0
+        is_true(not rec._recently_verified())
+
+        p._run_maintenance()
+        is_true(rec._recently_verified())
+
+    def test_no_ping_without_pre_ping(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1, max_overflow=0)
+        p._dialect = Mock()
+
+        c1 = p.connect()
+        c1.close()
+        p._run_maintenance()
+        eq_(p._dialect._do_ping_w_event.mock_calls, [])
+
+    def test_failed_reconnect_returns_record(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+
+        dbapi.shutdown(True)
+        p._run_maintenance()
+        eq_(p.checkedin(), 1)
+
+        dbapi.shutdown(False)
+        c2 = p.connect()
+        is_not_none(c2.dbapi_connection)
+        c2.close()
+
+    def test_worker_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=2, maintenance_interval=0.01
+        )
+        is_false(p._maintenance.started)
+        is_none(p._maintenance._thread)
+
+        # started upon first checkout
+        p.connect().close()
+        is_true(p._maintenance.started)
+        thread = p._maintenance._thread
+        self._wait_for(lambda: p.checkedin() >= 2)
+
+        p.dispose()
+        thread.join(join_timeout)
+        is_true(not thread.is_alive())
+
+    def test_worker_thread_exits_on_gc(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=2, maintenance_interval=0.01
+        )
+        p.connect().close()
+        thread = p._maintenance._thread
+        self._wait_for(lambda: dbapi.connect.call_count >= 2)
+
+        del p
+        gc_collect()
+        thread.join(join_timeout)
+        is_true(not thread.is_alive())
+
+    def test_recreate_starts_new_worker(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=2, maintenance_interval=0.01
+        )
+        p.dispose()
+        p2 = p.recreate()
+        is_not(p2._maintenance, p._maintenance)
+        eq_(p2._min_idle, 2)
+        p2.connect().close()
+        self._wait_for(lambda: p2.checkedin() >= 2)
+        p2.dispose()
+
+    def test_worker_starts_once(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, maintenance_interval=10
+        )
+        with patch.object(threading.Thread, "start") as start:
+            p._maintenance.start()
+            p._maintenance.start()
+        eq_(start.mock_calls, [call()])
+
+    @testing.requires.sqlite
+    def test_engine_worker_connections_initialized(self):
+        """test that connections created by the worker have the dialect's
+        connect and first_connect handlers applied."""
+
+        e = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=pool.QueuePool,
+            pool_size=3,
+            pool_min_idle=3,
+            pool_maintenance_interval=0.01,
+        )
+        is_false(e.pool._maintenance.started)
+
+        with e.connect():
+            pass
+        self._wait_for(lambda: e.pool.checkedin() == 3)
+
+        is_not_none(e.dialect.server_version_info)
+        for record in e.pool._pool.snapshot():
+            # the REGEXP function is set up by the pysqlite dialect's
+            # on_connect handler
+            cursor = record.dbapi_connection.cursor()
+            cursor.execute("SELECT 'abc' REGEXP 'b'")
+            eq_(cursor.fetchone(), (1,))
+            cursor.close()
+        e.dispose()
+
+    @testing.requires.asyncio
+    def test_async_worker_starts_on_checkout(self):
+        dbapi = MockDBAPI()
+        p = pool.AsyncAdaptedQueuePool(
+            creator=lambda: dbapi.connect("foo.db"),
+            pool_size=5,
+            min_idle=2,
+            maintenance_interval=0.01,
+        )
+        is_true(not p._maintenance.started)
+
+        async def go():
+            c1 = await greenlet_spawn(p.connect)
+            is_true(p._maintenance.started)
+            deadline = time.time() + join_timeout
+            while p.checkedin() < 2:
+                assert time.time() < deadline, "condition not reached"
+                await asyncio.sleep(0.01)
+            await greenlet_spawn(c1.close)
+            await greenlet_spawn(p.dispose)
+            await asyncio.sleep(0)
+            is_true(p._maintenance._task.done())
+
+        asyncio.run(go())
+
+
+class PoolMetricsTest(PoolTestBase):
+    def test_checkout_checkin(self):
+        metrics = pool.PoolMetrics()
+        p = self._queuepool_fixture(pool_size=2, metrics=metrics)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        c1.close()
+
+        snapshot = metrics.snapshot()
+        eq_(snapshot.checkouts, 2)
+        eq_(snapshot.connects, 2)
+        eq_(snapshot.checkout_wait.count, 2)
+        eq_(snapshot.connect_time.count, 2)
+        eq_(snapshot.hold_time.count, 1)
+
+        c2.close()
+        c3 = p.connect()
+        c3.close()
+
+        snapshot = metrics.snapshot()
+        eq_(snapshot.checkouts, 3)
+        eq_(snapshot.connects, 2)
+        eq_(snapshot.hold_time.count, 3)
+        eq_(sum(count for upper, count in snapshot.hold_time.buckets), 3)
+
+    def test_timeout(self):
+        metrics = pool.PoolMetrics()
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=0.05, metrics=metrics
+        )
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+
+        snapshot = metrics.snapshot()
+        eq_(snapshot.checkouts, 1)
+        eq_(snapshot.timeouts, 1)
+        eq_(snapshot.checkout_wait.count, 2)
+        assert snapshot.checkout_wait.max >= 0.05
+        c1.close()
+
+    def test_checkout_wait_excludes_connect(self):
+        metrics = pool.PoolMetrics()
+        dbapi = MockDBAPI()
+
+        def creator():
+            time.sleep(0.05)
+            return dbapi.connect("foo.db")
+
+        p = self._queuepool_cls(
+            creator=creator, pool_size=1, max_overflow=1, metrics=metrics
+        )
+
+        # connected by _do_get(), including as overflow
+        c1 = p.connect()
+        c2 = p.connect()
+
+        # reconnected by get_connection()
+        c1.invalidate()
+        c1.close()
+        c1 = p.connect()
+
+        snapshot = metrics.snapshot()
+        eq_(snapshot.connects, 3)
+        assert snapshot.connect_time.max >= 0.05
+        eq_(snapshot.checkout_wait.count, 3)
+        assert snapshot.checkout_wait.max < 0.05
+        c1.close()
+        c2.close()
+
+    def test_invalidate_and_recycle(self):
+        metrics = pool.PoolMetrics()
+        p = self._queuepool_fixture(pool_size=1, metrics=metrics)
+
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+
+        snapshot = metrics.snapshot()
+        eq_(snapshot.invalidations, 2)
+        eq_(snapshot.recycles, 1)
+        eq_(snapshot.connects, 3)
+
+    def test_not_collected_by_default(self):
+        p = self._queuepool_fixture()
+        is_none(p._metrics)
+        c1 = p.connect()
+        is_(c1._connection_record._checkout_time, 0)
+        c1.close()
+
+    def test_recreate(self):
+        metrics = pool.PoolMetrics()
+        p = self._queuepool_fixture(metrics=metrics)
+        p.connect().close()
+        p.dispose()
+
+        p2 = p.recreate()
+        is_(p2._metrics, metrics)
+        p2.connect().close()
+        eq_(metrics.snapshot().checkouts, 2)
+
+    def test_reset(self):
+        metrics = pool.PoolMetrics()
+        p = self._queuepool_fixture(metrics=metrics)
+        p.connect().close()
+        metrics.reset()
+
+        snapshot = metrics.snapshot()
+        eq_(snapshot.checkouts, 0)
+        eq_(snapshot.hold_time.count, 0)
+        eq_(snapshot.hold_time.max, 0)
+
+    def test_threads(self):
+        metrics = pool.PoolMetrics(buckets=[1, 2, 5])
+        p = self._queuepool_fixture(
+            pool_size=3, max_overflow=0, metrics=metrics
+        )
+        num_threads, num_checkouts = 5, 50
+        barrier = threading.Barrier(num_threads)
+
+        def go():
+            barrier.wait()
+            for _ in range(num_checkouts):
+                p.connect().close()
+
+        threads = [threading.Thread(target=go) for _ in range(num_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(join_timeout)
+
+        # collectors of finished threads are still counted, and are
+        # folded into one
+        snapshot = metrics.snapshot()
+        eq_(snapshot.checkouts, num_threads * num_checkouts)
+        eq_(snapshot.hold_time.count, num_threads * num_checkouts)
+        is_true(1 <= snapshot.connects <= 3)
+        eq_(metrics._collectors, [])
+
+        p.connect().close()
+        eq_(metrics.snapshot().checkouts, num_threads * num_checkouts + 1)
+        eq_(len(metrics._collectors), 1)
+
+    def test_reset_other_thread(self):
+        metrics = pool.PoolMetrics()
+        recorded = threading.Event()
+        do_reset = threading.Event()
+
+        def go():
+            metrics._record_recycle()
+            recorded.set()
+            do_reset.wait(join_timeout)
+            metrics._record_recycle()
+
+        t = threading.Thread(target=go)
+        t.start()
+        recorded.wait(join_timeout)
+        metrics._record_recycle()
+        eq_(metrics.snapshot().recycles, 2)
+
+        metrics.reset()
+        eq_(metrics.snapshot().recycles, 0)
+
+        # the other thread starts a new collector after the reset
+        do_reset.set()
+        t.join(join_timeout)
+        eq_(metrics.snapshot().recycles, 1)
+
+    def test_histogram(self):
+        metrics = pool.PoolMetrics(buckets=[1, 2, 5])
+        for value in (0.5, 0.5, 1.5, 3, 8):
+            metrics._record_checkin(value)
+
+        hist = metrics.snapshot().hold_time
+        eq_(hist.count, 5)
+        eq_(hist.total, 13.5)
+        eq_(hist.max, 8)
+        eq_(hist.mean, 2.7)
+        eq_(
+            hist.buckets,
+            ((1, 2), (2, 1), (5, 1), (float("inf"), 1)),
+        )
+        eq_(hist.quantile(0.4), 1)
+        eq_(hist.quantile(0.6), 2)
+        eq_(hist.quantile(0.99), 8)
+
+    def test_create_engine(self):
+        metrics = pool.PoolMetrics()
+        e = create_engine(
+            "sqlite:///file.db", poolclass=pool.QueuePool, pool_metrics=metrics
+        )
+        is_(e.pool._metrics, metrics)
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
@@ -2364,6 +3171,262 @@ class StaticPoolTest(PoolTestBase):
         is_(conn, c2.dbapi_connection)
 
 
+class MultiHostPoolTest(PoolTestBase):
+    def _multihost_fixture(self, num_replicas=2, **kw):
+        primary = MockDBAPI()
+        replicas = [MockDBAPI() for i in range(num_replicas)]
+
+        def replica_creator(replica):
+            return lambda: replica.connect("replica")
+
+        p = pool.MultiHostPool(
+            lambda: primary.connect("primary"),
+            replicas=[replica_creator(replica) for replica in replicas],
+            **kw,
+        )
+        return p, primary, replicas
+
+    def test_routing(self):
+        p, primary, replicas = self._multihost_fixture(
+            replica_isolation_levels=["SERIALIZABLE"]
+        )
+
+        for options in (
+            None,
+            {},
+            {"checkout_priority": 5},
+            {"isolation_level": "READ COMMITTED"},
+        ):
+            if options is None:
+                c = p.connect()
+            else:
+                c = p._connect_w_options(options)
+            is_(c._pool, p.primary)
+            c.close()
+
+        for options in (
+            {"readonly": True},
+            {"isolation_level": "SERIALIZABLE"},
+        ):
+            c = p._connect_w_options(options)
+            is_true(c._pool in p.replicas)
+            c.close()
+
+        eq_(primary.connect.mock_calls, [call("primary")])
+
+    def test_no_replicas(self):
+        p, primary, replicas = self._multihost_fixture(num_replicas=0)
+        c = p._connect_w_options({"readonly": True})
+        is_(c._pool, p.primary)
+
+    def test_host_pool_args(self):
+        p, primary, replicas = self._multihost_fixture(
+            pool_size=3, max_overflow=1, recycle=10, pre_ping=True
+        )
+        for host_pool in [p.primary] + p.replicas:
+            is_true(isinstance(host_pool, pool.QueuePool))
+            eq_(host_pool.size(), 3)
+            eq_(host_pool._max_overflow, 1)
+            eq_(host_pool._recycle, 10)
+            is_true(host_pool._pre_ping)
+        eq_(p._recycle, 10)
+
+    def test_poolclass(self):
+        p, primary, replicas = self._multihost_fixture(poolclass=pool.NullPool)
+        for host_pool in [p.primary] + p.replicas:
+            is_true(isinstance(host_pool, pool.NullPool))
+
+    def test_weighted_by_latency(self):
+        p, primary, replicas = self._multihost_fixture()
+        r1, r2 = p._replicas
+
+        p._record_success(r1, 0.01)
+        p._record_success(r2, 0.04)
+        with patch.object(
+            random, "choices", side_effect=lambda hosts, weights: [hosts[0]]
+        ) as choices:
+            p._connect_w_options({"readonly": True}).close()
+
+        weights = choices.mock_calls[0][1][1]
+        eq_(weights[0] / weights[1], 4.0)
+
+        # latency is a moving average of observed checkouts
+        p._record_success(r2, 0.09)
+        eq_(round(r2.latency, 6), 0.05)
+
+    def test_weighted_by_error_rate(self):
+        p, primary, replicas = self._multihost_fixture(
+            replica_failure_threshold=10
+        )
+        r1, r2 = p._replicas
+        p._record_success(r1, 0.01)
+        p._record_success(r2, 0.01)
+
+        p._record_failure(r1)
+        is_true(r1.weight() < r2.weight())
+
+        p._record_success(r1, 0.01)
+        eq_(r1.failures, 0)
+        is_true(r1.weight() < r2.weight())
+
+    def test_failover(self):
+        p, primary, (r1,) = self._multihost_fixture(num_replicas=1)
+        r1.shutdown(True)
+
+        c = p._connect_w_options({"readonly": True})
+        is_(c._pool, p.primary)
+        eq_(p._replicas[0].failures, 1)
+
+    def test_evict_unhealthy_replica(self):
+        p, primary, (r1, r2) = self._multihost_fixture(
+            replica_failure_threshold=2, replica_retry_interval=60
+        )
+        host1, host2 = p._replicas
+        r1.shutdown(True)
+
+        with patch.object(
+            random, "choices", side_effect=lambda hosts, weights: [hosts[0]]
+        ):
+            for i in range(2):
+                c = p._connect_w_options({"readonly": True})
+                is_(c._pool, host2.pool)
+                c.close()
+
+            is_true(host1.down_until > time.time() + 50)
+            eq_(r1.connect.call_count, 2)
+            assert "Replica 0 (down)" in p.status()
+
+            # evicted replica isn't tried
+            c = p._connect_w_options({"readonly": True})
+            is_(c._pool, host2.pool)
+            c.close()
+            eq_(r1.connect.call_count, 2)
+
+            # replica is tried again after the retry interval
+            r1.shutdown(False)
+            host1.down_until = time.time() - 1
+            c = p._connect_w_options({"readonly": True})
+            is_(c._pool, host1.pool)
+            c.close()
+
+    def test_timeout_not_a_failure(self):
+        p, primary, (r1,) = self._multihost_fixture(
+            num_replicas=1, pool_size=1, max_overflow=0, timeout=0
+        )
+        c1 = p._connect_w_options({"readonly": True})
+        is_(c1._pool, p.replicas[0])
+
+        c2 = p._connect_w_options({"readonly": True})
+        is_(c2._pool, p.primary)
+        eq_(p._replicas[0].failures, 0)
+
+    def test_invalidate(self):
+        p, primary, replicas = self._multihost_fixture(
+            replica_failure_threshold=10
+        )
+        c = p._connect_w_options({"readonly": True})
+        host = [h for h in p._replicas if h.pool is c._pool][0]
+        p._invalidate(c, Exception("disconnect"))
+
+        is_true(c._pool._invalidate_time > 0)
+        eq_(p.primary._invalidate_time, 0)
+        eq_(host.failures, 1)
+
+    def test_events(self):
+        p, primary, replicas = self._multihost_fixture()
+        canary = []
+        event.listen(p, "connect", lambda *arg: canary.append("connect"))
+        event.listen(p, "checkout", lambda *arg: canary.append("checkout"))
+
+        p.connect()
+        p._connect_w_options({"readonly": True})
+        eq_(canary, ["connect", "checkout", "connect", "checkout"])
+
+        p2 = p.recreate()
+        p2._connect_w_options({"readonly": True})
+        eq_(canary[4:], ["connect", "checkout"])
+
+    def test_recreate(self):
+        p, primary, replicas = self._multihost_fixture(
+            pool_size=3, replica_retry_interval=5
+        )
+        p2 = p.recreate()
+        is_(p2.primary._creator, p.primary._creator)
+        eq_(
+            [rp._creator for rp in p2.replicas],
+            [rp._creator for rp in p.replicas],
+        )
+        eq_(p2.replicas[0].size(), 3)
+        eq_(p2._replica_retry_interval, 5)
+
+    def test_dispose(self):
+        p, primary, replicas = self._multihost_fixture()
+        c1 = p.connect()
+        c2 = p._connect_w_options({"readonly": True})
+        c1.close()
+        c2.close()
+        eq_(
+            [host_pool.checkedin() for host_pool in [p.primary] + p.replicas],
+            [1, 1, 0] if c2._pool is p.replicas[0] else [1, 0, 1],
+        )
+
+        p.dispose()
+        eq_(
+            [host_pool.checkedin() for host_pool in [p.primary] + p.replicas],
+            [0, 0, 0],
+        )
+
+    def test_engine_replica_urls(self):
+        e = create_engine("sqlite://", replica_urls=["sqlite://"])
+        is_true(isinstance(e.pool, pool.MultiHostPool))
+        is_true(isinstance(e.pool.primary, pool.SingletonThreadPool))
+
+        with e.begin() as conn:
+            conn.exec_driver_sql("create table t (x integer)")
+
+        with e.execution_options(readonly=True).connect() as conn:
+            assert_raises(
+                tsa.exc.OperationalError,
+                conn.exec_driver_sql,
+                "select * from t",
+            )
+        with e.connect() as conn:
+            conn.exec_driver_sql("select * from t")
+
+    def test_engine_pool_args(self):
+        e = create_engine(
+            "sqlite:///file.db",
+            replica_urls=["sqlite:///file.db"],
+            poolclass=pool.QueuePool,
+            pool_size=3,
+            pool_replica_failure_threshold=5,
+            pool_replica_isolation_levels=["SERIALIZABLE"],
+            _initialize=False,
+        )
+        eq_(e.pool.primary.size(), 3)
+        eq_(e.pool.replicas[0].size(), 3)
+        eq_(e.pool._replica_failure_threshold, 5)
+        eq_(e.pool._replica_isolation_levels, {"SERIALIZABLE"})
+        is_(e.pool.replicas[0]._dialect, e.dialect)
+
+    def test_engine_replica_url_drivername(self):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "Replica URL .* has drivername 'sqlite\\+pysqlite', which "
+            "differs from the drivername 'sqlite' of the primary URL",
+        ):
+            create_engine("sqlite://", replica_urls=["sqlite+pysqlite://"])
+
+    def test_engine_replica_url_plugin(self):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "Replica URL .* specifies plugins",
+        ):
+            create_engine(
+                "sqlite://", replica_urls=["sqlite://?plugin=someplugin"]
+            )
+
+
 class CreatorCompatibilityTest(PoolTestBase):
     def test_creator_callable_outside_noarg(self):
         e = testing_engine()
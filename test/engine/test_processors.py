@@ -1,4 +1,5 @@
 import datetime
+import decimal
 import re
 from types import MappingProxyType
 
@@ -140,6 +141,75 @@ class CyDateProcessorTest(_DateProcessorTest):
         cls.module = _processors_cy
 
 
+class _BatchProcessorTest(fixtures.TestBase):
+    @combinations(
+        ("int_to_boolean", [1, None, 0, -4]),
+        ("to_str", [5, None, "x"]),
+        ("to_float", [5, None, "2.5"]),
+        ("str_to_datetime", ["2022-04-03 17:12:34.353", None]),
+        ("str_to_time", ["17:12:34", None]),
+        ("str_to_date", [None, "2022-04-03"]),
+    )
+    def test_batch_matches_scalar(self, name, values):
+        scalar = getattr(self.module, name)
+        batch = getattr(self.module, name + "_batch")
+
+        eq_(batch(values), [scalar(value) for value in values])
+        eq_(batch(tuple(values)), [scalar(value) for value in values])
+        eq_(batch(()), [])
+
+    def test_decimal_batch(self):
+        proc = self.module.to_decimal_processor_factory(decimal.Decimal, 2)
+        values = [1.5, None, 3]
+        eq_(proc.process_batch(values), [proc(value) for value in values])
+
+    @combinations("str_to_datetime", "str_to_time", "str_to_date")
+    def test_invalid_string(self, meth):
+        with expect_raises_message(
+            ValueError, "Invalid isoformat string: '5:a'"
+        ):
+            fn = getattr(self.module, meth + "_batch")
+            fn([None, "5:a"])
+
+
+class PyBatchProcessorTest(_BatchProcessorTest):
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _processors_cy
+        from sqlalchemy.util.langhelpers import load_uncompiled_module
+
+        py_mod = load_uncompiled_module(_processors_cy)
+
+        cls.module = py_mod
+
+
+class CyBatchProcessorTest(_BatchProcessorTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _processors_cy
+
+        assert _processors_cy._is_compiled()
+        cls.module = _processors_cy
+
+
+class ToBatchProcessorTest(fixtures.TestBase):
+    def test_known_processor(self):
+        eq_(
+            processors.to_batch_processor(processors.to_float),
+            processors.to_float_batch,
+        )
+
+    def test_decimal_processor(self):
+        proc = processors.to_decimal_processor_factory(decimal.Decimal, 2)
+        eq_(processors.to_batch_processor(proc)([1, None]), [proc(1), None])
+
+    def test_arbitrary_processor(self):
+        batch = processors.to_batch_processor(lambda value: value * 2)
+        eq_(batch((1, 2, 3)), [2, 4, 6])
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_20_none(self):
         eq_(self.module._distill_params_20(None), ())
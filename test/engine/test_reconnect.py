@@ -2,6 +2,7 @@ import itertools
 import time
 from unittest.mock import call
 from unittest.mock import Mock
+from unittest.mock import patch
 
 import sqlalchemy as tsa
 from sqlalchemy import create_engine
@@ -221,6 +222,67 @@ class PrePingMockTest(fixtures.TestBase):
 
         conn.close()
 
+    def test_ping_skipped_within_interval(self):
+        with patch("sqlalchemy.pool.base.time.time") as mock_time:
+            mock_time.return_value = 10000
+            pool = self._pool_fixture(
+                pre_ping=True,
+                pool_kw=dict(
+                    pool_size=1, max_overflow=0, pre_ping_interval=10
+                ),
+            )
+
+            conn = pool.connect()
+            dbapi_conn = conn.dbapi_connection
+            conn.close()
+
+            mock_time.return_value = 10005
+            conn = pool.connect()
+            is_(conn.dbapi_connection, dbapi_conn)
+
+            # returned recently, so no ping
+            eq_(dbapi_conn.mock_calls, [call.rollback()])
+            conn.close()
+
+            mock_time.return_value = 10020
+            conn = pool.connect()
+            is_(conn.dbapi_connection, dbapi_conn)
+
+            # idle past the interval, ping
+            eq_(
+                dbapi_conn.mock_calls,
+                [call.rollback(), call.rollback(), call.cursor()],
+            )
+            conn.close()
+
+    def test_ping_after_disconnect_within_interval(self):
+        with patch("sqlalchemy.pool.base.time.time") as mock_time:
+            mock_time.return_value = 10000
+            pool = self._pool_fixture(
+                pre_ping=True,
+                pool_kw=dict(
+                    pool_size=2, max_overflow=0, pre_ping_interval=10
+                ),
+            )
+
+            c1 = pool.connect()
+            c2 = pool.connect()
+            dbapi_conn = c1.dbapi_connection
+            c1.close()
+
+            # a disconnect is detected on another connection
+            mock_time.return_value = 10001
+            c2.invalidate(MockDisconnect("lost connection"))
+            c2.close()
+
+            mock_time.return_value = 10002
+            c1 = pool.connect()
+            is_(c1.dbapi_connection, dbapi_conn)
+
+            # returned before the disconnect, ping
+            eq_(dbapi_conn.mock_calls, [call.rollback(), call.cursor()])
+            c1.close()
+
     def test_ping_not_on_reconnect(self):
         pool = self._pool_fixture(
             pre_ping=True, pool_kw=dict(pool_size=1, max_overflow=0)
@@ -10,6 +10,7 @@ from sqlalchemy import Date
 from sqlalchemy import ForeignKey
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import func
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import orm
 from sqlalchemy import select
@@ -32,12 +33,15 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_none
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.entities import ComparableEntity
 from sqlalchemy.testing.fixtures import fixture_session
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
+from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.types import TypeDecorator
 from test.orm import _fixtures
 
@@ -1321,6 +1325,206 @@ class M2OGetTest(_fixtures.FixtureTest):
             testing.is_none(section.parent)
 
 
+class BatchLazyLoadTest(_fixtures.FixtureTest):
+    """test Session.batch_lazyload"""
+
+    run_inserts = "once"
+    run_deletes = None
+    run_setup_mappers = "once"
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_o2m(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session(batch_lazyload=True)
+        u7 = sess.get(User, 7)
+        u8, u9 = sess.scalars(
+            select(User).where(User.id.in_([8, 9])).order_by(User.id)
+        ).all()
+
+        def go():
+            eq_(u7.addresses, [Address(id=1)])
+            eq_(u8.addresses, [Address(id=2), Address(id=3), Address(id=4)])
+            eq_(u9.addresses, [Address(id=5)])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id, addresses.id, "
+                "addresses.email_address FROM addresses "
+                "WHERE addresses.user_id IN (__[POSTCOMPILE_primary_keys]) "
+                "ORDER BY addresses.id",
+                [{"primary_keys": [7, 8, 9]}],
+            ),
+        )
+
+    def test_o2m_skips_collected(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session(batch_lazyload=True)
+        u7, u8, u9 = sess.scalars(
+            select(User).where(User.id.in_([7, 8, 9])).order_by(User.id)
+        ).all()
+        sess.identity_map._states_for_mapper(inspect(User))
+
+        # the state of u8 remains in the identity map after u8 is
+        # collected, as though its weakref callback hadn't yet run
+        u8_state = inspect(u8)
+        with mock.patch.object(sess.identity_map, "_fast_discard"):
+            del u8
+            gc_collect()
+        is_none(u8_state.obj())
+
+        def go():
+            eq_(u7.addresses, [Address(id=1)])
+            eq_(u9.addresses, [Address(id=5)])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id, addresses.id, "
+                "addresses.email_address FROM addresses "
+                "WHERE addresses.user_id IN (__[POSTCOMPILE_primary_keys]) "
+                "ORDER BY addresses.id",
+                [{"primary_keys": [7, 9]}],
+            ),
+        )
+
+    def test_m2o(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session(batch_lazyload=True)
+        a1 = sess.get(Address, 1)
+        a2, a5 = sess.scalars(
+            select(Address).where(Address.id.in_([2, 5])).order_by(Address.id)
+        ).all()
+
+        def go():
+            eq_(a1.user, User(id=7))
+            eq_(a2.user, User(id=8))
+            eq_(a5.user, User(id=9))
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT users.id, users.name FROM users "
+                "WHERE users.id IN (__[POSTCOMPILE_primary_keys])",
+                [{"primary_keys": [7, 8, 9]}],
+            ),
+        )
+
+    def test_chunksize_dialect_limit(self):
+        """the number of keys per SELECT is limited by the dialect's
+        maximum number of bound parameters"""
+
+        User = self.classes.User
+
+        sess = fixture_session(batch_lazyload=True)
+        users = sess.scalars(
+            select(User).where(User.id.in_([7, 8, 9])).order_by(User.id)
+        ).all()
+
+        def go():
+            with (
+                mock.patch.object(
+                    testing.db.dialect, "insertmanyvalues_max_parameters", 2
+                ),
+                mock.patch.object(
+                    testing.db.dialect, "supports_in_array_parameter", False
+                ),
+            ):
+                eq_([len(u.addresses) for u in users], [1, 3, 1])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            *[
+                CompiledSQL(
+                    "SELECT addresses.user_id, addresses.id, "
+                    "addresses.email_address FROM addresses "
+                    "WHERE addresses.user_id IN "
+                    "(__[POSTCOMPILE_primary_keys]) "
+                    "ORDER BY addresses.id",
+                    [{"primary_keys": primary_keys}],
+                )
+                for primary_keys in ([7, 8], [9])
+            ],
+        )
+
+    def test_not_batched_by_default(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        users = sess.scalars(select(User).order_by(User.id)).all()
+
+        def go():
+            for u in users:
+                u.addresses
+
+        self.assert_sql_count(testing.db, go, 4)
+
+    def test_different_options_not_included(self):
+        User = self.classes.User
+
+        sess = fixture_session(batch_lazyload=True)
+        u7, u8 = sess.scalars(
+            select(User).where(User.id.in_([7, 8])).order_by(User.id)
+        ).all()
+        u9, u10 = sess.scalars(
+            select(User)
+            .where(User.id.in_([9, 10]))
+            .options(orm.defer(User.name))
+            .order_by(User.id)
+        ).all()
+
+        def go():
+            u8.addresses
+            u7.addresses
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id, addresses.id, "
+                "addresses.email_address FROM addresses "
+                "WHERE addresses.user_id IN (__[POSTCOMPILE_primary_keys]) "
+                "ORDER BY addresses.id",
+                [{"primary_keys": [7, 8]}],
+            ),
+        )
+
+        def go():
+            eq_(len(u9.addresses), 1)
+            eq_(len(u10.addresses), 0)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_lazyload_criteria_not_batched(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session(batch_lazyload=True)
+        u8, u9 = sess.scalars(
+            select(User)
+            .where(User.id.in_([8, 9]))
+            .options(
+                orm.lazyload(User.addresses.and_(Address.email_address != "x"))
+            )
+            .order_by(User.id)
+        ).all()
+
+        def go():
+            u8.addresses
+            u9.addresses
+
+        self.assert_sql_count(testing.db, go, 2)
+
+
 class CorrelatedTest(fixtures.MappedTest):
     @classmethod
     def define_tables(self, meta):
@@ -50,11 +50,13 @@ from sqlalchemy.orm import column_property
 from sqlalchemy.orm import contains_eager
 from sqlalchemy.orm import defer
 from sqlalchemy.orm import deferred
+from sqlalchemy.orm import exc as orm_exc
 from sqlalchemy.orm import join
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
 from sqlalchemy.orm import Query
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import synonym
@@ -68,6 +70,7 @@ from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
@@ -5881,6 +5884,150 @@ class YieldIterationTest(_fixtures.FixtureTest):
         eq_(len(rows), num_rows)
 
 
+class ReadonlyEntitiesTest(fixtures.RemovesEvents, QueryTest):
+    def test_basic(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        users = sess.scalars(
+            select(User).order_by(User.id),
+            execution_options={"readonly_entities": True},
+        ).all()
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        eq_(len(sess.identity_map), 0)
+
+        for user in users:
+            insp = inspect(user)
+            is_true(insp.detached)
+            is_false(insp.modified)
+            eq_(insp.key, (User, (user.id,), None))
+            eq_(insp.attrs.name.history, ((), [user.name], ()))
+
+    def test_identity_map_not_consulted(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        u7 = sess.get(User, 7)
+        u7.name = "new name"
+
+        readonly_u7 = sess.scalars(
+            select(User)
+            .filter_by(id=7)
+            .execution_options(readonly_entities=True, autoflush=False)
+        ).one()
+
+        is_not(readonly_u7, u7)
+        eq_(readonly_u7.name, "jack")
+        eq_(u7.name, "new name")
+        eq_(len(sess.identity_map), 1)
+
+    @testing.combinations(
+        joinedload, selectinload, subqueryload, argnames="loader"
+    )
+    def test_eager_load(self, loader):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session()
+
+        def go():
+            users = (
+                sess.scalars(
+                    select(User)
+                    .options(loader(User.addresses))
+                    .order_by(User.id)
+                    .execution_options(readonly_entities=True)
+                )
+                .unique()
+                .all()
+            )
+            eq_(
+                [(u.id, [a.id for a in u.addresses]) for u in users],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+            return users
+
+        users = self.assert_sql_count(
+            testing.db, go, 1 if loader is joinedload else 2
+        )
+
+        eq_(len(sess.identity_map), 0)
+        for user in users:
+            for address in user.addresses:
+                is_true(inspect(address).detached)
+
+    def test_joined_eager_shares_identity_within_result(self):
+        User, Address = self.classes("User", "Address")
+
+        sess = fixture_session()
+        addresses = sess.scalars(
+            select(Address)
+            .options(joinedload(Address.user))
+            .order_by(Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+        is_(addresses[1].user, addresses[2].user)
+        eq_(len(sess.identity_map), 0)
+
+    def test_unloaded_attributes_raise(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        user = sess.scalars(
+            select(User)
+            .options(defer(User.name))
+            .filter_by(id=7)
+            .execution_options(readonly_entities=True)
+        ).one()
+
+        with expect_raises(orm_exc.DetachedInstanceError):
+            user.name
+        with expect_raises(orm_exc.DetachedInstanceError):
+            user.addresses
+
+    def test_merge_into_session(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        user = sess.scalars(
+            select(User)
+            .filter_by(id=7)
+            .execution_options(readonly_entities=True)
+        ).one()
+
+        merged = sess.merge(user, load=False)
+        is_(sess.get(User, 7), merged)
+        eq_(merged.name, "jack")
+
+    def test_load_event(self):
+        User = self.classes.User
+
+        canary = mock.Mock()
+        self.event_listen(User, "load", canary)
+        sess = fixture_session()
+        sess.scalars(
+            select(User), execution_options={"readonly_entities": True}
+        ).all()
+        eq_(canary.call_count, 4)
+
+    def test_yield_per(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        result = sess.scalars(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_entities=True, yield_per=1)
+        )
+        eq_([u.id for u in result], [7, 8, 9, 10])
+        eq_(len(sess.identity_map), 0)
+
+
 class HintsTest(QueryTest, AssertsCompiledSQL):
     __dialect__ = "default"
 
@@ -2457,6 +2457,56 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
                     selectinload(A.bs, chunksize=chunksize)
                 ).order_by(A.id)
 
+    @testing.combinations(
+        (None, False, (1, 48, 95, 101)),
+        (99, False, (1, 48, 95, 101)),
+        (None, True, (1, 101)),
+        (99, True, (1, 100, 101)),
+        argnames="chunksize, array_parameter, expected_range",
+    )
+    def test_chunksize_dialect_limit(
+        self, chunksize, array_parameter, expected_range
+    ):
+        """the chunk size is limited by the dialect's maximum number of
+        bound parameters, unless keys are sent as a single array parameter
+
+        """
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            with (
+                mock.patch.object(
+                    testing.db.dialect, "insertmanyvalues_max_parameters", 47
+                ),
+                mock.patch.object(
+                    testing.db.dialect,
+                    "supports_in_array_parameter",
+                    array_parameter,
+                ),
+            ):
+                session.scalars(
+                    select(A)
+                    .options(selectinload(A.bs, chunksize=chunksize))
+                    .order_by(A.id)
+                ).all()
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id FROM a ORDER BY a.id", {}),
+            *[
+                CompiledSQL(
+                    "SELECT b.a_id, b.id "
+                    "FROM b WHERE b.a_id IN "
+                    "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                    {"primary_keys": list(range(a, b))},
+                )
+                for a, b in zip(expected_range, expected_range[1:])
+            ],
+        )
+
     @testing.requires.independent_cursors
     def test_yield_per(self):
         # the docs make a lot of guarantees about yield_per
@@ -2339,6 +2339,100 @@ class WeakIdentityMapTest(_fixtures.FixtureTest):
         u2_state._cleanup(ref)
         assert not sess.identity_map.contains_state(u2._sa_instance_state)
 
+    def test_states_for_mapper(self):
+        users, User = self.tables.users, self.classes.User
+        addresses, Address = self.tables.addresses, self.classes.Address
+
+        self.mapper_registry.map_imperatively(User, users)
+        self.mapper_registry.map_imperatively(Address, addresses)
+        gc_collect()
+
+        sess = fixture_session()
+        u1, u2, u3 = User(name="u1"), User(name="u2"), User(name="u3")
+        a1 = Address(email_address="a1")
+        sess.add_all([u1, u2, u3, a1])
+        sess.flush()
+
+        imap = sess.identity_map
+        eq_(
+            set(imap._states_for_mapper(inspect(User))),
+            {attributes.instance_state(u) for u in (u1, u2, u3)},
+        )
+        eq_(
+            imap._states_for_mapper(inspect(Address)),
+            [attributes.instance_state(a1)],
+        )
+
+        sess.expunge(u1)
+        del u2
+        gc_collect()
+
+        eq_(
+            imap._states_for_mapper(inspect(User)),
+            [attributes.instance_state(u3)],
+        )
+
+        sess.expunge_all()
+        eq_(sess.identity_map._states_for_mapper(inspect(User)), [])
+
+    def test_states_for_mapper_built_on_first_use(self):
+        users, User = self.tables.users, self.classes.User
+        addresses, Address = self.tables.addresses, self.classes.Address
+
+        self.mapper_registry.map_imperatively(User, users)
+        self.mapper_registry.map_imperatively(Address, addresses)
+        gc_collect()
+
+        sess = fixture_session()
+        u1, u2 = User(name="u1"), User(name="u2")
+        sess.add_all([u1, u2])
+        sess.flush()
+
+        imap = sess.identity_map
+        is_(imap._by_class, None)
+
+        sess.expunge(u1)
+        is_(imap._by_class, None)
+
+        eq_(
+            imap._states_for_mapper(inspect(User)),
+            [attributes.instance_state(u2)],
+        )
+        is_not(imap._by_class, None)
+
+        # maintained once built
+        a1 = Address(email_address="a1")
+        sess.add(a1)
+        sess.flush()
+        eq_(
+            imap._states_for_mapper(inspect(Address)),
+            [attributes.instance_state(a1)],
+        )
+
+    def test_states_for_mapper_no_empty_entries(self):
+        users, User = self.tables.users, self.classes.User
+        addresses, Address = self.tables.addresses, self.classes.Address
+
+        self.mapper_registry.map_imperatively(User, users)
+        self.mapper_registry.map_imperatively(Address, addresses)
+        gc_collect()
+
+        sess = fixture_session()
+        u1, u2 = User(name="u1"), User(name="u2")
+        sess.add_all([u1, u2])
+        sess.flush()
+
+        imap = sess.identity_map
+        eq_(imap._states_for_mapper(inspect(Address)), [])
+        eq_(list(imap._by_class), [User])
+
+        sess.expunge(u1)
+        del u2
+        gc_collect()
+
+        eq_(imap._states_for_mapper(inspect(User)), [])
+        eq_(dict(imap._by_class), {})
+
 
 class IsModifiedTest(_fixtures.FixtureTest):
     run_inserts = None
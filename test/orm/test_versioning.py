@@ -1,5 +1,6 @@
 import contextlib
 import datetime
+from unittest import mock
 from unittest.mock import patch
 import uuid
 
@@ -272,6 +273,59 @@ class VersioningTest(fixtures.MappedTest):
             [(f1.id, "f1rev2", 2), (f2.id, "f2rev2", 2)],
         )
 
+    @testing.requires.sane_rowcount
+    def test_pipeline_flush(self):
+        """test that rowcount checks are deferred to the end of the flush
+        with pipeline_flush, and still raise StaleDataError."""
+
+        Foo, version_table = self.classes.Foo, self.tables.version_table
+
+        self.mapper_registry.map_imperatively(
+            Foo, version_table, version_id_col=version_table.c.version_id
+        )
+        s1 = fixture_session(pipeline_flush=True)
+        f1 = Foo(value="f1")
+        f2 = Foo(value="f2")
+        s1.add_all((f1, f2))
+        s1.commit()
+
+        s2 = fixture_session()
+        s2.get(Foo, f1.id).value = "f1rev2"
+        s2.commit()
+
+        # load current state ahead of time, so that the flush emits
+        # only the UPDATE statements
+        eq_((f1.value, f2.value), ("f1", "f2"))
+
+        dialect = testing.db.dialect
+        with (
+            patch.object(dialect, "supports_pipeline", True),
+            patch.object(
+                dialect,
+                "do_pipeline",
+                lambda dbapi_conn: contextlib.nullcontext(mock.Mock()),
+            ),
+            patch.object(dialect, "do_pipeline_sync") as do_pipeline_sync,
+        ):
+            f1.value = "f1rev2mine"
+            f2.value = "f2rev2"
+            assert_raises_message(
+                sa.orm.exc.StaleDataError,
+                r"UPDATE statement on table 'version_table' expected "
+                r"to update 2 row\(s\); 1 were matched.",
+                s1.commit,
+            )
+            eq_(do_pipeline_sync.call_count, 1)
+            s1.rollback()
+
+            f2.value = "f2rev2"
+            s1.commit()
+
+        eq_(
+            s2.query(Foo.id, Foo.value, Foo.version_id).order_by(Foo.id).all(),
+            [(f1.id, "f1rev2", 2), (f2.id, "f2rev2", 2)],
+        )
+
     def test_bulk_insert(self):
         Foo = self.classes.Foo
 
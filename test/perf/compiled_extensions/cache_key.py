@@ -69,7 +69,11 @@ class CacheKey(Case):
         pg = PGDialect()
         pg.server_version_info = (16, 0, 0)
         for name, stmt, num in (
-            ("_has_table_query", pg._has_table_query("scott"), 30_000),
+            (
+                "_has_multi_table_query",
+                pg._has_multi_table_query("scott"),
+                30_000,
+            ),
             (
                 "_columns_query",
                 pg._columns_query(
@@ -85,7 +89,7 @@ class CacheKey(Case):
                 30_000,
             ),
             ("_index_query", pg._index_query, 7_000),
-            ("_constraint_query", pg._constraint_query(True), 10_000),
+            ("_constraint_query", pg._constraint_query, 10_000),
             (
                 "_foreing_key_query",
                 pg._foreing_key_query(
@@ -32,6 +32,12 @@ class Processors(Case):
 
     def init_objects(self):
         self.to_dec = self.impl.to_decimal_processor_factory(Decimal, 3)
+        self.int_column = [None, 10, 1, -10, 0] * 20
+        self.datetime_column = [
+            None,
+            "2020-01-01 20:10:34",
+            "2030-11-21 01:04:34.123456",
+        ] * 20
 
     @classmethod
     def update_results(cls, results):
@@ -91,6 +97,24 @@ class Processors(Case):
         self.to_dec(99)
         self.to_dec(1 / 3)
 
+    @test_case
+    def int_to_boolean_batch(self):
+        self.impl.int_to_boolean_batch(self.int_column)
+
+    @test_case
+    def int_to_boolean_per_value(self):
+        fn = self.impl.int_to_boolean
+        [fn(value) for value in self.int_column]
+
+    @test_case
+    def str_to_datetime_batch(self):
+        self.impl.str_to_datetime_batch(self.datetime_column)
+
+    @test_case
+    def str_to_datetime_per_value(self):
+        fn = self.impl.str_to_datetime
+        [fn(value) for value in self.datetime_column]
+
     @test_case
     def to_decimal_pf_make(self):
         self.impl.to_decimal_processor_factory(Decimal, 3)
@@ -252,6 +276,50 @@ class AnonMap(Case):
         id(self.object_1) in self.impl_w_present
 
 
+class GenCacheKey(Case):
+    NUMBER = 1_000_000
+
+    @staticmethod
+    def python():
+        from sqlalchemy.sql import _util_cy
+
+        py_util = load_uncompiled_module(_util_cy)
+        assert not py_util._is_compiled()
+        return py_util
+
+    @staticmethod
+    def cython():
+        from sqlalchemy.sql import _util_cy
+
+        assert _util_cy._is_compiled()
+        return _util_cy
+
+    IMPLEMENTATIONS = {"python": python.__func__, "cython": cython.__func__}
+
+    def init_objects(self):
+        self.object_1 = column("x")
+        self.object_2 = bindparam("y")
+
+        self.map_w_present = mwp = self.impl.anon_map()
+        self.impl.gen_cache_key(self.object_1, mwp, [])
+
+    @classmethod
+    def update_results(cls, results):
+        cls._divide_results(results, "cython", "python", "cy / py")
+
+    @test_case
+    def test_column(self):
+        self.impl.gen_cache_key(self.object_1, self.impl.anon_map(), [])
+
+    @test_case
+    def test_bindparam(self):
+        self.impl.gen_cache_key(self.object_2, self.impl.anon_map(), [])
+
+    @test_case
+    def test_present(self):
+        self.impl.gen_cache_key(self.object_1, self.map_w_present, [])
+
+
 class PrefixAnonMap(Case):
     @staticmethod
     def python():
@@ -1417,6 +1417,26 @@ class CacheKeyTest(fixtures.CacheKeyFixture, CoreFixtures, fixtures.TestBase):
         l1 = _literal_bindparam(None, value="x1")
         is_(l1._generate_cache_key(), None)
 
+    def test_no_cache_element_nested(self):
+        """a non-cacheable element nested in a cacheable one disables
+        caching for the whole structure"""
+
+        class NotCacheable(ColumnElement):
+            inherit_cache = False
+
+        nc = NotCacheable()
+        is_(nc._generate_cache_key(), None)
+        is_(
+            select(column("q")).where(column("q") == nc)._generate_cache_key(),
+            None,
+        )
+
+        # also as a second, already generated dispatcher
+        is_(
+            select(column("q")).where(nc == 5)._generate_cache_key(),
+            None,
+        )
+
     def test_bindparam_subclass_ok_cache(self):
         # implements inherit_cache
         class _literal_bindparam(BindParameter):
@@ -1199,6 +1199,93 @@ class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
             + (1 if totalnum % assert_batchsize else 0),
         )
 
+    def test_max_bytes_adjustment(self, connection):
+        t = self.tables.data
+
+        data = [{"x": "x" * 40, "y": "y%d" % i} for i in range(100)]
+
+        batch_sizes = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                batch_sizes.append(len(parameters) // 2)
+
+        with mock.patch.object(
+            connection.dialect, "insertmanyvalues_max_bytes", 2000
+        ):
+            connection.execute(t.insert().returning(t.c.id), data)
+
+        eq_(sum(batch_sizes), 100)
+        assert len(batch_sizes) > 2
+        assert max(batch_sizes) < 2000 // 40
+
+        eq_(connection.scalar(select(func.count()).select_from(t)), 100)
+
+    def test_max_bytes_many_rows(self, connection):
+        t = self.tables.data
+
+        data = [{"x": "x" * 40, "y": "y%d" % i} for i in range(10000)]
+
+        batch_sizes = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                batch_sizes.append(len(parameters) // 2)
+
+        with mock.patch.object(
+            connection.dialect, "insertmanyvalues_max_bytes", 2000
+        ):
+            result = connection.execute(t.insert().returning(t.c.y), data)
+            eq_(
+                sorted(result.scalars().all()),
+                sorted(row["y"] for row in data),
+            )
+
+        eq_(sum(batch_sizes), 10000)
+        assert len(batch_sizes) > 10000 // (2000 // 40)
+        assert max(batch_sizes) < 2000 // 40
+
+        eq_(connection.scalar(select(func.count()).select_from(t)), 10000)
+
+    @testing.combinations(
+        ("grow", 10, 0.04, 300, [10, 20, 40, 80, 150]),
+        ("shrink", 80, 0.0025, 155, [80, 40, 20, 10, 5]),
+        argnames="page_size, target_latency, totalnum, expected",
+        id_="iaaaa",
+    )
+    def test_target_latency_adjustment(
+        self, connection, page_size, target_latency, totalnum, expected
+    ):
+        t = self.tables.data
+
+        data = [{"x": "x%d" % i, "y": "y%d" % i} for i in range(totalnum)]
+
+        batch_sizes = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def go(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                batch_sizes.append(len(parameters) // 2)
+
+        # each batch appears to take 10 ms
+        clock = itertools.count(step=0.01)
+
+        with mock.patch(
+            "sqlalchemy.sql.compiler.perf_counter", lambda: next(clock)
+        ):
+            connection.execute(
+                t.insert().returning(t.c.id),
+                data,
+                execution_options={
+                    "insertmanyvalues_page_size": page_size,
+                    "insertmanyvalues_target_latency": target_latency,
+                },
+            )
+
+        eq_(batch_sizes, expected)
+
     def test_disabled(self, testing_engine):
         e = testing_engine(
             options={"use_insertmanyvalues": False, "sqlite_share_pool": True},
@@ -1218,6 +1305,105 @@ class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
                 conn.execute(stmt.returning(t.c.id), data)
 
 
+class BulkLoadTest(fixtures.TablesTest):
+    __sparse_driver_backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x data", String(50), key="x"),
+            Column("y", String(50), default="ydefault"),
+            Column("z", Integer, server_default="5"),
+        )
+
+    def test_bulk_load(self, connection):
+        t = self.tables.data
+
+        result = connection.bulk_load(
+            t, [{"id": i, "x": "x%d" % i} for i in range(1, 51)]
+        )
+        is_(
+            result.context._is_bulk_load,
+            connection.dialect.supports_bulk_load,
+        )
+
+        eq_(
+            connection.execute(
+                select(t.c.id, t.c.x, t.c.y, t.c.z).order_by(t.c.id)
+            ).all(),
+            [(i, "x%d" % i, "ydefault", 5) for i in range(1, 51)],
+        )
+
+    @testing.fixture
+    def bulk_load_dialect(self, connection):
+        canary = mock.Mock()
+
+        def do_bulk_load(cursor, statement, parameters, context):
+            bulk_load = context.compiled._bulk_load
+            canary(
+                bulk_load.column_names,
+                list(context._bulk_load_rows(parameters)),
+            )
+
+        with (
+            mock.patch.object(connection.dialect, "supports_bulk_load", True),
+            mock.patch.object(
+                connection.dialect, "do_bulk_load", do_bulk_load
+            ),
+        ):
+            yield canary
+
+    def test_do_bulk_load(self, connection, bulk_load_dialect):
+        t = self.tables.data
+
+        connection.execute(
+            t.insert(),
+            [{"id": 1, "x": "x1"}, {"id": 2, "x": "x2"}],
+            execution_options={"bulk_load": True},
+        )
+        eq_(
+            bulk_load_dialect.mock_calls,
+            [
+                mock.call(
+                    ["id", "x data", "y"],
+                    [(1, "x1", "ydefault"), (2, "x2", "ydefault")],
+                )
+            ],
+        )
+
+    @testing.combinations(
+        ("no_option",),
+        ("single_row",),
+        ("sql_expression",),
+        ("returning", testing.requires.insert_executemany_returning),
+        argnames="case",
+    )
+    def test_not_bulk_loaded(self, connection, bulk_load_dialect, case):
+        t = self.tables.data
+
+        stmt = t.insert()
+        params = [{"id": 1, "x": "x1"}, {"id": 2, "x": "x2"}]
+        opts = {"bulk_load": True}
+        if case == "no_option":
+            opts = {}
+        elif case == "single_row":
+            params = params[0:1]
+        elif case == "sql_expression":
+            stmt = stmt.values(y=func.lower("Y"))
+        elif case == "returning":
+            stmt = stmt.returning(t.c.id)
+
+        connection.execute(stmt, params, execution_options=opts)
+        eq_(bulk_load_dialect.mock_calls, [])
+        eq_(
+            connection.execute(select(t.c.id).order_by(t.c.id)).all(),
+            [(p["id"],) for p in params],
+        )
+
+
 class IMVSentinelTest(fixtures.TestBase):
     __sparse_driver_backend__ = True
 
@@ -7,12 +7,14 @@ from typing import Optional
 
 from sqlalchemy import exc
 from sqlalchemy import testing
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.future import select as future_select
 from sqlalchemy.schema import Column
 from sqlalchemy.schema import ForeignKey
 from sqlalchemy.schema import Table
 from sqlalchemy.sql import and_
 from sqlalchemy.sql import bindparam
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import coercions
 from sqlalchemy.sql import column
 from sqlalchemy.sql import func
@@ -23,6 +25,7 @@ from sqlalchemy.sql import literal
 from sqlalchemy.sql import null
 from sqlalchemy.sql import roles
 from sqlalchemy.sql import select
+from sqlalchemy.sql import statement_template
 from sqlalchemy.sql import table
 from sqlalchemy.sql import util as sql_util
 from sqlalchemy.sql.base import ExecutableOption
@@ -34,6 +37,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.assertions import expect_raises_message
+from sqlalchemy.testing.assertions import expect_warnings
 from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.types import ARRAY
 from sqlalchemy.types import Boolean
@@ -2156,6 +2160,273 @@ class DeferredLambdaElementTest(
         eq_(e32key[0], e3key[0])
 
 
+class StatementTemplateTest(
+    fixtures.TablesTest, testing.AssertsExecutionResults, AssertsCompiledSQL
+):
+    __dialect__ = "default"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        users = cls.tables.users
+        connection.execute(
+            users.insert(),
+            [{"id": 7, "name": "jack"}, {"id": 8, "name": "ed"}],
+        )
+
+    def test_fn_invoked_once(self):
+        users = self.tables.users
+        canary = []
+
+        @statement_template
+        def go():
+            canary.append(True)
+            return select(users).where(users.c.name == bindparam("name"))
+
+        s1 = go(name="jack")
+        s2 = go(name="ed")
+        eq_(len(canary), 1)
+
+        self.assert_compile(
+            s1,
+            "SELECT users.id, users.name FROM users "
+            "WHERE users.name = :name",
+            checkparams={"name": "jack"},
+        )
+        self.assert_compile(
+            s2,
+            "SELECT users.id, users.name FROM users "
+            "WHERE users.name = :name",
+            checkparams={"name": "ed"},
+        )
+
+    def test_no_params_returns_statement(self):
+        users = self.tables.users
+
+        @statement_template
+        def go():
+            return select(users)
+
+        is_(go(), go.statement)
+
+    def test_cache_key_not_regenerated(self):
+        users = self.tables.users
+
+        @statement_template
+        def go():
+            return select(users).where(users.c.name == bindparam("name"))
+
+        k1 = go(name="jack")._generate_cache_key()
+        k2 = go(name="ed")._generate_cache_key()
+
+        is_(k1.key, k2.key)
+        is_(k1.bindparams, k2.bindparams)
+        eq_(k1.params, {"name": "jack"})
+        eq_(k2.params, {"name": "ed"})
+
+        # the assigned cache key matches one generated the usual way
+        eq_(
+            k2,
+            go.statement.params(name="ed")._generate_cache_key(),
+        )
+
+    def test_further_generation_regenerates_key(self):
+        users = self.tables.users
+
+        @statement_template
+        def go():
+            return select(users).where(users.c.name == bindparam("name"))
+
+        stmt = go(name="jack").where(users.c.id == bindparam("id"))
+        k1 = stmt._generate_cache_key()
+        ne_(k1.key, go.statement._generate_cache_key().key)
+        eq_(len(k1.bindparams), 2)
+
+    def test_execute(self, connection):
+        users = self.tables.users
+
+        @statement_template
+        def go():
+            return (
+                select(users.c.id)
+                .where(users.c.name == bindparam("name"))
+                .order_by(users.c.id)
+            )
+
+        with self.sql_execution_asserter(connection) as asserter:
+            eq_(connection.scalars(go(name="jack")).all(), [7])
+            eq_(connection.scalars(go(name="ed")).all(), [8])
+            eq_(connection.scalars(go(name="wendy")).all(), [])
+
+        asserter.assert_(
+            CompiledSQL(
+                "SELECT users.id FROM users WHERE users.name = :name "
+                "ORDER BY users.id",
+                [{"name": "jack"}],
+            ),
+            CompiledSQL(
+                "SELECT users.id FROM users WHERE users.name = :name "
+                "ORDER BY users.id",
+                [{"name": "ed"}],
+            ),
+            CompiledSQL(
+                "SELECT users.id FROM users WHERE users.name = :name "
+                "ORDER BY users.id",
+                [{"name": "wendy"}],
+            ),
+        )
+
+    def test_compile_dml(self):
+        users = self.tables.users
+
+        @statement_template
+        def ins():
+            return users.insert().values(name=bindparam("nm"))
+
+        @statement_template
+        def upd():
+            return (
+                users.update()
+                .where(users.c.id == bindparam("uid"))
+                .values(name=bindparam("newname"))
+            )
+
+        @statement_template
+        def dele():
+            return users.delete().where(users.c.id == bindparam("uid"))
+
+        eq_(ins(nm="z").compile().params, {"nm": "z"})
+
+        self.assert_compile(
+            ins(nm="z"),
+            "INSERT INTO users (name) VALUES (:nm)",
+            checkparams={"nm": "z"},
+        )
+        self.assert_compile(
+            upd(uid=7, newname="jack2"),
+            "UPDATE users SET name=:newname WHERE users.id = :uid",
+            checkparams={"uid": 7, "newname": "jack2"},
+        )
+        self.assert_compile(
+            dele(uid=8),
+            "DELETE FROM users WHERE users.id = :uid",
+            checkparams={"uid": 8},
+        )
+
+    @testing.variation("use_cache", [True, False])
+    def test_execute_dml_cache_variants(self, testing_engine, use_cache):
+        users = self.tables.users
+
+        eng = testing_engine(
+            options={
+                "query_cache_size": 500 if use_cache else 0,
+                "sqlite_share_pool": True,
+            }
+        )
+
+        @statement_template
+        def ins():
+            return users.insert().values(
+                id=bindparam("uid"), name=bindparam("nm")
+            )
+
+        @statement_template
+        def upd():
+            return (
+                users.update()
+                .where(users.c.id == bindparam("uid"))
+                .values(name=bindparam("newname"))
+            )
+
+        @statement_template
+        def dele():
+            return users.delete().where(users.c.id == bindparam("uid"))
+
+        with eng.begin() as conn:
+            conn.execute(ins(uid=9, nm="wendy"))
+            conn.execute(ins(uid=10, nm="z"))
+            conn.execute(upd(uid=7, newname="jack2"))
+            conn.execute(dele(uid=8))
+
+            eq_(
+                conn.execute(select(users).order_by(users.c.id)).all(),
+                [(7, "jack2"), (9, "wendy"), (10, "z")],
+            )
+            conn.rollback()
+
+    def test_execute_dml(self, connection):
+        users = self.tables.users
+
+        @statement_template
+        def upd():
+            return (
+                users.update()
+                .where(users.c.id == bindparam("uid"))
+                .values(name=bindparam("newname"))
+            )
+
+        connection.execute(upd(uid=7, newname="jack2"))
+        connection.execute(upd(uid=8, newname="ed2"))
+
+        eq_(
+            connection.execute(select(users).order_by(users.c.id)).all(),
+            [(7, "jack2"), (8, "ed2")],
+        )
+
+    def test_execute_uncacheable_dml(self, connection):
+        users = self.tables.users
+
+        class MyThing(ColumnElement):
+            # no inherit_cache, so the statement can't produce a cache key
+            type = String()
+
+            def __init__(self, value):
+                self.value = value
+
+        @compiles(MyThing)
+        def visit_my_thing(element, compiler, **kw):
+            return compiler.process(element.value, **kw)
+
+        @statement_template
+        def upd():
+            return (
+                users.update()
+                .where(users.c.id == bindparam("uid"))
+                .values(name=MyThing(bindparam("newname")))
+            )
+
+        with expect_warnings(
+            "Class MyThing will not make use of SQL compilation caching"
+        ):
+            connection.execute(upd(uid=7, newname="jack2"))
+            connection.execute(upd(uid=8, newname="ed2"))
+
+        is_(upd._cache_key, None)
+        eq_(
+            connection.execute(select(users).order_by(users.c.id)).all(),
+            [(7, "jack2"), (8, "ed2")],
+        )
+
+    def test_coerces_statement(self):
+        @statement_template
+        def go():
+            return column("q")
+
+        with expect_raises_message(
+            exc.ArgumentError, "Executable SQL or text.. construct expected"
+        ):
+            go()
+
+
 class ConcurrencyTest(fixtures.TestBase):
     """test for #8098 and #9461"""
 
@@ -1,5 +1,7 @@
 from collections import defaultdict
 import collections.abc as collections_abc
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import csv
 from io import StringIO
@@ -4031,3 +4033,308 @@ class AllTuplesTest(fixtures.TablesTest):
             row_messages,
             ["Row (1, 'p1', 'U1')", "Row (2, 'p2', None)"],
         )
+
+
+class ColumnarFetchTest(fixtures.TablesTest):
+    """test Result.partitions_columnar() and Result.columns_as_arrays()"""
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class UpperString(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        Table(
+            "columnar",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("plain", String(50)),
+            Column("upper", UpperString()),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.columnar.insert(),
+            [
+                {
+                    "id": i,
+                    "plain": "p%d" % i,
+                    "upper": "u%d" % i if i % 2 else None,
+                }
+                for i in range(1, 51)
+            ],
+        )
+
+    def test_columns_as_arrays(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(select(t).order_by(t.c.id))
+
+        ids, plain, upper = result.columns_as_arrays()
+        eq_(ids, list(range(1, 51)))
+        eq_(plain, ["p%d" % i for i in range(1, 51)])
+        eq_(upper, ["U%d" % i if i % 2 else None for i in range(1, 51)])
+
+        assert result._soft_closed
+
+    def test_array_factory(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(
+            select(t.c.id, t.c.upper).where(t.c.id < 4).order_by(t.c.id)
+        )
+        eq_(
+            result.columns_as_arrays(array_factory=tuple),
+            ((1, 2, 3), ("U1", None, "U3")),
+        )
+
+    def test_empty(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(select(t).where(t.c.id == -1))
+        eq_(result.columns_as_arrays(), ([], [], []))
+
+        result = connection.execute(select(t).where(t.c.id == -1))
+        eq_(list(result.partitions_columnar(10)), [])
+
+    def test_partitions(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(select(t).order_by(t.c.id))
+
+        partitions = list(result.partitions_columnar(20))
+        eq_([len(p[0]) for p in partitions], [20, 20, 10])
+
+        eq_(
+            [id_ for ids, _, _ in partitions for id_ in ids],
+            list(range(1, 51)),
+        )
+        eq_(partitions[1][2][0:2], ["U21", None])
+
+        assert result._soft_closed
+
+    def test_partitions_yield_per(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(select(t.c.id).order_by(t.c.id)).yield_per(
+            15
+        )
+
+        eq_(
+            [len(ids) for ids, in result.partitions_columnar()],
+            [15, 15, 15, 5],
+        )
+
+    def test_columns_filter(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(
+            select(t).where(t.c.id < 4).order_by(t.c.id)
+        )
+        eq_(
+            result.columns("upper", "id").columns_as_arrays(),
+            (["U1", None, "U3"], [1, 2, 3]),
+        )
+
+    def test_rejects_unique(self, connection):
+        t = self.tables.columnar
+        result = connection.execute(select(t))
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            r"Columnar fetching can't be combined with unique\(\)",
+        ):
+            result.unique().columns_as_arrays()
+        result.close()
+
+    def test_rejects_scalar_source(self):
+        result = IteratorResult(
+            SimpleResultMetaData(["a"]),
+            iter([(1,), (2,)]),
+            _source_supports_scalars=True,
+        )
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Columnar fetching is not supported",
+        ):
+            result.columns_as_arrays()
+
+
+class LazyRowProcessingTest(fixtures.TablesTest):
+    """test the lazy_row_processing execution option"""
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class CountingString(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                cls.processed.append(value)
+                return value.upper() if value is not None else None
+
+        Table(
+            "lazy_rows",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("a", CountingString()),
+            Column("b", CountingString()),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.lazy_rows.insert(),
+            [
+                {"id": 1, "a": "a1", "b": "b1"},
+                {"id": 2, "a": "a2", "b": None},
+            ],
+        )
+
+    def setup_test(self):
+        self.__class__.processed = []
+
+    def _rows(self, connection, stmt=None):
+        t = self.tables.lazy_rows
+        if stmt is None:
+            stmt = select(t).order_by(t.c.id)
+        return connection.execution_options(lazy_row_processing=True).execute(
+            stmt
+        )
+
+    def test_processed_on_access(self, connection):
+        rows = self._rows(connection).all()
+        eq_(self.processed, [])
+
+        eq_(rows[0].b, "B1")
+        eq_(self.processed, ["b1"])
+
+        # memoized
+        eq_(rows[0].b, "B1")
+        eq_(rows[0][2], "B1")
+        eq_(rows[0]._mapping["b"], "B1")
+        eq_(self.processed, ["b1"])
+
+        eq_(rows[1]._mapping["a"], "A2")
+        eq_(self.processed, ["b1", "a2"])
+
+    def test_whole_row_processes_all(self, connection):
+        rows = self._rows(connection).all()
+
+        eq_(rows, [(1, "A1", "B1"), (2, "A2", None)])
+        eq_(list(rows[0]), [1, "A1", "B1"])
+        eq_(rows[1][1:], ("A2", None))
+        eq_(len(self.processed), 4)
+
+    def test_mapping_shares_values(self, connection):
+        row = self._rows(connection).first()
+        mapping = row._mapping
+
+        eq_(mapping["a"], "A1")
+        eq_(row.a, "A1")
+        eq_(self.processed, ["a1"])
+        eq_(dict(mapping), {"id": 1, "a": "A1", "b": "B1"})
+
+    def test_columns_filter(self, connection):
+        row = self._rows(connection).columns("b", "id").first()
+        eq_(row.id, 1)
+        eq_(self.processed, [])
+        eq_(row, ("B1", 1))
+
+    def test_pickle(self, connection):
+        row = self._rows(connection).first()
+        eq_(row.a, "A1")
+
+        row2 = pickle.loads(pickle.dumps(row))
+        eq_(row2, (1, "A1", "B1"))
+        eq_(row2.b, "B1")
+        eq_(self.processed, ["a1", "b1"])
+
+    def test_not_lazy_by_default(self, connection):
+        t = self.tables.lazy_rows
+        connection.execute(select(t).order_by(t.c.id)).first()
+        eq_(self.processed, ["a1", "b1"])
+
+
+class ProcessingExecutorTest(fixtures.TablesTest):
+    """test the result_processing_executor execution option"""
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class UpperString(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        Table(
+            "executor_rows",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", UpperString()),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.executor_rows.insert(),
+            [{"id": i, "data": "d%d" % i} for i in range(1, 2501)],
+        )
+
+    @testing.fixture
+    def executor(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            mock_executor = Mock(wraps=executor)
+            yield mock_executor
+
+    @testing.combinations(
+        ("all",), ("columns",), ("partitions",), argnames="method"
+    )
+    def test_processed_in_order(self, connection, executor, method):
+        t = self.tables.executor_rows
+        result = connection.execution_options(
+            result_processing_executor=executor
+        ).execute(select(t).order_by(t.c.id))
+
+        expected = [(i, "D%d" % i) for i in range(1, 2501)]
+        if method == "all":
+            eq_(result.all(), expected)
+        elif method == "columns":
+            eq_(
+                result.columns("data").all(),
+                [(data,) for _, data in expected],
+            )
+        elif method == "partitions":
+            eq_(
+                [row for part in result.partitions(2000) for row in part],
+                expected,
+            )
+
+        eq_(executor.map.call_count, 1)
+
+    def test_small_chunks_not_submitted(self, connection, executor):
+        t = self.tables.executor_rows
+        result = connection.execution_options(
+            result_processing_executor=executor
+        ).execute(select(t).order_by(t.c.id))
+
+        eq_(result.fetchmany(10)[0], (1, "D1"))
+        eq_(result.partitions(500).__next__()[0], (11, "D11"))
+        eq_(executor.map.call_count, 0)
+        result.close()
+
+    def test_process_pool_rejected(self, connection):
+        t = self.tables.executor_rows
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with expect_raises_message(
+                exc.ArgumentError,
+                "result_processing_executor execution option does not "
+                "support ProcessPoolExecutor",
+            ):
+                connection.execution_options(
+                    result_processing_executor=executor
+                ).execute(select(t).order_by(t.c.id))
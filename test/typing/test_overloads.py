@@ -16,6 +16,7 @@ engine_execution_options = {
     "logging_token": "str",
     "isolation_level": "IsolationLevel",
     "insertmanyvalues_page_size": "int",
+    "insertmanyvalues_target_latency": "float",
     "schema_translate_map": "Optional[SchemaTranslateMapType]",
     "opt": "Any",
 }
@@ -26,12 +27,23 @@ core_execution_options = {
     "max_row_buffer": "int",
     "yield_per": "int",
     "preserve_rowcount": "bool",
+    "bulk_load": "bool",
     "driver_column_names": "bool",
+    "lazy_row_processing": "bool",
+    "result_processing_executor": "Executor",
+}
+
+# options which take effect when a connection is checked out, available
+# for Engine only but also present in the execution options typed dicts
+engine_only_execution_options = {
+    "checkout_priority": "int",
+    "readonly": "bool",
 }
 
 orm_dql_execution_options = {
     **core_execution_options,
     "populate_existing": "bool",
+    "readonly_entities": "bool",
     "autoflush": "bool",
 }
 
@@ -57,9 +69,15 @@ class OverloadTest(fixtures.TestBase):
     __requires__ = ("python311",)
 
     @testing.combinations(
-        (Engine, engine_execution_options),
+        (
+            Engine,
+            {**engine_execution_options, **engine_only_execution_options},
+        ),
         (Connection, core_execution_options),
-        (AsyncEngine, engine_execution_options),
+        (
+            AsyncEngine,
+            {**engine_execution_options, **engine_only_execution_options},
+        ),
         (AsyncConnection, core_execution_options),
         (Query, orm_dql_execution_options),
         (Executable, orm_execution_options),
@@ -79,11 +97,17 @@ class OverloadTest(fixtures.TestBase):
         eq_(annotations, {"opt": "Any"})
 
     @testing.combinations(
-        (CoreExecuteOptionsParameter, core_execution_options),
+        (
+            CoreExecuteOptionsParameter,
+            {**core_execution_options, **engine_only_execution_options},
+        ),
         # note: this failed on python 3.14.0b1
         # due to https://github.com/python/cpython/issues/133701.
         # something to keep in mind in case it breaks again
-        (OrmExecuteOptionsParameter, orm_execution_options),
+        (
+            OrmExecuteOptionsParameter,
+            {**orm_execution_options, **engine_only_execution_options},
+        ),
     )
     def test_typed_dicts(self, typ, expected):
         # we currently expect these to be union types with first entry